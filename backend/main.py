@@ -1,23 +1,57 @@
-from fastapi import FastAPI
+import time
+PROCESS_START = time.perf_counter()
+
+from fastapi import FastAPI, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
+from contextlib import asynccontextmanager
 import os
 import sys
+import threading
 from pydantic import BaseModel
 from typing import List, Optional
 import yaml
 import json
+import codecs
 from datetime import datetime
 import signal
 
-# Import the existing Redmine utility
 # Adjust path if necessary since we moved files
+# NOTE: packages.redmine.redmine_utility (redminelib + requests) and uvicorn
+# are imported lazily to keep backend startup fast; see get_redmine_client().
 sys.path.append(os.path.dirname(__file__))
-from packages.redmine import redmine_utility as rm
-
-app = FastAPI()
-
-
+from packages.redmine.singleflight import SingleFlight
+from packages.redmine.circuit_breaker import CircuitOpenError
+from packages.redmine.metadata import MetadataRegistry
+from packages.redmine.cache_warmer import CacheWarmer
+from packages.search.project_index import ProjectIndex
+from packages.planner.task_store import TaskStore
+from packages.planner.range_view import date_range, build_range_matrix
+from packages.planner.auto_log import AutoLogScheduler
+from packages.redmine.rate_limiter import RateLimiter
+from packages.redmine.entry_changes import upsert_entries, delete_entries, replace_entries, changes_since, SEQ_KEY
+from packages.redmine.importer import RowParser, RowValidator, TimeEntryImporter
+from packages.redmine.federation import InstanceRegistry, PRIMARY_INSTANCE, instance_slug
+from packages.search.fulltext import FullTextIndex
+from packages.redmine.text_render import render_text
+from packages.storage.shared_state import SharedState, write_atomic
+from packages.storage.text_store import TextStore, ISSUE_FIELDS, JOURNAL_FIELDS
+from packages.storage.snapshot import Snapshot, write_snapshot, snapshot_path
+from contextlib import contextmanager
+
+@asynccontextmanager
+async def lifespan(app):
+    # Must stay trivial: the server only accepts connections once this yields
+    startup_timings['ready'] = time.perf_counter() - PROCESS_START
+    print(f"Backend ready in {startup_timings['ready'] * 1000:.0f} ms", flush=True)
+    threading.Thread(target=warm_backend, daemon=True).start()
+    yield
+
+app = FastAPI(lifespan=lifespan)
+
+# Seconds since process start, reported by /api/health
+startup_timings = {}
 
 app.add_middleware(
     CORSMiddleware,
@@ -31,40 +65,108 @@ app.add_middleware(
 def debug_endpoint():
     return {"message": "Debug endpoint working", "routes": [r.path for r in app.routes]}
 
+@app.get("/api/health")
+def health():
+    # Readiness probe: answers without touching disk or Redmine
+    return {
+        "status": "ready",
+        "warm": 'warm' in startup_timings,
+        "startup_ms": {k: round(v * 1000, 1) for k, v in startup_timings.items()}
+    }
+
+def warm_backend():
+    # Runs after the server is accepting requests: pay for the heavy Redmine
+    # imports, client construction and cache parsing off the request path
+    try:
+        # Not a warm-up: a failing one below must not leave auto-log unscheduled.
+        # REDMINE_TRACKER_AUTO_LOG=0 keeps it off (benchmarks, read-only instances)
+        if os.getenv("REDMINE_TRACKER_AUTO_LOG", "1") != "0":
+            get_auto_log_scheduler().start()
+    except Exception as e:
+        print(f"Auto-log scheduler failed to start: {e}")
+    try:
+        ensure_snapshot()
+        get_redmine_client()
+        get_metadata()
+        get_project_index()
+        startup_timings['warm'] = time.perf_counter() - PROCESS_START
+        start_cache_warming("startup")
+        check_snapshot_freshness()
+    except Exception as e:
+        print(f"Background warm-up failed: {e}")
+
 @app.delete("/api/profile")
 def delete_profile(name: str):
     print(f"Attempting to delete profile: {name}")
-    data = {}
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            data = yaml.safe_load(f) or {}
-    
-    profiles = data.get('profiles', [])
-    # Filter out the profile
-    new_profiles = [p for p in profiles if p['name'] != name]
-    
-    if len(new_profiles) == len(profiles):
-        return {"error": "Profile not found"}
+    with shared_state.lock('settings'):
+        data = load_settings_data()
         
-    data['profiles'] = new_profiles
-    
-    with open(CONFIG_FILE, 'w') as f:
-        yaml.dump(data, f)
+        profiles = data.get('profiles', [])
+        # Filter out the profile
+        new_profiles = [p for p in profiles if p['name'] != name]
+        
+        if len(new_profiles) == len(profiles):
+            return {"error": "Profile not found"}
+            
+        data['profiles'] = new_profiles
+        save_settings_data(data)
+    invalidate_project_index()
         
     return {"status": "success", "message": "Profile deleted", "profiles": new_profiles}
 
 # Data Models
+class RedmineInstance(BaseModel):
+    # An additional Redmine server queried alongside the primary one
+    name: str
+    redmine_url: str
+    api_key: str
+    timeout: Optional[float] = 5.0
+
 class Settings(BaseModel):
     api_key: str
     redmine_url: Optional[str] = "http://advrm.advantech.com:3002/"
     alert_time: Optional[str] = "17:00"
     alert_time: Optional[str] = "17:00"
-    auto_log_time: Optional[str] = "18:00"
+    auto_log_time: Optional[str] = None  # None leaves it unchanged; "" disables auto-log
     calendar_start_time: Optional[str] = "06:00"
     calendar_end_time: Optional[str] = "21:00"
+    instances: Optional[List[RedmineInstance]] = None
 
-# Global Redmine Instance
+# Global Redmine Instance (one per worker process)
 redmine_client = None
+redmine_client_revision = None
+
+# Shares one Redmine round trip between identical concurrent requests
+upstream_flights = SingleFlight()
+
+# Global project search index (built lazily from the projects cache)
+project_index = None
+project_index_revision = None
+
+# Global full-text index over cached issues, journals and time entries
+search_index = None
+
+# Global Redmine enumeration registry (activities, statuses, priorities, custom fields)
+metadata_registry = None
+metadata_revision = None
+
+# Global background prefetcher for issue details
+cache_warmer = None
+
+# Global server-side auto-log scheduler
+auto_log_scheduler = None
+
+# Compresses cached issue descriptions and journal notes
+text_store = TextStore()
+
+# Mapped binary snapshot of cached time entries and projects, and its last freshness check
+cache_snapshot = None
+snapshot_freshness = {}
+
+# Clients for the additional Redmine instances, and their configuration
+instance_registry = None
+instance_config = None
+instance_config_revision = None
 
 # Determine AppData path for storing settings/data
 if sys.platform == 'win32':
@@ -75,15 +177,26 @@ else:
     home = os.path.expanduser("~")
     DATA_DIR = os.path.join(home, '.redmine_tracker')
 
-if not os.path.exists(DATA_DIR):
-    os.makedirs(DATA_DIR)
+os.makedirs(DATA_DIR, exist_ok=True)
 
 CONFIG_FILE = os.path.join(DATA_DIR, "settings.yaml")
 CACHE_FILE = os.path.join(DATA_DIR, "cache_data.yaml")
 TASKS_FILE = os.path.join(DATA_DIR, "tasks.json")
+SEARCH_DB = os.path.join(DATA_DIR, "search_index.db")
+METADATA_FILE = os.path.join(DATA_DIR, "metadata.yaml")
+AUTO_LOG_FILE = os.path.join(DATA_DIR, "auto_log.yaml")
+SHARED_STATE_DB = os.path.join(DATA_DIR, "shared_state.db")
+INSTANCES_DIR = os.path.join(DATA_DIR, "instances")
+SNAPSHOT_DIR = os.path.join(DATA_DIR, "snapshots")
 
 print(f"Data Directory: {DATA_DIR}")
 
+# Revision counters and file locks shared by all backend processes (uvicorn workers)
+shared_state = SharedState(SHARED_STATE_DB, os.path.join(DATA_DIR, "locks"))
+
+# Spaces out time entry writes (creates, updates, deletes; log_batch, auto-log, import) across all workers
+upstream_write_limiter = RateLimiter(rate=2.0, burst=4, shared=shared_state)
+
 def load_settings_data():
     if os.path.exists(CONFIG_FILE):
         try:
@@ -94,26 +207,181 @@ def load_settings_data():
             return {}
     return {}
 
+def save_settings_data(data, credentials_changed=False):
+    write_atomic(CONFIG_FILE, lambda f: yaml.dump(data, f))
+    if credentials_changed:
+        # Other workers rebuild their Redmine client on next use
+        shared_state.bump('credentials')
+
 def load_api_key():
     data = load_settings_data()
     return data.get('api_key')
 
-def load_cache():
-    if os.path.exists(CACHE_FILE):
-        with open(CACHE_FILE, 'r') as f:
+def is_primary(instance):
+    # None and the fan-out's {"name": "default"} both mean this backend's own Redmine
+    return instance is None or instance['name'] == PRIMARY_INSTANCE
+
+def cache_namespace(instance=None):
+    # (cache file, lock/revision name); additional instances each get their own namespace
+    if is_primary(instance):
+        return CACHE_FILE, 'cache'
+    slug = instance_slug(instance['name'])
+    return os.path.join(INSTANCES_DIR, slug, "cache_data.yaml"), f"cache.{slug}"
+
+def load_cache(instance=None):
+    path = cache_namespace(instance)[0]
+    if os.path.exists(path):
+        with open(path, 'r') as f:
             try:
                 return yaml.safe_load(f) or {}
             except:
                 return {}
     return {}
 
-def save_cache(data):
-    with open(CACHE_FILE, 'w') as f:
-        yaml.dump(data, f)
+def save_cache(data, instance=None):
+    path, name = cache_namespace(instance)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_atomic(path, lambda f: yaml.dump(data, f))
+    shared_state.bump(name)
+
+@contextmanager
+def cache_transaction(instance=None):
+    # Read-modify-write of the instance's cache_data.yaml, serialized across workers
+    with shared_state.lock(cache_namespace(instance)[1]):
+        cache = load_cache(instance)
+        yield cache
+        save_cache(cache, instance)
+
+def publish_snapshot(cache):
+    # Called under the cache lock whenever time entries or projects change
+    revision = shared_state.revision('snapshot') + 1
+    path = snapshot_path(SNAPSHOT_DIR, revision)
+    if 'time_entries' in cache:
+        try:
+            write_snapshot(path, cache['time_entries'], cache.get('projects', []), revision, cache.get(SEQ_KEY, 0))
+        except Exception as e:
+            print(f"Failed to write cache snapshot: {e}")
+    # Bumped even without a file, so readers stop using the previous snapshot
+    shared_state.bump('snapshot')
+    # Other workers may still map older files (Windows refuses those); retried on the next publish
+    for name in os.listdir(SNAPSHOT_DIR) if os.path.isdir(SNAPSHOT_DIR) else []:
+        if name != os.path.basename(path):
+            try:
+                os.remove(os.path.join(SNAPSHOT_DIR, name))
+            except OSError:
+                pass
+
+def get_snapshot():
+    # The current snapshot, mapped on first use; None when there is none for the current revision
+    global cache_snapshot
+    revision = shared_state.revision('snapshot')
+    if cache_snapshot is None or cache_snapshot.revision != revision:
+        try:
+            cache_snapshot = Snapshot(snapshot_path(SNAPSHOT_DIR, revision))
+        except (OSError, ValueError):
+            cache_snapshot = None
+    return cache_snapshot
+
+def ensure_snapshot():
+    # Caches synced before snapshots existed get one on first start
+    if get_snapshot() is None:
+        with shared_state.lock('cache'):
+            cache = load_cache()
+            if 'time_entries' in cache:
+                publish_snapshot(cache)
+    return get_snapshot()
+
+def get_recent_project_weights(cache, profiles=None):
+    # Weight 1.0 for the most recently used project, decaying with recency
+    projects = cache.get('projects', [])
+    ids_by_name = {p['name']: p['id'] for p in projects}
+
+    ordered = []
+    entries = sorted(cache.get('time_entries', []), key=lambda e: str(e.get('spent_on') or ''), reverse=True)
+    for e in entries:
+        project_id = e.get('project_id') or ids_by_name.get(e.get('project'))
+        if project_id and project_id not in ordered:
+            ordered.append(project_id)
+
+    weights = {}
+    for rank, project_id in enumerate(ordered):
+        weights[project_id] = 1.0 - 0.8 * rank / max(len(ordered), 1)
+
+    for p in profiles or []:
+        project_id = p.get('project_id')
+        if project_id:
+            weights[project_id] = max(weights.get(project_id, 0), 0.8)
+    return weights
+
+def rebuild_project_index(cache=None, publish=True):
+    global project_index, project_index_revision
+    if cache is None:
+        cache = load_cache()
+    profiles = load_settings_data().get('profiles', [])
+    revision = shared_state.bump('project_index') if publish else shared_state.revision('project_index')
+    project_index = ProjectIndex(cache.get('projects', []), get_recent_project_weights(cache, profiles))
+    project_index_revision = revision
+    return project_index
+
+def get_project_index():
+    # Rebuilt when this or another worker changed projects/recency since the last build
+    if project_index is None or project_index_revision != shared_state.revision('project_index'):
+        return rebuild_project_index(publish=False)
+    return project_index
+
+def invalidate_project_index():
+    # Recency changed (new entry / profile); rebuild on next search
+    global project_index
+    project_index = None
+    shared_state.bump('project_index')
+
+def get_search_index():
+    global search_index
+    if search_index is None:
+        search_index = FullTextIndex(SEARCH_DB)
+        if search_index.is_empty():
+            # First run: seed from whatever is already cached
+            cache = load_cache()
+            if cache:
+                print("Building full-text search index from cache...")
+                index_cached_issues(cache)
+                search_index.index_time_entries(cache.get('time_entries', []), replace=True)
+    return search_index
+
+def index_issue_details(details, journals=None):
+    # journals=None keeps the issue's already indexed notes
+    try:
+        get_search_index().index_issue(
+            details['id'], details.get('subject'), details.get('description'),
+            project=(details.get('project') or {}).get('name'),
+            journals=journals
+        )
+    except Exception as e:
+        print(f"Failed to index issue {details.get('id')}: {e}")
+
+def index_cached_issues(cache):
+    # Full rebuild: decompresses every cached issue, so only used to seed an empty index
+    for details in cache.get('issue_details', {}).values():
+        if 'id' in details:
+            journals = get_cached_journals(cache, details['id'])
+            journals = [text_store.unpack_fields(cache, j, JOURNAL_FIELDS) for j in journals['journals']] if journals else []
+            index_issue_details(text_store.unpack_fields(cache, details, ISSUE_FIELDS), journals)
+    index_assigned_issues(cache)
+
+def index_assigned_issues(cache):
+    # Issues from the assigned list that were never opened: index subject only
+    # (opened issues are indexed with their details by save_issue_details)
+    index = get_search_index()
+    issue_details = cache.get('issue_details', {})
+    project_names = {p['id']: p['name'] for p in cache.get('projects', [])}
+    for issue in cache.get('issues', []):
+        if str(issue['id']) not in issue_details:
+            index.index_issue(issue['id'], issue.get('subject'), project=project_names.get(issue.get('project_id')))
 
 def get_redmine_client():
-    global redmine_client
-    if redmine_client:
+    global redmine_client, redmine_client_revision
+    revision = shared_state.revision('credentials')
+    if redmine_client and revision == redmine_client_revision:
         return redmine_client
     
     data = load_settings_data()
@@ -122,13 +390,140 @@ def get_redmine_client():
 
     if api_key:
         try:
+            from packages.redmine import redmine_utility as rm
             redmine_client = rm.Redmine(api_key, url)
+            redmine_client_revision = revision
             return redmine_client
         except Exception as e:
             print(f"Failed to init Redmine: {e}")
             return None
     return None
 
+def get_instances():
+    """
+    The primary instance (top-level api_key/redmine_url) followed by the
+    additional ones from settings.yaml `instances`. Re-read when any worker
+    saves settings.
+    """
+    global instance_config, instance_config_revision
+    revision = shared_state.revision('credentials')
+    if instance_config is None or revision != instance_config_revision:
+        extra = [i for i in load_settings_data().get('instances') or [] if i.get('name')]
+        instance_config = [{"name": PRIMARY_INSTANCE}] + extra
+        instance_config_revision = revision
+        if instance_registry is not None:
+            instance_registry.prune([i['name'] for i in extra])
+    return instance_config
+
+def get_instance_registry():
+    global instance_registry
+    if instance_registry is None:
+        def build_client(url, api_key):
+            from packages.redmine import redmine_utility as rm
+            return rm.Redmine(api_key, url)
+        instance_registry = InstanceRegistry(build_client)
+    return instance_registry
+
+def get_instance_client(instance=None):
+    if is_primary(instance):
+        return get_redmine_client()
+    return get_instance_registry().client(instance)
+
+def federated_read(response, read, merge):
+    """
+    Run read(instance) on every configured instance concurrently and combine
+    the results with merge(results). With only the primary instance this is a
+    plain read(None). Per-instance outcomes go in the X-Redmine-Instances
+    header ("name=ok;other=timeout").
+    """
+    instances = get_instances()
+    if len(instances) == 1:
+        return read(None)
+
+    def call(instance):
+        result = read(instance)
+        if isinstance(result, dict) and 'error' in result:
+            raise RuntimeError(result['error'])
+        return result
+
+    results, status = get_instance_registry().fan_out(instances, call)
+    response.headers['X-Redmine-Instances'] = ";".join(f"{instance_slug(n)}={s['status']}" for n, s in status.items())
+    if not results:
+        return {"error": "No Redmine instance responded", "instances": status}
+    return merge(results, status)
+
+def merge_tagged(results, sort_key=None):
+    # Concatenate per-instance lists, tagging each item with its instance
+    merged = [dict(item, instance=name) for name, items in results.items() for item in items]
+    return sorted(merged, key=sort_key) if sort_key else merged
+
+def get_metadata(revalidate=True):
+    global metadata_registry, metadata_revision
+    revision = shared_state.revision('metadata')
+    if metadata_registry is None:
+        metadata_registry = MetadataRegistry(METADATA_FILE, on_save=publish_metadata)
+        metadata_revision = revision
+    elif revision != metadata_revision:
+        # Another worker refreshed metadata.yaml
+        metadata_registry.load()
+        metadata_revision = revision
+    client = get_redmine_client() if revalidate else None
+    if client:
+        # Revalidates in the background; callers always get the in-memory copy
+        metadata_registry.ensure_fresh(client.get_json)
+    return metadata_registry
+
+def publish_metadata():
+    global metadata_revision
+    metadata_revision = shared_state.bump('metadata')
+
+def get_cache_warmer():
+    global cache_warmer
+    if cache_warmer is None:
+        cache_warmer = CacheWarmer(
+            fetch_updated_on=fetch_issues_updated_on,
+            fetch_details=lambda issue_id: upstream_flights.do(
+                ('issue.journals', issue_id),
+                lambda: fetch_issue_details(get_redmine_client(), issue_id, save=False)),
+            cached_updated_on=get_cached_issue_versions,
+            commit=save_issue_details,
+            should_stop=lambda: not get_redmine_client() or get_redmine_client().offline,
+            run_lock=lambda: shared_state.lock('cache_warming', blocking=False)
+        )
+    return cache_warmer
+
+def get_cached_issue_versions():
+    # {id: updated_on} for issues whose header and journals are both cached
+    cache = load_cache()
+    journals = cache.get('issue_journals', {})
+    return {
+        int(k): d.get('updated_on') for k, d in cache.get('issue_details', {}).items()
+        if 'project' in d and k in journals and journals[k].get('updated_on') == d.get('updated_on')
+    }
+
+def get_warm_candidates(cache):
+    # Issues the user is most likely to open: assigned to me, planned, in profiles, recently logged
+    ids = [i['id'] for i in cache.get('issues', [])]
+    ids += [i for i in get_task_store().by_issue if i]
+    ids += [p.get('issue_id') for p in load_settings_data().get('profiles', []) if p.get('issue_id')]
+    entries = sorted(cache.get('time_entries', []), key=lambda e: str(e.get('spent_on') or ''), reverse=True)
+    ids += [e['issue'] for e in entries if e.get('issue')]
+    return [int(i) for i in dict.fromkeys(ids)]
+
+def start_cache_warming(reason):
+    if not get_redmine_client():
+        return False
+    return get_cache_warmer().start(get_warm_candidates(load_cache()), reason)
+
+def fetch_issues_updated_on(issue_ids):
+    client = get_redmine_client()
+    issues = client.redmine.issue.filter(issue_id=",".join(str(i) for i in issue_ids), status_id='*', limit=len(issue_ids))
+    return {i.id: str(i.updated_on) if getattr(i, 'updated_on', None) else None for i in issues}
+
+def upstream_error(e):
+    # Lets the UI tell "Redmine is down" apart from ordinary errors
+    return {"error": str(e), "offline": isinstance(e, CircuitOpenError)}
+
 def update_cache_with_entry(entry_id, start_time=None):
     client = get_redmine_client()
     if not client:
@@ -136,61 +531,72 @@ def update_cache_with_entry(entry_id, start_time=None):
         
     try:
         entry = client.redmine.time_entry.get(entry_id)
-        cache = load_cache()
-        if 'time_entries' not in cache:
-            cache['time_entries'] = []
-            
-        # Remove existing if any
-        cache['time_entries'] = [e for e in cache['time_entries'] if e['id'] != entry_id]
         
         # Add new
-        new_entry = {
-            "id": entry.id,
-            "project": entry.project.name,
-            "issue": entry.issue.id if hasattr(entry, 'issue') else None,
-            "user": entry.user.name,
-            "activity": entry.activity.name,
-            "hours": entry.hours,
-            "comments": entry.comments,
-            "spent_on": str(entry.spent_on),
-            "created_on": str(entry.created_on),
-            "updated_on": str(entry.updated_on)
-        }
+        new_entry = time_entry_to_dict(entry)
         
         if start_time:
             new_entry['start_time'] = start_time
             
-        cache['time_entries'].append(new_entry)
-        
-        save_cache(cache)
+        with cache_transaction() as cache:
+            # Replaces any existing copy and records the change for /time_entries/changes
+            upsert_entries(cache, [new_entry])
+            publish_snapshot(cache)
+        invalidate_project_index()
+        get_search_index().index_time_entries([new_entry])
     except Exception as e:
         print(f"Failed to update cache for entry {entry_id}: {e}")
 
+def time_entry_to_dict(entry):
+    return {
+        "id": entry.id,
+        "project": entry.project.name,
+        "project_id": entry.project.id,
+        "issue": entry.issue.id if hasattr(entry, 'issue') else None,
+        "user": entry.user.name,
+        "activity": entry.activity.name,
+        "activity_id": entry.activity.id,
+        "hours": entry.hours,
+        "comments": entry.comments,
+        "spent_on": str(entry.spent_on),
+        "created_on": str(entry.created_on),
+        "updated_on": str(entry.updated_on)
+    }
+
 def remove_from_cache(entry_id):
-    cache = load_cache()
-    if 'time_entries' in cache:
-        cache['time_entries'] = [e for e in cache['time_entries'] if e['id'] != entry_id]
-        save_cache(cache)
+    with cache_transaction() as cache:
+        delete_entries(cache, [entry_id])
+        publish_snapshot(cache)
+    get_search_index().remove('time_entry', entry_id)
 
 @app.post("/api/settings")
 def save_settings(settings: Settings):
+    if settings.instances is not None:
+        slugs = [instance_slug(i.name) for i in settings.instances]
+        if not all(slugs) or PRIMARY_INSTANCE in slugs or len(set(slugs)) != len(slugs):
+            return {"error": f"Instance names must be unique, non-empty and not '{PRIMARY_INSTANCE}'"}
     try:
-        data = load_settings_data()
-                
-        data['api_key'] = settings.api_key
-        data['redmine_url'] = settings.redmine_url
-        data['alert_time'] = settings.alert_time
-        data['auto_log_time'] = settings.auto_log_time
-        data['calendar_start_time'] = settings.calendar_start_time
-        data['calendar_end_time'] = settings.calendar_end_time
-        
-        with open(CONFIG_FILE, 'w') as f:
-            yaml.dump(data, f)
+        with shared_state.lock('settings'):
+            data = load_settings_data()
+                    
+            data['api_key'] = settings.api_key
+            data['redmine_url'] = settings.redmine_url
+            data['alert_time'] = settings.alert_time
+            if settings.auto_log_time is not None:
+                data['auto_log_time'] = settings.auto_log_time
+            data['calendar_start_time'] = settings.calendar_start_time
+            data['calendar_end_time'] = settings.calendar_end_time
+            if settings.instances is not None:
+                data['instances'] = [i.dict() for i in settings.instances]
+            
+            save_settings_data(data, credentials_changed=True)
         
         # Re-init client
-        global redmine_client
+        global redmine_client, redmine_client_revision
         try:
+            from packages.redmine import redmine_utility as rm
             redmine_client = rm.Redmine(settings.api_key, settings.redmine_url)
+            redmine_client_revision = shared_state.revision('credentials')
         except Exception as e:
             print(f"Warning: Failed to re-init Redmine client: {e}")
             # We still return success because settings were saved
@@ -209,9 +615,11 @@ def get_settings():
         "redmine_url": data.get('redmine_url', "http://advrm.advantech.com:3002/"),
         "alert_time": data.get('alert_time', "17:00"),
         "alert_time": data.get('alert_time', "17:00"),
-        "auto_log_time": data.get('auto_log_time', "18:00"),
+        # None until set, so the planner can still migrate its locally stored time
+        "auto_log_time": data.get('auto_log_time'),
         "calendar_start_time": data.get('calendar_start_time', "06:00"),
-        "calendar_end_time": data.get('calendar_end_time', "21:00")
+        "calendar_end_time": data.get('calendar_end_time', "21:00"),
+        "instances": data.get('instances') or []
     }
 
 class Profile(BaseModel):
@@ -234,23 +642,20 @@ def get_profiles():
 
 @app.post("/api/profiles")
 def save_profile(profile: Profile):
-    data = {}
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            data = yaml.safe_load(f) or {}
-    
-    profiles = data.get('profiles', [])
-    # Update existing or append
-    existing = next((p for p in profiles if p['name'] == profile.name), None)
-    if existing:
-        existing.update(profile.dict())
-    else:
-        profiles.append(profile.dict())
-    
-    data['profiles'] = profiles
-    
-    with open(CONFIG_FILE, 'w') as f:
-        yaml.dump(data, f)
+    with shared_state.lock('settings'):
+        data = load_settings_data()
+        
+        profiles = data.get('profiles', [])
+        # Update existing or append
+        existing = next((p for p in profiles if p['name'] == profile.name), None)
+        if existing:
+            existing.update(profile.dict())
+        else:
+            profiles.append(profile.dict())
+        
+        data['profiles'] = profiles
+        save_settings_data(data)
+    invalidate_project_index()
         
     return {"status": "success", "message": "Profile saved", "profiles": profiles}
 
@@ -258,7 +663,10 @@ def save_profile(profile: Profile):
 
 @app.get("/api/redmine/projects")
 def get_projects():
-    # Try cache first
+    # Snapshot first (no YAML parse), then cache
+    snapshot = get_snapshot()
+    if snapshot and snapshot.project_count:
+        return snapshot.projects()
     cache = load_cache()
     if 'projects' in cache:
         return cache['projects']
@@ -267,22 +675,46 @@ def get_projects():
     if not client:
         return {"error": "Redmine not configured"}
     
-    try:
+    def fetch_projects():
         projects = client.redmine.project.all(offset=0, limit=1000)
         project_list = [{"id": p.id, "name": p.name} for p in projects]
         project_list = sorted(project_list, key=lambda x: x['name'])
         
         # Update cache
-        cache['projects'] = project_list
-        save_cache(cache)
+        with cache_transaction() as cache:
+            cache['projects'] = project_list
+            publish_snapshot(cache)
+        rebuild_project_index(cache)
         
         return project_list
+
+    try:
+        return upstream_flights.do(('project.all',), fetch_projects)
     except Exception as e:
-        return {"error": str(e)}
+        return upstream_error(e)
+
+@app.get("/api/redmine/projects/search")
+def search_projects(q: str = "", limit: int = 20):
+    index = get_project_index()
+    if not len(index):
+        # Cold cache: populate projects (rebuilds the index)
+        result = get_projects()
+        if isinstance(result, dict) and 'error' in result:
+            return result
+        index = get_project_index()
+
+    return index.search(q, limit=max(1, min(limit, 100)))
 
 @app.get("/api/redmine/issues")
-def get_issues(project_id: Optional[str] = None, assigned_to_id: Optional[str] = None, status_id: Optional[str] = 'open', limit: int = 100):
-    client = get_redmine_client()
+def get_issues(response: Response, project_id: Optional[str] = None, assigned_to_id: Optional[str] = None, status_id: Optional[str] = 'open', limit: int = 100):
+    read = lambda instance: list_issues(project_id, assigned_to_id, status_id, limit, instance)
+    if project_id:
+        # Project ids only mean something on the primary instance
+        return read(None)
+    return federated_read(response, read, lambda results, status: merge_tagged(results, sort_key=lambda x: x['subject']))
+
+def list_issues(project_id, assigned_to_id, status_id, limit, instance=None):
+    client = get_instance_client(instance)
     if not client:
         return {"error": "Redmine not configured"}
     
@@ -297,81 +729,65 @@ def get_issues(project_id: Optional[str] = None, assigned_to_id: Optional[str] =
             
         filters['limit'] = limit
             
-        issues = client.redmine.issue.filter(**filters)
-        issue_list = [{"id": i.id, "subject": i.subject, "project_id": i.project.id, "project": {"id": i.project.id, "name": i.project.name}, "priority": {"id": i.priority.id, "name": i.priority.name} if hasattr(i, 'priority') else None, "status": {"id": i.status.id, "name": i.status.name}, "due_date": str(i.due_date) if hasattr(i, 'due_date') else None} for i in issues]
-        
-        return sorted(issue_list, key=lambda x: x['subject'])
+        def fetch_issues():
+            issues = client.redmine.issue.filter(**filters)
+            issue_list = [{"id": i.id, "subject": i.subject, "project_id": i.project.id, "project": {"id": i.project.id, "name": i.project.name}, "priority": {"id": i.priority.id, "name": i.priority.name} if hasattr(i, 'priority') else None, "status": {"id": i.status.id, "name": i.status.name}, "due_date": str(i.due_date) if hasattr(i, 'due_date') else None} for i in issues]
+            return sorted(issue_list, key=lambda x: x['subject'])
+
+        instance_name = instance['name'] if instance else PRIMARY_INSTANCE
+        return upstream_flights.do(('issue.filter', instance_name, tuple(sorted(filters.items()))), fetch_issues)
     except Exception as e:
         print(f"Error fetching issues: {e}")
-        return {"error": str(e)}
+        if isinstance(e, CircuitOpenError):
+            # Offline: serve the synced (assigned, open) issues we have
+            cache = load_cache(instance)
+            if 'issues' in cache:
+                project_names = {p['id']: p['name'] for p in cache.get('projects', [])}
+                return [
+                    {"id": i['id'], "subject": i['subject'], "project_id": i['project_id'],
+                     "project": {"id": i['project_id'], "name": project_names.get(i['project_id'], '')},
+                     "priority": None, "status": None, "due_date": None}
+                    for i in cache['issues']
+                    if not project_id or str(i['project_id']) == str(project_id)
+                ]
+        return upstream_error(e)
 
 @app.get("/api/redmine/issue/{issue_id}")
 def get_issue_details(issue_id: int):
-    # Try cache first
+    # Header only (status, dates, custom fields, rendered description); journals are paged separately
     cache = load_cache()
     # We'll store details in a separate map to avoid scanning the big list
     if 'issue_details' in cache and str(issue_id) in cache['issue_details']:
         details = cache['issue_details'][str(issue_id)]
         # Check if it has the new 'project' field (migration for stale cache)
         if 'project' in details:
-            return details
+            get_cache_warmer().record_hit(issue_id)
+            if 'journals' in details or 'description_html' not in details:
+                # Older single-blob entry: split out journals and render once
+                save_issue_details([details])
+                cache = load_cache()
+                details = cache['issue_details'][str(issue_id)]
+            # Text fields are stored compressed; unpacked only here, on the way out
+            return text_store.unpack_fields(cache, details, ISSUE_FIELDS)
         # If missing 'project', fall through to fetch from Redmine
 
     client = get_redmine_client()
     if not client:
         return {"error": "Redmine not configured"}
     
+    get_cache_warmer().record_miss()
     try:
-        # Fetch with journals (notes)
-        issue = client.redmine.issue.get(issue_id, include=['journals'])
-        
-        # Extract journals
-        journals = []
-        if hasattr(issue, 'journals'):
-            for j in issue.journals:
-                if hasattr(j, 'notes') and j.notes:
-                    journals.append({
-                        "user": j.user.name,
-                        "created_on": j.created_on,
-                        "notes": j.notes
-                    })
-        
-        details = {
-            "id": issue.id,
-            "subject": issue.subject,
-            "description": issue.description,
-            "status": issue.status.name,
-            "priority": getattr(issue.priority, 'name', '-'),
-            "author": getattr(issue.author, 'name', '-'),
-            "assigned_to": getattr(issue, 'assigned_to', None).name if getattr(issue, 'assigned_to', None) else '-',
-            "category": getattr(issue, 'category', None).name if getattr(issue, 'category', None) else '-',
-            "fixed_version": getattr(issue, 'fixed_version', None).name if getattr(issue, 'fixed_version', None) else '-',
-            "start_date": str(issue.start_date) if getattr(issue, 'start_date', None) else '-',
-            "due_date": str(issue.due_date) if getattr(issue, 'due_date', None) else '-',
-            "done_ratio": issue.done_ratio,
-            "estimated_hours": getattr(issue, 'estimated_hours', '-'),
-            "spent_hours": getattr(issue, 'spent_hours', '-'),
-            "created_on": str(issue.created_on) if getattr(issue, 'created_on', None) else None,
-            "updated_on": str(issue.updated_on) if getattr(issue, 'updated_on', None) else None,
-            "project": {
-                "id": issue.project.id,
-                "name": issue.project.name
-            },
-            "journals": journals,
-            "url": f"{client.url.rstrip('/')}/issues/{issue.id}",
-            "custom_fields": [{"id": cf.id, "name": cf.name, "value": cf.value} for cf in issue.custom_fields] if hasattr(issue, 'custom_fields') else []
-        }
-        
-        # Update cache
-        if 'issue_details' not in cache:
-            cache['issue_details'] = {}
-        
-        cache['issue_details'][str(issue_id)] = details
-        save_cache(cache)
-        
-        return details
+        # The issue modal asks for the journals at the same time: one fetch with
+        # journals, shared with that request, saves both header and journals
+        details = upstream_flights.do(
+            ('issue.journals', issue_id), lambda: fetch_issue_details(client, issue_id))
+        return issue_header(details)
     except Exception as e:
         print(f"Error fetching issue {issue_id} from Redmine: {e}")
+        # Fallback: serve stale cached details (pre-migration entries) when offline
+        stale = cache.get('issue_details', {}).get(str(issue_id))
+        if stale:
+            return issue_header(text_store.unpack_fields(cache, stale, ISSUE_FIELDS))
         # Fallback: Try to find in 'issues' list in cache
         if 'issues' in cache:
             cached_issue = next((i for i in cache['issues'] if i['id'] == issue_id), None)
@@ -388,44 +804,155 @@ def get_issue_details(issue_id: int):
                     "id": issue_id,
                     "subject": cached_issue.get('subject', ''),
                     "description": cached_issue.get('description', ''), # Might be missing
+                    "description_html": render_text(cached_issue.get('description', '')),
                     "status": "Unknown", # Missing in simple cache
                     "done_ratio": 0,
                     "project": {
                         "id": project_id,
                         "name": project_name
                     },
-                    "journals": [],
                     "url": ""
                 }
-        return {"error": str(e)}
+        return upstream_error(e)
+
+@app.get("/api/redmine/issue/{issue_id}/journals")
+def get_issue_journals(issue_id: int, offset: int = 0, limit: int = 20):
+    offset = max(offset, 0)
+    limit = min(max(limit, 1), 100)
 
-@app.get("/api/redmine/activities")
-def get_activities():
     cache = load_cache()
-    if 'activities' in cache:
-        activities = cache['activities']
-        # Check if cache is valid (keys should be numeric IDs as strings)
-        # Old format had names as keys. New format has IDs as keys.
-        is_valid = True
-        if activities:
-            first_key = next(iter(activities))
-            if not str(first_key).isdigit():
-                is_valid = False
-        
-        if is_valid:
-            return activities
+    cached = get_cached_journals(cache, issue_id)
+    header = cache.get('issue_details', {}).get(str(issue_id))
+    # Journals are current as long as they were fetched with the cached header's updated_on
+    if cached is not None and header and cached.get('updated_on') == header.get('updated_on'):
+        return journal_page(issue_id, cached['journals'], offset, limit, cache)
 
     client = get_redmine_client()
     if not client:
         return {"error": "Redmine not configured"}
+
+    try:
+        details = upstream_flights.do(
+            ('issue.journals', issue_id), lambda: fetch_issue_details(client, issue_id))
+        return journal_page(issue_id, details['journals'], offset, limit)
+    except Exception as e:
+        print(f"Error fetching journals for issue {issue_id}: {e}")
+        if cached is not None:
+            page = journal_page(issue_id, cached['journals'], offset, limit, cache)
+            page['stale'] = True
+            return page
+        return upstream_error(e)
+
+def issue_header(details):
+    return {k: v for k, v in details.items() if k != 'journals'}
+
+def journal_page(issue_id, journals, offset, limit, cache=None):
+    page = journals[offset:offset + limit]
+    if cache is not None:
+        # Cached notes are compressed; only the returned page is unpacked
+        page = [text_store.unpack_fields(cache, j, JOURNAL_FIELDS) for j in page]
+    return {
+        "issue_id": issue_id,
+        "total": len(journals),
+        "offset": offset,
+        "limit": limit,
+        "journals": page
+    }
+
+def get_cached_journals(cache, issue_id):
+    cached = cache.get('issue_journals', {}).get(str(issue_id))
+    if cached is not None:
+        return cached
+    # Older cache entries kept journals inside the details blob
+    legacy = cache.get('issue_details', {}).get(str(issue_id), {})
+    if 'journals' in legacy:
+        return {"updated_on": legacy.get('updated_on'), "journals": [render_journal(j) for j in legacy['journals']]}
+    return None
+
+def render_journal(journal):
+    if 'notes_html' not in journal:
+        journal = dict(journal, notes_html=render_text(journal.get('notes')))
+    return journal
+
+def fetch_issue_details(client, issue_id, save=True):
+    # Header and journals in one request; they are cached (and paged) separately
+    issue = client.redmine.issue.get(issue_id, include=['journals'])
     
-    activities = client.activity_map
+    details = {
+        "id": issue.id,
+        "subject": issue.subject,
+        "description": issue.description,
+        "description_html": render_text(issue.description),
+        "status": issue.status.name,
+        "priority": getattr(issue.priority, 'name', '-'),
+        "author": getattr(issue.author, 'name', '-'),
+        "assigned_to": getattr(issue, 'assigned_to', None).name if getattr(issue, 'assigned_to', None) else '-',
+        "category": getattr(issue, 'category', None).name if getattr(issue, 'category', None) else '-',
+        "fixed_version": getattr(issue, 'fixed_version', None).name if getattr(issue, 'fixed_version', None) else '-',
+        "start_date": str(issue.start_date) if getattr(issue, 'start_date', None) else '-',
+        "due_date": str(issue.due_date) if getattr(issue, 'due_date', None) else '-',
+        "done_ratio": issue.done_ratio,
+        "estimated_hours": getattr(issue, 'estimated_hours', '-'),
+        "spent_hours": getattr(issue, 'spent_hours', '-'),
+        "created_on": str(issue.created_on) if getattr(issue, 'created_on', None) else None,
+        "updated_on": str(issue.updated_on) if getattr(issue, 'updated_on', None) else None,
+        "project": {
+            "id": issue.project.id,
+            "name": issue.project.name
+        },
+        "url": f"{client.url.rstrip('/')}/issues/{issue.id}",
+        "custom_fields": [{"id": cf.id, "name": cf.name, "value": cf.value} for cf in issue.custom_fields] if hasattr(issue, 'custom_fields') else []
+    }
+
+    details["journals"] = [
+        render_journal({
+            "id": getattr(j, 'id', None),
+            "user": j.user.name,
+            "created_on": str(j.created_on),
+            "notes": j.notes
+        })
+        for j in getattr(issue, 'journals', []) if getattr(j, 'notes', None)
+    ]
     
-    # Update cache
-    cache['activities'] = activities
-    save_cache(cache)
+    if save:
+        save_issue_details([details])
     
-    return activities
+    return details
+
+def save_issue_details(details_list):
+    # Update cache (re-read under the cache lock so concurrent writers are not clobbered)
+    indexed = []
+    with cache_transaction() as cache:
+        cache.setdefault('issue_details', {})
+        cache.setdefault('issue_journals', {})
+        
+        for details in details_list:
+            key = str(details['id'])
+            header = issue_header(details)
+            if 'description_html' not in header:
+                header['description_html'] = render_text(header.get('description'))
+            cache['issue_details'][key] = text_store.pack_fields(cache, header, ISSUE_FIELDS)
+
+            journals = details.get('journals')
+            if journals is not None:
+                cache['issue_journals'][key] = {
+                    "updated_on": header.get('updated_on'),
+                    "journals": [text_store.pack_fields(cache, render_journal(j), JOURNAL_FIELDS) for j in journals]
+                }
+            indexed.append((header, journals))
+        # Trains the compression dictionary once enough issues are cached
+        text_store.maybe_train(cache)
+    for header, journals in indexed:
+        index_issue_details(header, journals)
+
+@app.get("/api/redmine/activities")
+def get_activities():
+    # Served from the in-memory metadata registry ({id: name})
+    return get_metadata().activities()
+
+@app.get("/api/redmine/metadata")
+def get_redmine_metadata():
+    return get_metadata().summary()
 
 class TimeEntry(BaseModel):
     project_id: Optional[int] = None
@@ -446,7 +973,7 @@ def create_time_entry(entry: TimeEntry):
     try:
         print(f"Creating time entry: {entry}")
         
-        custom_field_id = 93
+        custom_field_id = get_metadata().custom_field_id('rd_function_team')
         # Use provided value or default to N/A
         custom_field_value = entry.rd_function_team if hasattr(entry, 'rd_function_team') and entry.rd_function_team else 'N/A'
         
@@ -467,6 +994,7 @@ def create_time_entry(entry: TimeEntry):
         else:
             time_entry_data['project_id'] = entry.project_id
             
+        upstream_write_limiter.acquire()
         created_entry = client.redmine.time_entry.create(**time_entry_data)
         
         # Update Cache
@@ -475,12 +1003,27 @@ def create_time_entry(entry: TimeEntry):
         return {"status": "success", "message": "Time entry created", "id": created_entry.id}
     except Exception as e:
         print(f"Error creating time entry: {e}")
-        return {"error": str(e)}
+        return upstream_error(e)
 
 @app.get("/api/redmine/time_entries")
-def get_time_entries(from_date: Optional[str] = None, to_date: Optional[str] = None):
-    # Try cache first
-    cache = load_cache()
+def get_time_entries(response: Response, from_date: Optional[str] = None, to_date: Optional[str] = None):
+    return federated_read(
+        response,
+        lambda instance: list_time_entries(from_date, to_date, instance),
+        lambda results, status: merge_tagged(results, sort_key=lambda e: str(e.get('spent_on')))
+    )
+
+def list_time_entries(from_date=None, to_date=None, instance=None):
+    # Snapshot first: a range lookup on the mapped file, no YAML parse
+    snapshot = get_snapshot() if is_primary(instance) else None
+    if snapshot:
+        try:
+            return snapshot.time_entries(from_date, to_date)
+        except ValueError:
+            pass  # Not ISO dates: the cache path below compares them as strings
+
+    # Then cache
+    cache = load_cache(instance)
     if 'time_entries' in cache:
         entries = cache['time_entries']
         
@@ -492,7 +1035,7 @@ def get_time_entries(from_date: Optional[str] = None, to_date: Optional[str] = N
             
         return entries
 
-    client = get_redmine_client()
+    client = get_instance_client(instance)
     if not client:
         return {"error": "Redmine not configured"}
     try:
@@ -524,7 +1067,121 @@ def get_time_entries(from_date: Optional[str] = None, to_date: Optional[str] = N
         # Cache is populated by Sync.
         return entry_list
     except Exception as e:
+        return upstream_error(e)
+
+@app.get("/api/redmine/time_entries/changes")
+def get_time_entry_changes(since: Optional[int] = None):
+    # Entries inserted/updated and ids deleted after the client's watermark, plus the new
+    # watermark; "reset" means the client must replace its state with "upserted"
+    changes = snapshot_changes(since)
+    if changes is None:
+        cache = load_cache()
+        changes = changes_since(cache, since)
+        changes['cached'] = 'time_entries' in cache
+    # The feed covers the primary instance only; federated clients read date ranges instead
+    changes['federated'] = len(get_instances()) > 1
+    return changes
+
+def snapshot_changes(since):
+    # First load (full reset) or "nothing new" polls, answered from the snapshot
+    snapshot = get_snapshot()
+    if not snapshot or (since is not None and since != snapshot.seq):
+        return None
+    return {
+        "seq": snapshot.seq,
+        "reset": since is None,
+        "upserted": snapshot.time_entries() if since is None else [],
+        "deleted": [],
+        "cached": True
+    }
+
+@app.post("/api/redmine/time_entries/import")
+async def import_time_entries(request: Request, format: Optional[str] = None, dry_run: bool = False, concurrency: int = 4):
+    # Streamed CSV (header row) or NDJSON upload. Rows are validated against cached
+    # projects/issues/activities and created while the upload is still being read;
+    # per-row results and a final summary are streamed back as NDJSON.
+    fmt = format or ('csv' if 'csv' in request.headers.get('content-type', '') else 'ndjson')
+    client = None
+    if not dry_run:
+        client = await run_in_threadpool(get_redmine_client)
+        if not client:
+            return {"error": "Redmine not configured"}
+
+    try:
+        parser = RowParser(fmt)
+    except ValueError as e:
         return {"error": str(e)}
+    validator = await run_in_threadpool(build_import_validator)
+    importer = TimeEntryImporter(
+        validator, lambda payload: submit_import_row(client, payload),
+        concurrency=min(max(concurrency, 1), 8), dry_run=dry_run
+    )
+
+    abort_reason = None
+    try:
+        decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        async for chunk in request.stream():
+            for line_no, row in parser.feed(decoder.decode(chunk)):
+                await importer.add(line_no, row)
+        for line_no, row in parser.feed(decoder.decode(b"", final=True)) + parser.finish():
+            await importer.add(line_no, row)
+    except (ValueError, UnicodeDecodeError) as e:
+        # Malformed upload (bad header, encoding): rows already submitted still finish below
+        abort_reason = str(e)
+
+    async def stream():
+        finished = False
+        try:
+            async for result in importer.results():
+                yield json.dumps(result) + "\n"
+            summary = dict(importer.counts, dry_run=dry_run)
+            if abort_reason:
+                summary['error'] = abort_reason
+            seq = await run_in_threadpool(finish_import, importer)
+            finished = True
+            if seq is not None:
+                summary['seq'] = seq
+            yield json.dumps({"summary": summary}) + "\n"
+        finally:
+            if not finished:
+                # Client went away mid-stream: entries Redmine already created
+                # (and those still in flight) must still reach the cache
+                threading.Thread(target=finish_import, args=(importer,), daemon=True).start()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+def build_import_validator():
+    cache = load_cache()
+    issues = {i['id']: i.get('project_id') for i in cache.get('issues', [])}
+    for key, details in cache.get('issue_details', {}).items():
+        issues.setdefault(int(key), (details.get('project') or {}).get('id'))
+    metadata = get_metadata()
+    return RowValidator(cache.get('projects', []), issues, metadata.activities(),
+                        metadata.custom_field_id('rd_function_team'))
+
+def submit_import_row(client, payload):
+    payload = dict(payload)
+    start_time = payload.pop('start_time', None)
+    upstream_write_limiter.acquire()
+    entry = client.redmine.time_entry.create(**payload)
+    # The create response carries the full entry: no follow-up GET per row
+    result = time_entry_to_dict(entry)
+    if start_time:
+        result['start_time'] = start_time
+    return result
+
+def finish_import(importer):
+    # One cache commit (and one index update) for the whole import
+    created = importer.finish()
+    return commit_imported_entries(created) if created else None
+
+def commit_imported_entries(entries):
+    with cache_transaction() as cache:
+        seq = upsert_entries(cache, entries)
+        publish_snapshot(cache)
+    invalidate_project_index()
+    get_search_index().index_time_entries(entries)
+    return seq
 
 @app.put("/api/redmine/time_entries/{entry_id}")
 def update_time_entry(entry_id: int, entry: TimeEntry):
@@ -535,7 +1192,7 @@ def update_time_entry(entry_id: int, entry: TimeEntry):
     try:
         print(f"Updating time entry {entry_id}: {entry}")
         
-        custom_field_id = 93
+        custom_field_id = get_metadata().custom_field_id('rd_function_team')
         # Use provided value or default to N/A
         custom_field_value = entry.rd_function_team if hasattr(entry, 'rd_function_team') and entry.rd_function_team else 'N/A'
         
@@ -558,6 +1215,7 @@ def update_time_entry(entry_id: int, entry: TimeEntry):
         # Note: 'spent_on' is also updatable
         time_entry_data['spent_on'] = entry.spent_on
             
+        upstream_write_limiter.acquire()
         client.redmine.time_entry.update(entry_id, **time_entry_data)
         
         # Update Cache
@@ -570,7 +1228,7 @@ def update_time_entry(entry_id: int, entry: TimeEntry):
             # Treat as success (entry gone), remove from cache
             remove_from_cache(entry_id)
             return {"status": "success", "message": "Entry not found in Redmine, removed locally"}
-        return {"error": str(e)}
+        return upstream_error(e)
 
 @app.delete("/api/redmine/time_entries/{entry_id}")
 def delete_time_entry(entry_id: int):
@@ -580,6 +1238,7 @@ def delete_time_entry(entry_id: int):
     
     try:
         print(f"Deleting time entry {entry_id}")
+        upstream_write_limiter.acquire()
         client.redmine.time_entry.delete(entry_id)
         
         # Remove from Cache
@@ -592,7 +1251,7 @@ def delete_time_entry(entry_id: int):
             # Treat as success (entry gone), remove from cache
             remove_from_cache(entry_id)
             return {"status": "success", "message": "Entry not found in Redmine, removed locally"}
-        return {"error": str(e)}
+        return upstream_error(e)
 
 # --- Daily Planner Endpoints ---
 
@@ -669,45 +1328,71 @@ def load_tasks_data():
     return {}
 
 def save_tasks_data(tasks):
-    with open(TASKS_FILE, 'w') as f:
-        json.dump(tasks, f, indent=2)
+    write_atomic(TASKS_FILE, lambda f: json.dump(tasks, f, indent=2))
+    return shared_state.bump('tasks')
+
+# In-memory planner model, reloaded only when a worker has rewritten tasks.json
+task_store = None
+task_store_revision = None
+task_store_lock = threading.Lock()
+
+def get_task_store():
+    global task_store, task_store_revision
+    with task_store_lock:
+        revision = shared_state.revision('tasks')
+        if task_store is None or revision != task_store_revision:
+            task_store = TaskStore(load_tasks_data())
+            task_store_revision = shared_state.revision('tasks') # Migrations may have rewritten the file
+        return task_store
+
+def persist_task_store(store):
+    global task_store_revision
+    with task_store_lock:
+        task_store_revision = save_tasks_data(store.to_dict())
+
+@contextmanager
+def task_transaction():
+    # Mutate the planner with the latest tasks.json, serialized across workers
+    with shared_state.lock('tasks'):
+        store = get_task_store()
+        yield store
+        persist_task_store(store)
 
 @app.get("/api/tasks")
 def get_tasks(date_str: Optional[str] = None, no_auto_copy: bool = False):
-    tasks_data = load_tasks_data() # Returns Dict
-    
     # Default to today if not provided
     if not date_str:
         from datetime import date
         date_str = str(date.today())
         
-    task_list = []
-    for task_id, task in tasks_data.items():
-        # Create a copy for the response so we don't mutate storage
-        t = task.copy()
-        
-        # Calculate is_logged based on last_logged_date
-        if t.get('last_logged_date') == date_str:
-            t['is_logged'] = True
-        else:
-            t['is_logged'] = False
-            # If not logged today, clear the time_entry_id from the response
-            # so the frontend doesn't try to delete a past entry
-            t['time_entry_id'] = None
-            
-        # Set the date to the requested date (for frontend context)
-        t['date'] = date_str
-        
-        task_list.append(t)
-        
-    # Sort by name or some other criteria if needed
-    # For now, just return the list
-    return task_list
+    # is_logged/time_entry_id are derived from last_logged_date; the view is
+    # memoized per date until the next task mutation
+    return get_task_store().day_view(date_str)
+
+@app.get("/api/tasks/range")
+def get_tasks_range(from_date: str = Query(..., alias="from"), to_date: str = Query(..., alias="to"), include_weekends: bool = False):
+    # Task x day matrix of planned vs. logged hours (week / month plan views)
+    try:
+        days = date_range(from_date, to_date)
+    except ValueError as e:
+        return {"error": f"Invalid date range: {e}"}
+    if not days or len(days) > 93:
+        return {"error": "Date range must cover 1 to 93 days"}
+
+    cache = load_cache()
+    entries = cache.get('time_entries', [])
+    project_names = {p['id']: p['name'] for p in cache.get('projects', [])}
+
+    store = get_task_store()
+    with store.lock:
+        matrix = build_range_matrix(store, entries, days, project_names, include_weekends)
+    matrix['from'] = from_date
+    matrix['to'] = to_date
+    matrix['cached'] = 'time_entries' in cache
+    return matrix
 
 @app.post("/api/tasks")
 def create_task(task: Task):
-    all_tasks = load_tasks_data() # Dict
-    
     # Determine Key
     if task.redmine_issue_id:
         task.id = str(task.redmine_issue_id)
@@ -717,50 +1402,48 @@ def create_task(task: Task):
     task_dict['date'] = None # Ensure date is null in storage
     
     # If key exists, we overwrite (update)
-    all_tasks[task.id] = task_dict
-    
-    save_tasks_data(all_tasks)
+    with task_transaction() as store:
+        store.put(task.id, task_dict)
     return {"status": "success", "message": "Task saved", "task": task}
 
 @app.put("/api/tasks/{task_id}")
 def update_task(task_id: str, task: Task):
-    all_tasks = load_tasks_data() # Dict
-    
     # Check if we need to migrate key (e.g. user added issue ID)
     new_key = task_id
     if task.redmine_issue_id:
         new_key = str(task.redmine_issue_id)
         task.id = new_key
         
-    # If key changed, remove old
-    if new_key != task_id and task_id in all_tasks:
-        del all_tasks[task_id]
-        
     updated_data = task.dict()
     updated_data['date'] = None # Ensure date is null
     
-    all_tasks[new_key] = updated_data
-    save_tasks_data(all_tasks)
+    with task_transaction() as store:
+        # If key changed, remove old
+        if new_key != task_id and task_id in store:
+            store.delete(task_id)
+        store.put(new_key, updated_data)
     return {"status": "success", "message": "Task updated"}
 
 @app.delete("/api/tasks/{task_id}")
 def delete_task(task_id: str, delete_from_redmine: bool = False):
-    all_tasks = load_tasks_data() # Dict
+    store = get_task_store()
     
-    if task_id in all_tasks:
-        task_to_delete = all_tasks[task_id]
+    if task_id in store:
+        task_to_delete = store.get(task_id)
         
         if delete_from_redmine and task_to_delete.get('time_entry_id'):
             client = get_redmine_client()
             if client:
                 try:
+                    upstream_write_limiter.acquire()
                     client.redmine.time_entry.delete(task_to_delete['time_entry_id'])
                     print(f"Deleted Redmine time entry {task_to_delete['time_entry_id']}")
                 except Exception as e:
                     print(f"Failed to delete Redmine time entry: {e}")
 
-        del all_tasks[task_id]
-        save_tasks_data(all_tasks)
+        with task_transaction() as store:
+            if task_id in store:
+                store.delete(task_id)
         return {"status": "success", "message": "Task deleted"}
     return {"error": "Task not found"}
 
@@ -771,13 +1454,17 @@ def log_batch(tasks: List[Task]):
     if not client:
         print("DEBUG: Redmine client not initialized")
         return {"error": "Redmine not configured"}
-    
-    all_tasks = load_tasks_data() # Dict
+
+    from datetime import date
+    return log_tasks(client, tasks, str(date.today())) # Always log for today
+
+def log_tasks(client, tasks, spent_on):
+    # Shared by log_batch and the auto-log scheduler; creates go through the write limiter
+    metadata = get_metadata()
+    logged = []
     logged_count = 0
     errors = []
-    
-    from datetime import date
-    today_str = str(date.today())
+    unreachable = False
 
     for task in tasks:
         print(f"DEBUG: Processing task: {task.name}, Issue ID: {task.redmine_issue_id}, Project ID: {task.project_id}")
@@ -788,8 +1475,8 @@ def log_batch(tasks: List[Task]):
             
         try:
             # Create Time Entry
-            # Use task's activity_id or default to 9 (Development)
-            activity_id = task.activity_id if task.activity_id else 9
+            # Use task's activity_id or default to Development
+            activity_id = task.activity_id if task.activity_id else metadata.activity_id('Development', default=9)
             
             # Use task's comments or fall back to task name
             comments = task.comments if task.comments else task.name
@@ -801,8 +1488,8 @@ def log_batch(tasks: List[Task]):
                 'hours': task.planned_hours,
                 'activity_id': activity_id,
                 'comments': comments,
-                'spent_on': today_str, # Always log for today
-                'custom_fields': [{'id': 93, 'value': rd_function_team}]
+                'spent_on': spent_on,
+                'custom_fields': [{'id': metadata.custom_field_id('rd_function_team'), 'value': rd_function_team}]
             }
 
             if task.redmine_issue_id:
@@ -815,12 +1502,11 @@ def log_batch(tasks: List[Task]):
                 print("DEBUG: Missing Issue ID and Project ID")
                 raise Exception("Task has no Issue ID and no Project ID. Cannot log.")
             
+            upstream_write_limiter.acquire()
             created_entry = client.redmine.time_entry.create(**time_entry_data)
             
-            # Update local task status
-            if task.id in all_tasks:
-                all_tasks[task.id]['last_logged_date'] = today_str
-                all_tasks[task.id]['time_entry_id'] = created_entry.id
+            # Local task status is updated once all entries are created
+            logged.append((task.id, created_entry.id))
             
             logged_count += 1
             
@@ -829,18 +1515,94 @@ def log_batch(tasks: List[Task]):
             
         except Exception as e:
             errors.append(f"Task '{task.name}': {str(e)}")
+            # Redmine down or erroring, unlike a rejected entry: worth retrying
+            if isinstance(e, (CircuitOpenError,) + client.breaker.failure_exceptions):
+                unreachable = True
             
-    save_tasks_data(all_tasks)
+    with task_transaction() as store:
+        for task_id, time_entry_id in logged:
+            store.mark_logged(task_id, spent_on, time_entry_id)
     
     if errors:
-        return {"status": "partial_success", "logged": logged_count, "errors": errors}
+        return {"status": "partial_success", "logged": logged_count, "errors": errors, "retry": unreachable}
     else:
         return {"status": "success", "logged": logged_count}
 
+def run_auto_log(date_str):
+    # The day's unlogged, non-paused tasks with hours, as the planner shows them
+    client = get_redmine_client()
+    if not client:
+        return {"status": "error", "error": "Redmine not configured", "retry": True}
+    tasks = [
+        Task(**t) for t in get_task_store().day_view(date_str)
+        if not t['is_logged'] and not t['is_paused'] and (t['planned_hours'] or 0) > 0
+    ]
+    if not tasks:
+        return {"status": "success", "logged": 0}
+    return log_tasks(client, tasks, date_str)
+
+def get_auto_log_scheduler():
+    global auto_log_scheduler
+    if auto_log_scheduler is None:
+        auto_log_scheduler = AutoLogScheduler(
+            AUTO_LOG_FILE,
+            get_time=lambda: load_settings_data().get('auto_log_time', "18:00"),
+            run=run_auto_log,
+            run_lock=lambda: shared_state.lock('auto_log', blocking=False)
+        )
+    return auto_log_scheduler
+
+class AutoLogSettings(BaseModel):
+    auto_log_time: Optional[str] = None # "HH:MM"; empty disables auto-log
+
+@app.get("/api/planner/auto_log")
+def get_auto_log_status():
+    status = get_auto_log_scheduler().get_status()
+    # False until a time (or "" for disabled) is saved; the 18:00 default applies meanwhile
+    status['configured'] = 'auto_log_time' in load_settings_data()
+    status['rate_limit'] = upstream_write_limiter.get_stats()
+    return status
+
+@app.put("/api/planner/auto_log")
+def update_auto_log(settings: AutoLogSettings):
+    value = (settings.auto_log_time or "").strip()
+    if value:
+        try:
+            datetime.strptime(value, "%H:%M")
+        except ValueError:
+            return {"error": "auto_log_time must be HH:MM"}
+    with shared_state.lock('settings'):
+        data = load_settings_data()
+        data['auto_log_time'] = value
+        save_settings_data(data)
+    return get_auto_log_status()
+
+@app.post("/api/planner/auto_log/run")
+def run_auto_log_now():
+    # Runs today's auto-log now, in the background; the result shows up in GET /api/planner/auto_log
+    scheduler = get_auto_log_scheduler()
+    if scheduler.running:
+        return {"error": "Auto-log is already running"}
+    threading.Thread(target=scheduler.run_now, args=("manual",), daemon=True).start()
+    return {"status": "started"}
+
 @app.get("/api/redmine/daily_hours")
-def get_daily_hours():
-    # Try cache first
-    cache = load_cache()
+def get_daily_hours(response: Response):
+    def merge(results, status):
+        for name, result in results.items():
+            status[name]['hours'] = result['hours']
+        return {"hours": sum(r['hours'] for r in results.values()), "instances": status}
+    return federated_read(response, instance_daily_hours, merge)
+
+def instance_daily_hours(instance=None):
+    from datetime import date
+    snapshot = get_snapshot() if is_primary(instance) else None
+    if snapshot:
+        today_str = str(date.today())
+        return {"hours": snapshot.hours_between(today_str, today_str)}
+
+    # Try cache
+    cache = load_cache(instance)
     if 'time_entries' in cache:
         from datetime import date
         today_str = str(date.today())
@@ -850,7 +1612,7 @@ def get_daily_hours():
         total_hours = sum(e['hours'] for e in todays_entries)
         return {"hours": total_hours}
 
-    client = get_redmine_client()
+    client = get_instance_client(instance)
     if not client:
         return {"error": "Redmine not configured"}
     try:
@@ -871,117 +1633,193 @@ def sync_data():
         return {"error": "Redmine not configured"}
     
     try:
-        cache = load_cache()
-        
+        # Everything is fetched first; the cache is only locked for the final merge
         # 1. Sync Projects
         print("Syncing projects...")
         projects = client.redmine.project.all(offset=0, limit=1000)
         project_list = [{"id": p.id, "name": p.name} for p in projects]
-        cache['projects'] = sorted(project_list, key=lambda x: x['name'])
         
         # 2. Sync Issues (assigned to me)
         print("Syncing issues...")
         issues = client.redmine.issue.filter(assigned_to_id='me', status_id='open')
         issue_list = [{"id": i.id, "subject": i.subject, "project_id": i.project.id} for i in issues]
-        cache['issues'] = sorted(issue_list, key=lambda x: x['subject'])
         
-        # 3. Sync Activities
-        print("Syncing activities...")
-        activities = client.activity_map
-        cache['activities'] = activities
+        # 3. Sync Activities and other enumerations (conditional GETs, cheap when unchanged)
+        print("Syncing metadata...")
+        # Refreshed here, so no background revalidation on top of it
+        get_metadata(revalidate=False).refresh(client.get_json)
         
         # 4. Sync Time Entries (Recent - e.g., last 30 days)
         print("Syncing time entries...")
-        from datetime import date, timedelta
-        
-        # Preserve start_time from existing cache
-        existing_start_times = {}
-        if 'time_entries' in cache:
-            for e in cache['time_entries']:
-                if 'start_time' in e:
-                    existing_start_times[e['id']] = e['start_time']
-        
-        today = date.today()
-        start_date = today - timedelta(days=30)
-        
-        user = client.redmine.user.get('current')
-        entries = client.redmine.time_entry.filter(user_id=user.id, from_date=start_date, to_date=today, limit=100)
-        
-        entry_list = []
-        for entry in entries:
-            new_entry_dict = {
-                "id": entry.id,
-                "project": entry.project.name,
-                "project_id": entry.project.id,
-                "issue": entry.issue.id if hasattr(entry, 'issue') else None,
-                "user": entry.user.name,
-                "activity": entry.activity.name,
-                "activity_id": entry.activity.id,
-                "hours": entry.hours,
-                "comments": entry.comments,
-                "spent_on": str(entry.spent_on),
-                "created_on": str(entry.created_on),
-                "updated_on": str(entry.updated_on)
-            }
+        entry_list = fetch_recent_time_entries(client)
             
-            # Restore start_time if it existed
-            if entry.id in existing_start_times:
-                new_entry_dict['start_time'] = existing_start_times[entry.id]
-                
-            entry_list.append(new_entry_dict)
-            
-        cache['time_entries'] = entry_list
-        
-        save_cache(cache)
+        with cache_transaction() as cache:
+            cache['projects'] = sorted(project_list, key=lambda x: x['name'])
+            cache['issues'] = sorted(issue_list, key=lambda x: x['subject'])
+            # Also rewrites the snapshot
+            merge_synced_entries(cache, entry_list)
+        rebuild_project_index(cache)
+
+        # 5. Refresh full-text search index with what sync changed; details and
+        # journals were indexed when they were saved
+        print("Indexing for search...")
+        index_assigned_issues(cache)
+        get_search_index().index_time_entries(entry_list, replace=True)
+
+        # 6. Prefetch issue details in the background
+        start_cache_warming("sync")
+
+        # 7. Additional instances, concurrently, each into its own cache namespace
+        extra = get_instances()[1:]
+        if extra:
+            print(f"Syncing {len(extra)} additional instance(s)...")
+            _, status = get_instance_registry().fan_out(extra, sync_instance_cache, timeout=INSTANCE_SYNC_TIMEOUT)
+            failed = [name for name, s in status.items() if s['status'] != 'ok']
+            message = f"Sync completed ({', '.join(failed)} failed)" if failed else "Sync completed successfully"
+            return {"status": "success", "message": message, "instances": status}
         return {"status": "success", "message": "Sync completed successfully"}
         
     except Exception as e:
         print(f"Sync failed: {e}")
+        return upstream_error(e)
+
+def fetch_recent_time_entries(client, days=30):
+    from datetime import date, timedelta
+    today = date.today()
+    user = client.redmine.user.get('current')
+    entries = client.redmine.time_entry.filter(user_id=user.id, from_date=today - timedelta(days=days), to_date=today, limit=100)
+    return [time_entry_to_dict(entry) for entry in entries]
+
+def merge_synced_entries(cache, entry_list):
+    # Preserve start_time from existing cache
+    existing_start_times = {e['id']: e['start_time'] for e in cache.get('time_entries', []) if 'start_time' in e}
+    for e in entry_list:
+        # Restore start_time if it existed
+        if e['id'] in existing_start_times:
+            e['start_time'] = existing_start_times[e['id']]
+    seq = replace_entries(cache, entry_list)
+    publish_snapshot(cache)
+    return seq
+
+# Snapshots older than this are checked against Redmine after startup
+SNAPSHOT_MAX_AGE = 10 * 60
+
+def check_snapshot_freshness():
+    """
+    The first dashboard render is served from the snapshot as it was left
+    by the last run; this refetches the recent time entries behind it and
+    merges any differences, which clients then pick up from the change feed.
+    """
+    snapshot = get_snapshot()
+    if snapshot is None:
+        # Never synced: nothing was served that could be stale
+        return
+    if time.time() - snapshot.created_at < SNAPSHOT_MAX_AGE:
+        snapshot_freshness.update({"status": "fresh", "checked_at": time.time(), "age_sec": round(time.time() - snapshot.created_at, 1)})
+        return
+    client = get_redmine_client()
+    if not client or client.offline:
+        snapshot_freshness.update({"status": "skipped", "checked_at": time.time()})
+        return
+
+    started = time.perf_counter()
+    try:
+        entry_list = fetch_recent_time_entries(client)
+        with cache_transaction() as cache:
+            before = cache.get(SEQ_KEY, 0)
+            changed = merge_synced_entries(cache, entry_list) != before
+        if changed:
+            get_search_index().index_time_entries(entry_list, replace=True)
+        snapshot_freshness.update({"status": "updated" if changed else "unchanged", "error": None})
+    except Exception as e:
+        print(f"Snapshot freshness check failed: {e}")
+        snapshot_freshness.update({"status": "error", "error": str(e)})
+    snapshot_freshness.update({"checked_at": time.time(), "elapsed_ms": round((time.perf_counter() - started) * 1000)})
+
+# Seconds an additional instance may take to sync before it is reported as timed out
+INSTANCE_SYNC_TIMEOUT = 120
+
+def sync_instance_cache(instance):
+    # Projects, assigned open issues and the last 30 days of time entries of an additional instance
+    client = get_instance_client(instance)
+    if not client:
+        raise RuntimeError("Redmine not configured")
+    projects = client.redmine.project.all(offset=0, limit=1000)
+    project_list = [{"id": p.id, "name": p.name} for p in projects]
+    issues = client.redmine.issue.filter(assigned_to_id='me', status_id='open')
+    issue_list = [{"id": i.id, "subject": i.subject, "project_id": i.project.id} for i in issues]
+    entry_list = fetch_recent_time_entries(client)
+
+    with cache_transaction(instance) as cache:
+        cache['projects'] = sorted(project_list, key=lambda x: x['name'])
+        cache['issues'] = sorted(issue_list, key=lambda x: x['subject'])
+        replace_entries(cache, entry_list)
+    return len(entry_list)
+
+@app.get("/api/redmine/status")
+def get_redmine_status():
+    client = get_redmine_client()
+    if not client:
+        return {"state": "unconfigured", "offline": True}
+    return client.breaker.get_status()
+
+@app.get("/api/stats/warming")
+def get_warming_stats():
+    return get_cache_warmer().get_stats()
+
+@app.get("/api/stats/snapshot")
+def get_snapshot_stats():
+    snapshot = get_snapshot()
+    return {"snapshot": snapshot.get_stats() if snapshot else None, "freshness": snapshot_freshness}
+
+@app.get("/api/stats/text_store")
+def get_text_store_stats():
+    # Compression ratio and unpack timings for cached issue text
+    return text_store.get_stats(load_cache())
+
+@app.get("/api/stats/federation")
+def get_federation_stats():
+    return {"instances": [i['name'] for i in get_instances()], "stats": get_instance_registry().get_stats()}
+
+@app.get("/api/stats/coalescing")
+def get_coalescing_stats():
+    return upstream_flights.get_stats()
+
+@app.get("/api/search")
+def search(q: str, limit: int = 20, kind: Optional[str] = None):
+    # kind: optional comma separated filter (issue, journal, time_entry)
+    kinds = [k.strip() for k in kind.split(',') if k.strip()] if kind else None
+    try:
+        return get_search_index().search(q, limit=max(1, min(limit, 100)), kinds=kinds)
+    except Exception as e:
+        print(f"Search failed: {e}")
         return {"error": str(e)}
 
 @app.get("/api/task_history")
 def get_task_history():
-    all_tasks = load_tasks_data() # Dict
-    # Return unique tasks by name
-    seen_names = set()
-    unique_tasks = []
-    
-    # Sort by date descending to get most recent first
-    # Iterate over values since all_tasks is a dict
-    sorted_tasks = sorted(all_tasks.values(), key=lambda x: x.get('date') or '', reverse=True)
-    
-    for task in sorted_tasks:
-        name = task.get('name')
-        if name and name not in seen_names:
-            seen_names.add(name)
-            unique_tasks.append(task)
-            
-    return unique_tasks
+    # Return unique tasks by name (served from the name index)
+    return get_task_store().history()
 
 @app.delete("/api/task_history")
 def delete_task_history(name: str):
     print(f"Deleting history for task name: {name}")
-    all_tasks = load_tasks_data() # Dict
-    
-    # Identify IDs to remove
-    ids_to_remove = [tid for tid, t in all_tasks.items() if t.get('name') == name]
-    
-    if not ids_to_remove:
-        return {"error": "Task not found in history"}
-        
-    for tid in ids_to_remove:
-        del all_tasks[tid]
+    with shared_state.lock('tasks'):
+        store = get_task_store()
         
-    save_tasks_data(all_tasks)
+        # Remove every task with that name (name index lookup)
+        if not store.delete_by_name(name):
+            return {"error": "Task not found in history"}
+            
+        persist_task_store(store)
     return {"status": "success", "message": f"Deleted history for '{name}'"}
 
 
 
-# Debug: Print all routes
-for route in app.routes:
-    print(f"Route: {route.path} {route.methods}")
+# Routes are listed by /api/debug (printing them here slowed every startup)
 
 if __name__ == "__main__":
+    import uvicorn
+
     # Handle signals for graceful shutdown
     def signal_handler(sig, frame):
         print(f"[{datetime.now()}] Received signal {sig}, exiting...")
@@ -1012,5 +1850,16 @@ if __name__ == "__main__":
             import traceback
             traceback.print_exc()
     else:
-        # Enable reload for development
-        uvicorn.run("main:app", host="127.0.0.1", port=port, reload=True)
+        # Multi-worker mode (team server), e.g.:
+        #   REDMINE_TRACKER_WORKERS=4 REDMINE_TRACKER_HOST=0.0.0.0 python main.py
+        # Workers share DATA_DIR: file writes are atomic and serialized with
+        # cross-process locks, and in-memory copies (Redmine client, task store,
+        # metadata, project index) are reloaded via shared_state.db revisions.
+        # Circuit breaker and request coalescing stay per worker.
+        workers = int(os.getenv("REDMINE_TRACKER_WORKERS", "1"))
+        host = os.getenv("REDMINE_TRACKER_HOST", "127.0.0.1")
+        if workers > 1:
+            uvicorn.run("main:app", host=host, port=port, workers=workers)
+        else:
+            # Enable reload for development
+            uvicorn.run("main:app", host=host, port=port, reload=True)
@@ -0,0 +1,197 @@
+import os
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import yaml
+
+from packages.storage.shared_state import write_atomic
+
+class AutoLogScheduler:
+    """
+    Runs the day's auto-log from the backend at the configured time, so it
+    no longer depends on the planner window being open.
+
+    Each day's run starts at a random offset of up to `jitter` seconds after
+    the configured time. The offset is stable per machine and day, so
+    clients configured for the same minute spread out instead of hitting
+    Redmine together. A run missed while the backend was down is caught up
+    within `grace` seconds. Each run's outcome is persisted to `path`; the
+    last completed date there (checked under `run_lock`) keeps restarts and
+    other workers from logging a day twice. A run that could not reach
+    Redmine (`retry` in its outcome) does not complete the day: it is tried
+    again every `retry_interval` seconds until the grace period ends.
+    """
+
+    def __init__(self, path, get_time, run, run_lock=None, jitter=600, grace=2 * 3600, poll=30, keep=30,
+                 retry_interval=300):
+        self.path = path
+        self.get_time = get_time        # () -> "HH:MM" or None (disabled)
+        self.run = run                  # date_str -> {"status", "logged", "errors", "retry"}
+        self.run_lock = run_lock        # () -> context manager yielding acquired
+        self.jitter = jitter
+        self.grace = grace
+        self.poll = poll
+        self.keep = keep
+        self.retry_interval = retry_interval
+        self.lock = threading.Lock()
+        self.thread = None
+        self.running = False
+        self.node = uuid.getnode()
+
+    # --- Persisted results ---
+
+    def load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    return yaml.safe_load(f) or {}
+            except Exception as e:
+                print(f"Error loading auto-log results: {e}")
+        return {}
+
+    def _record(self, result):
+        data = self.load()
+        history = [result] + data.get('history', [])
+        data['last_run'] = result
+        if not result['retry']:
+            data['last_done'] = result['date']
+        data['history'] = history[:self.keep]
+        write_atomic(self.path, lambda f: yaml.dump(data, f))
+
+    @staticmethod
+    def _done(data, day):
+        if 'last_done' in data:
+            return data['last_done'] == str(day)
+        # Files written before retries only have the last run's date
+        last_run = data.get('last_run') or {}
+        return last_run.get('date') == str(day) and not last_run.get('retry')
+
+    def _retry_wait(self, data, day, now):
+        # Seconds until a failed run of `day` may be retried (0 if not waiting)
+        last_run = data.get('last_run') or {}
+        if last_run.get('date') != str(day) or not last_run.get('retry'):
+            return 0
+        return max(0, last_run.get('finished_at', 0) + self.retry_interval - now)
+
+    # --- Schedule ---
+
+    def _configured_time(self):
+        value = self.get_time()
+        if not value:
+            return None
+        try:
+            return datetime.strptime(str(value), "%H:%M").time()
+        except ValueError:
+            print(f"Invalid auto_log_time '{value}', auto-log disabled")
+            return None
+
+    def due_at(self, day):
+        at = self._configured_time()
+        if at is None:
+            return None
+        offset = random.Random(f"{self.node}:{day}").uniform(0, self.jitter)
+        due = datetime.combine(day, at) + timedelta(seconds=offset)
+        # Never let the jitter push a run into the next day
+        return min(due, datetime.combine(day, datetime.max.time()))
+
+    def next_run_at(self, now=None):
+        now = now or datetime.now()
+        data = self.load()
+        for day in (now.date(), now.date() + timedelta(days=1)):
+            due = self.due_at(day)
+            if due is None:
+                return None
+            if self._done(data, day):
+                continue
+            if due >= now:
+                return due
+            # A failed run is retried until the grace period ends
+            wait = self._retry_wait(data, day, now.timestamp())
+            if wait and (now - due).total_seconds() + wait <= self.grace:
+                return now + timedelta(seconds=wait)
+        return None
+
+    def tick(self, now=None):
+        now = now or datetime.now()
+        day = now.date()
+        due = self.due_at(day)
+        if due is None or now < due or (now - due).total_seconds() > self.grace:
+            return False
+        data = self.load()
+        if self._done(data, day) or self._retry_wait(data, day, now.timestamp()):
+            return False
+        return self.run_now("schedule", day=day, scheduled_for=due)
+
+    # --- Runs ---
+
+    def run_now(self, trigger="manual", day=None, scheduled_for=None):
+        day = day or datetime.now().date()
+        with self.lock:
+            if self.running:
+                return False
+            self.running = True
+        try:
+            if self.run_lock is None:
+                return self._run(trigger, day, scheduled_for)
+            with self.run_lock() as acquired:
+                if not acquired:
+                    return False
+                # Another process may have finished the run while we waited
+                if trigger == "schedule" and self._done(self.load(), day):
+                    return False
+                return self._run(trigger, day, scheduled_for)
+        finally:
+            with self.lock:
+                self.running = False
+
+    def _run(self, trigger, day, scheduled_for):
+        started = time.time()
+        print(f"Auto-log ({trigger}) for {day} starting")
+        try:
+            outcome = self.run(str(day)) or {}
+        except Exception as e:
+            print(f"Auto-log ({trigger}) failed: {e}")
+            outcome = {"status": "error", "error": str(e), "retry": True}
+        result = {
+            "date": str(day),
+            "trigger": trigger,
+            "scheduled_for": scheduled_for.isoformat(timespec='seconds') if scheduled_for else None,
+            "started_at": started,
+            "finished_at": time.time(),
+            "status": outcome.get('status', 'error' if outcome.get('error') else 'success'),
+            "logged": outcome.get('logged', 0),
+            "errors": outcome.get('errors') or ([outcome['error']] if outcome.get('error') else []),
+            "retry": bool(outcome.get('retry'))
+        }
+        self._record(result)
+        print(f"Auto-log ({trigger}) for {day}: {result['status']}, {result['logged']} logged")
+        return True
+
+    def start(self):
+        with self.lock:
+            if self.thread is not None:
+                return
+            self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def _loop(self):
+        while True:
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"Auto-log scheduler error: {e}")
+            time.sleep(self.poll)
+
+    def get_status(self):
+        data = self.load()
+        next_run = self.next_run_at()
+        return {
+            "auto_log_time": self.get_time() or None,
+            "running": self.running,
+            "next_run_at": next_run.isoformat(timespec='seconds') if next_run else None,
+            "last_run": data.get('last_run'),
+            "history": data.get('history', [])
+        }
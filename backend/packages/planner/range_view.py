@@ -0,0 +1,69 @@
+from datetime import date, timedelta
+
+def date_range(from_date, to_date):
+    start = date.fromisoformat(from_date)
+    end = date.fromisoformat(to_date)
+    return [str(start + timedelta(days=i)) for i in range((end - start).days + 1)]
+
+def build_range_matrix(store, entries, days, project_names=None, include_weekends=False):
+    """
+    Task x day matrix of planned vs. logged hours.
+
+    Planned hours come from the (static) planner tasks, applied on every
+    working day unless the task is paused. Logged hours come from cached
+    time entries, joined to tasks in a single pass through the store's
+    redmine_issue_id index; project-only tasks are matched on
+    (project, comments) the way log_batch writes them.
+    """
+    project_names = project_names or {}
+    column = {d: i for i, d in enumerate(days)}
+    width = len(days)
+    working = [include_weekends or date.fromisoformat(d).weekday() < 5 for d in days]
+
+    rows = {}
+    project_tasks = {}
+    for key, record in store.tasks.items():
+        planned_hours = 0.0 if record.is_paused else float(record.planned_hours or 0)
+        rows[key] = {
+            "id": key,
+            "name": record.name,
+            "redmine_issue_id": record.redmine_issue_id,
+            "project_id": record.project_id,
+            "is_paused": record.is_paused,
+            "planned": [planned_hours if working[i] else 0.0 for i in range(width)],
+            "logged": [0.0] * width,
+            "entry_ids": [[] for _ in range(width)],
+        }
+        if not record.redmine_issue_id and record.project_id:
+            match = (project_names.get(record.project_id, record.project_id), record.comments or record.name)
+            project_tasks.setdefault(match, []).append(key)
+
+    unplanned = [0.0] * width
+    for e in entries:
+        col = column.get(str(e.get('spent_on')))
+        if col is None:
+            continue
+        hours = float(e.get('hours') or 0)
+
+        keys = store.keys_for_issue(e.get('issue')) if e.get('issue') else []
+        if not keys:
+            project = e.get('project_id') and project_names.get(e['project_id']) or e.get('project')
+            keys = project_tasks.get((project, e.get('comments')), [])
+
+        if not keys:
+            unplanned[col] += hours
+            continue
+        for key in keys:
+            rows[key]["logged"][col] += hours
+            rows[key]["entry_ids"][col].append(e.get('id'))
+
+    tasks = list(rows.values())
+    return {
+        "days": days,
+        "tasks": tasks,
+        "unplanned_logged": unplanned,
+        "totals": {
+            "planned": [sum(t["planned"][i] for t in tasks) for i in range(width)],
+            "logged": [sum(t["logged"][i] for t in tasks) + unplanned[i] for i in range(width)],
+        }
+    }
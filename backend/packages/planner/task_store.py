@@ -0,0 +1,185 @@
+import threading
+from collections import OrderedDict
+
+class TaskRecord:
+    """Compact planner task (one per tasks.json entry)."""
+
+    FIELDS = (
+        'id', 'name', 'redmine_issue_id', 'planned_hours', 'is_logged', 'is_paused',
+        'date', 'last_logged_date', 'time_entry_id', 'activity_id',
+        'rd_function_team', 'comments', 'project_id'
+    )
+    DEFAULTS = {
+        'planned_hours': 0.0, 'is_logged': False, 'is_paused': False,
+        'rd_function_team': "N/A", 'comments': ""
+    }
+
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, data):
+        for field in self.FIELDS:
+            setattr(self, field, data.get(field, self.DEFAULTS.get(field)))
+        # Keep unknown keys so round-tripping tasks.json never drops data
+        self.extra = {k: v for k, v in data.items() if k not in self.FIELDS} or None
+
+    def to_dict(self):
+        d = {field: getattr(self, field) for field in self.FIELDS}
+        if self.extra:
+            d.update(self.extra)
+        return d
+
+class TaskStore:
+    """
+    In-memory planner model with secondary indexes by name,
+    redmine_issue_id and last_logged_date.
+
+    Views (per-date task list, history) are built lazily and memoized until
+    the next mutation, so repeated planner requests do not rescan every
+    task. At most MAX_VIEWS are kept (least recently used dropped first),
+    and callers get shallow copies, so mutating a result cannot corrupt
+    later reads.
+    """
+
+    MAX_VIEWS = 32
+
+    def __init__(self, tasks=None):
+        self.lock = threading.RLock()
+        self.tasks = {}
+        self.by_name = {}
+        self.by_issue = {}
+        self.by_logged_date = {}
+        self.revision = 0
+        self._views = OrderedDict()
+        for key, data in (tasks or {}).items():
+            self._add(key, TaskRecord(data))
+
+    # --- Index maintenance ---
+
+    @staticmethod
+    def _index_add(index, value, key):
+        if value is not None:
+            index.setdefault(value, {})[key] = None  # dict as insertion-ordered set
+
+    @staticmethod
+    def _index_remove(index, value, key):
+        keys = index.get(value)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del index[value]
+
+    def _index(self, key, record):
+        self._index_add(self.by_name, record.name, key)
+        self._index_add(self.by_issue, record.redmine_issue_id, key)
+        self._index_add(self.by_logged_date, record.last_logged_date, key)
+
+    def _unindex(self, key, record):
+        self._index_remove(self.by_name, record.name, key)
+        self._index_remove(self.by_issue, record.redmine_issue_id, key)
+        self._index_remove(self.by_logged_date, record.last_logged_date, key)
+
+    def _add(self, key, record):
+        old = self.tasks.get(key)
+        if old is not None:
+            # Replace in place so the task keeps its position
+            self._unindex(key, old)
+        self.tasks[key] = record
+        self._index(key, record)
+
+    def _remove(self, key):
+        record = self.tasks.pop(key)
+        self._unindex(key, record)
+        return record
+
+    def _changed(self):
+        self.revision += 1
+        self._views.clear()
+
+    # --- Mutations ---
+
+    def put(self, key, data):
+        with self.lock:
+            self._add(key, TaskRecord(data))
+            self._changed()
+
+    def delete(self, key):
+        with self.lock:
+            record = self._remove(key)
+            self._changed()
+            return record
+
+    def delete_by_name(self, name):
+        with self.lock:
+            keys = list(self.by_name.get(name, ()))
+            for key in keys:
+                self._remove(key)
+            if keys:
+                self._changed()
+            return keys
+
+    def mark_logged(self, key, date_str, time_entry_id):
+        with self.lock:
+            record = self.tasks.get(key)
+            if record is None:
+                return False
+            self._index_remove(self.by_logged_date, record.last_logged_date, key)
+            record.last_logged_date = date_str
+            record.time_entry_id = time_entry_id
+            self._index_add(self.by_logged_date, date_str, key)
+            self._changed()
+            return True
+
+    # --- Queries ---
+
+    def __contains__(self, key):
+        return key in self.tasks
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def get(self, key):
+        record = self.tasks.get(key)
+        return record.to_dict() if record else None
+
+    def keys_for_issue(self, issue_id):
+        return list(self.by_issue.get(issue_id, ()))
+
+    def keys_logged_on(self, date_str):
+        return list(self.by_logged_date.get(date_str, ()))
+
+    def to_dict(self):
+        with self.lock:
+            return {key: record.to_dict() for key, record in self.tasks.items()}
+
+    def _view(self, name, build):
+        with self.lock:
+            view = self._views.get(name)
+            if view is None:
+                view = self._views[name] = build()
+                while len(self._views) > self.MAX_VIEWS:
+                    self._views.popitem(last=False)
+            else:
+                self._views.move_to_end(name)
+            return [dict(t) for t in view]
+
+    def day_view(self, date_str):
+        """Task list for one day: is_logged/time_entry_id derived from last_logged_date."""
+        def build():
+            logged = self.by_logged_date.get(date_str, {})
+            view = []
+            for key, record in self.tasks.items():
+                t = record.to_dict()
+                t['is_logged'] = key in logged
+                if not t['is_logged']:
+                    # Not logged that day: hide past entry IDs so the frontend doesn't delete them
+                    t['time_entry_id'] = None
+                t['date'] = date_str
+                view.append(t)
+            return view
+        return self._view(('day', date_str), build)
+
+    def history(self):
+        """Unique tasks by name, first stored task per name."""
+        def build():
+            return [self.tasks[next(iter(keys))].to_dict() for name, keys in self.by_name.items() if name]
+        return self._view(('history',), build)
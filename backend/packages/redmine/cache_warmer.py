@@ -0,0 +1,144 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class CacheWarmer:
+    """
+    Prefetches issue details so the common navigation paths (ProjectsView,
+    IssueDetailModal) are served from cache.
+
+    A run checks freshness of all candidates in batches (one cheap list
+    request per `batch_size` issues, comparing `updated_on`), then fetches
+    only missing/stale details with `max_workers` concurrent requests,
+    committing them to the cache in chunks. Runs never overlap (across
+    processes too, when `run_lock()` is given) and stop early when
+    `should_stop()` says Redmine is unavailable.
+    """
+
+    def __init__(self, fetch_updated_on, fetch_details, cached_updated_on, commit,
+                 should_stop=None, run_lock=None, max_workers=2, batch_size=100, commit_every=10, pause=0.05):
+        self.fetch_updated_on = fetch_updated_on        # ids -> {id: updated_on}
+        self.fetch_details = fetch_details              # id -> details dict
+        self.cached_updated_on = cached_updated_on      # () -> {id: updated_on}
+        self.commit = commit                            # [details] -> None
+        self.should_stop = should_stop or (lambda: False)
+        self.run_lock = run_lock                        # () -> context manager yielding acquired
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.commit_every = commit_every
+        self.pause = pause
+
+        self.lock = threading.Lock()
+        self.running = False
+        self.warmed = set()
+        self.last_run = None
+        self.hits = 0
+        self.misses = 0
+        self.warm_hits = 0
+
+    # --- Hit ratio accounting (called by the detail endpoint) ---
+
+    def record_hit(self, issue_id):
+        with self.lock:
+            self.hits += 1
+            if issue_id in self.warmed:
+                self.warm_hits += 1
+
+    def record_miss(self):
+        with self.lock:
+            self.misses += 1
+
+    # --- Runs ---
+
+    def start(self, candidates, reason):
+        with self.lock:
+            if self.running:
+                return False
+            self.running = True
+        threading.Thread(target=self._run, args=(list(candidates), reason), daemon=True).start()
+        return True
+
+    def _stale_ids(self, ids):
+        cached = self.cached_updated_on()
+        stale = [i for i in ids if i not in cached]
+        known = [i for i in ids if i in cached]
+        for pos in range(0, len(known), self.batch_size):
+            if self.should_stop():
+                break
+            batch = known[pos:pos + self.batch_size]
+            current = self.fetch_updated_on(batch)
+            # Missing from the response (closed/moved/no access): keep cached copy
+            stale.extend(i for i in batch if i in current and current[i] != cached[i])
+        return stale
+
+    def _fetch(self, issue_id):
+        if self.should_stop():
+            return None
+        time.sleep(self.pause)  # Yield to interactive requests
+        return self.fetch_details(issue_id)
+
+    def _run(self, candidates, reason):
+        if self.run_lock is None:
+            return self._warm(candidates, reason)
+        with self.run_lock() as acquired:
+            if acquired:
+                return self._warm(candidates, reason)
+        print(f"Cache warming ({reason}) skipped: another process is warming")
+        with self.lock:
+            self.running = False
+
+    def _warm(self, candidates, reason):
+        started = time.monotonic()
+        stats = {"reason": reason, "candidates": len(candidates), "fetched": 0, "fresh": 0, "failed": 0}
+        try:
+            ids = list(dict.fromkeys(candidates))
+            stale = self._stale_ids(ids)
+            stats["fresh"] = len(ids) - len(stale)
+
+            warmed = set(ids) - set(stale)
+            pending = []
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for issue_id, future in [(i, pool.submit(self._fetch, i)) for i in stale]:
+                    try:
+                        details = future.result()
+                    except Exception as e:
+                        print(f"Cache warm failed for issue {issue_id}: {e}")
+                        details = None
+                    if details is None:
+                        stats["failed"] += 1
+                        continue
+                    warmed.add(issue_id)
+                    pending.append(details)
+                    if len(pending) >= self.commit_every:
+                        self.commit(pending)
+                        pending = []
+            if pending:
+                self.commit(pending)
+
+            stats["fetched"] = len(stale) - stats["failed"]
+            with self.lock:
+                self.warmed.update(warmed)
+        except Exception as e:
+            print(f"Cache warming ({reason}) failed: {e}")
+            stats["error"] = str(e)
+        finally:
+            stats["duration_ms"] = round((time.monotonic() - started) * 1000)
+            stats["finished_at"] = time.time()
+            with self.lock:
+                self.last_run = stats
+                self.running = False
+            print(f"Cache warming ({reason}): {stats}")
+
+    def get_stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "running": self.running,
+                "warmed_issues": len(self.warmed),
+                "hits": self.hits,
+                "misses": self.misses,
+                "warm_hits": self.warm_hits,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+                "warm_hit_ratio": round(self.warm_hits / lookups, 3) if lookups else None,
+                "last_run": self.last_run
+            }
@@ -0,0 +1,147 @@
+import threading
+import time
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling Redmine while the circuit is open."""
+
+    def __init__(self, retry_in):
+        self.retry_in = retry_in
+        super().__init__(f"Redmine is unreachable (offline), retrying in {retry_in:.0f}s")
+
+class CircuitBreaker:
+    """
+    Tracks consecutive upstream failures and latency.
+
+    closed    - calls go through; `failure_threshold` consecutive failures open it
+    open      - calls fail fast with CircuitOpenError; after `reset_timeout` seconds
+                (doubling up to `max_reset_timeout`) a trial request is let through,
+                by the background `probe` if one is given, else by the next caller
+    half_open - the trial is in flight; a success closes the circuit
+
+    Only transport errors and 5xx responses (`failure_exceptions`) count as
+    failures. Successful calls slower than `slow_call_seconds` are reported
+    as "slow" in the status but never open the circuit: a slow Redmine is
+    still reachable.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=3, reset_timeout=10.0, max_reset_timeout=120.0,
+                 slow_call_seconds=3.0, probe=None, failure_exceptions=(Exception,)):
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.slow_call_seconds = slow_call_seconds
+        self.probe = probe
+        self.failure_exceptions = failure_exceptions
+
+        self.lock = threading.Lock()
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.reset_timeout = reset_timeout
+        self.opened_at = None
+        self.last_error = None
+        self.avg_latency = None
+        self.total_calls = 0
+        self.rejected_calls = 0
+        self.slow_calls = 0
+        self.last_slow = None
+
+    def _record_latency(self, elapsed):
+        # Exponentially weighted moving average
+        self.avg_latency = elapsed if self.avg_latency is None else 0.8 * self.avg_latency + 0.2 * elapsed
+
+    def _on_success(self, elapsed):
+        with self.lock:
+            self._record_latency(elapsed)
+            if elapsed >= self.slow_call_seconds:
+                # Slow but successful: reported, but Redmine answered
+                self.slow_calls += 1
+                self.last_slow = f"Slow response ({elapsed:.1f}s)"
+            self.consecutive_failures = 0
+            self.reset_timeout = self.base_reset_timeout
+            self.state = self.CLOSED
+            self.opened_at = None
+
+    def _on_failure(self, error, elapsed):
+        with self.lock:
+            self._record_latency(elapsed)
+            self.consecutive_failures += 1
+            self.last_error = str(error)
+            if self.state == self.HALF_OPEN:
+                self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+                self._open()
+            elif self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        # Caller holds the lock
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        print(f"Circuit breaker OPEN after {self.consecutive_failures} failures: {self.last_error}")
+        if self.probe:
+            threading.Thread(target=self._probe_later, args=(self.opened_at,), daemon=True).start()
+
+    def _probe_later(self, opened_at):
+        time.sleep(self.reset_timeout)
+        with self.lock:
+            if self.state != self.OPEN or self.opened_at != opened_at:
+                return
+            self.state = self.HALF_OPEN
+        try:
+            self._execute(self.probe)
+        except Exception:
+            pass
+        if self.state == self.CLOSED:
+            print("Circuit breaker probe succeeded, Redmine is reachable again")
+
+    def _execute(self, fn, *args, **kwargs):
+        start = time.monotonic()
+        try:
+            result = fn(*args, **kwargs)
+        except self.failure_exceptions as e:
+            self._on_failure(e, time.monotonic() - start)
+            raise
+        except Exception:
+            # Any other error (404, validation...) still proves Redmine answered
+            self._on_success(time.monotonic() - start)
+            raise
+        self._on_success(time.monotonic() - start)
+        return result
+
+    def retry_in(self):
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def call(self, fn, *args, **kwargs):
+        with self.lock:
+            self.total_calls += 1
+            if self.state == self.OPEN and not self.probe and self.retry_in() == 0:
+                self.state = self.HALF_OPEN
+            elif self.state != self.CLOSED:
+                self.rejected_calls += 1
+                raise CircuitOpenError(self.retry_in())
+        return self._execute(fn, *args, **kwargs)
+
+    @property
+    def is_open(self):
+        return self.state != self.CLOSED
+
+    def get_status(self):
+        with self.lock:
+            return {
+                "state": self.state,
+                "offline": self.state != self.CLOSED,
+                "consecutive_failures": self.consecutive_failures,
+                "avg_latency_ms": round(self.avg_latency * 1000) if self.avg_latency is not None else None,
+                "retry_in": round(self.retry_in(), 1),
+                "last_error": self.last_error,
+                "slow": self.avg_latency is not None and self.avg_latency >= self.slow_call_seconds,
+                "slow_calls": self.slow_calls,
+                "last_slow": self.last_slow,
+                "total_calls": self.total_calls,
+                "rejected_calls": self.rejected_calls
+            }
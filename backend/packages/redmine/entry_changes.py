@@ -0,0 +1,87 @@
+"""
+Change sequence for the cached time entries.
+
+Every cached entry carries the `seq` of its last insert/update, deletions
+leave a tombstone, and `time_entry_seq` only ever grows. Clients keep the
+last sequence they saw and ask for what changed since, instead of
+refetching whole date ranges. All functions work on the cache dict and are
+meant to run inside a cache transaction.
+"""
+
+SEQ_KEY = 'time_entry_seq'
+TOMBSTONES_KEY = 'time_entry_tombstones'
+FLOOR_KEY = 'time_entry_floor'  # Deletions at or below this seq were pruned
+
+MAX_TOMBSTONES = 1000
+
+def _next_seq(cache):
+    cache[SEQ_KEY] = cache.get(SEQ_KEY, 0) + 1
+    return cache[SEQ_KEY]
+
+def _content(entry):
+    return {k: v for k, v in entry.items() if k != 'seq'}
+
+def _add_tombstones(cache, ids, seq):
+    tombstones = [t for t in cache.get(TOMBSTONES_KEY, []) if t['id'] not in ids]
+    tombstones.extend({"id": i, "seq": seq} for i in ids)
+    if len(tombstones) > MAX_TOMBSTONES:
+        pruned = tombstones[:-MAX_TOMBSTONES]
+        tombstones = tombstones[-MAX_TOMBSTONES:]
+        cache[FLOOR_KEY] = max(cache.get(FLOOR_KEY, 0), max(t['seq'] for t in pruned))
+    cache[TOMBSTONES_KEY] = tombstones
+
+def _clear_tombstones(cache, ids):
+    if cache.get(TOMBSTONES_KEY):
+        cache[TOMBSTONES_KEY] = [t for t in cache[TOMBSTONES_KEY] if t['id'] not in ids]
+
+def upsert_entries(cache, entries):
+    """Insert or replace entries (by id)."""
+    if not entries:
+        return cache.get(SEQ_KEY, 0)
+    seq = _next_seq(cache)
+    ids = {e['id'] for e in entries}
+    kept = [e for e in cache.get('time_entries', []) if e['id'] not in ids]
+    cache['time_entries'] = kept + [dict(e, seq=seq) for e in entries]
+    _clear_tombstones(cache, ids)
+    return seq
+
+def delete_entries(cache, ids):
+    ids = set(ids)
+    existing = [e for e in cache.get('time_entries', []) if e['id'] in ids]
+    if not existing:
+        return cache.get(SEQ_KEY, 0)
+    seq = _next_seq(cache)
+    cache['time_entries'] = [e for e in cache['time_entries'] if e['id'] not in ids]
+    _add_tombstones(cache, {e['id'] for e in existing}, seq)
+    return seq
+
+def replace_entries(cache, entries):
+    """Replace the whole list (sync); only entries that actually differ get a new seq."""
+    old = {e['id']: e for e in cache.get('time_entries', [])}
+    new_ids = {e['id'] for e in entries}
+    changed = [e for e in entries if e['id'] not in old or _content(old[e['id']]) != _content(e)]
+    removed = set(old) - new_ids
+
+    seq = _next_seq(cache) if changed or removed else cache.get(SEQ_KEY, 0)
+    changed_ids = {e['id'] for e in changed}
+    cache['time_entries'] = [
+        dict(e, seq=seq) if e['id'] in changed_ids else dict(e, seq=old[e['id']].get('seq', 0))
+        for e in entries
+    ]
+    if removed:
+        _add_tombstones(cache, removed, seq)
+    _clear_tombstones(cache, changed_ids)
+    return seq
+
+def changes_since(cache, since=None):
+    seq = cache.get(SEQ_KEY, 0)
+    entries = cache.get('time_entries', [])
+    # No watermark, history pruned past it, or a watermark from before a cache reset: full snapshot
+    if since is None or since < cache.get(FLOOR_KEY, 0) or since > seq:
+        return {"seq": seq, "reset": True, "upserted": entries, "deleted": []}
+    return {
+        "seq": seq,
+        "reset": False,
+        "upserted": [e for e in entries if e.get('seq', 0) > since],
+        "deleted": [t['id'] for t in cache.get(TOMBSTONES_KEY, []) if t['seq'] > since]
+    }
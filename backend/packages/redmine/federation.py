@@ -0,0 +1,94 @@
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+PRIMARY_INSTANCE = 'default'
+
+def instance_slug(name):
+    # Safe for file and lock names: "Team SW" -> "team-sw"
+    return re.sub(r'[^a-z0-9_-]+', '-', str(name).strip().lower()).strip('-')
+
+class InstanceRegistry:
+    """
+    Clients for the additional Redmine instances and concurrent reads across
+    all of them.
+
+    Each instance gets one long-lived client (its own HTTP session, so
+    connections are pooled, and its own circuit breaker), rebuilt only when
+    its URL or API key changes. `fan_out()` runs a read against every
+    instance on a shared thread pool; each instance has its own deadline, so
+    a slow or unreachable server is reported as timed out instead of holding
+    up the merged response.
+    """
+
+    def __init__(self, build_client, max_workers=8, timeout=5.0):
+        self.build_client = build_client    # (url, api_key) -> client
+        self.timeout = timeout
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='federation')
+        self.lock = threading.Lock()
+        self.clients = {}                   # name -> (url, api_key, client)
+        self.stats = {}
+
+    def client(self, instance):
+        name = instance['name']
+        key = (instance.get('redmine_url'), instance.get('api_key'))
+        with self.lock:
+            cached = self.clients.get(name)
+            if cached and cached[:2] == key:
+                return cached[2]
+        client = self.build_client(*key) if all(key) else None
+        with self.lock:
+            self.clients[name] = key + (client,)
+        return client
+
+    def prune(self, names):
+        """Drop clients of instances that are no longer configured."""
+        with self.lock:
+            for name in set(self.clients) - set(names):
+                del self.clients[name]
+
+    def _count(self, name, outcome, elapsed):
+        with self.lock:
+            counters = self.stats.setdefault(name, {"ok": 0, "error": 0, "timeout": 0, "last_ms": None})
+            counters[outcome] += 1
+            if elapsed is not None:
+                counters["last_ms"] = round(elapsed * 1000)
+
+    def fan_out(self, instances, fn, timeout=None):
+        """
+        Run fn(instance) for every instance concurrently and wait for each
+        until its own deadline (`timeout`, else the instance's `timeout`,
+        else the registry default), measured from the start of the call.
+
+        Returns ({name: result}, {name: {"status": "ok"|"error"|"timeout", ...}});
+        instances that failed or timed out have no result. A timed-out read
+        keeps running in the background and its result is discarded.
+        """
+        started = time.monotonic()
+
+        def timed(instance):
+            t0 = time.monotonic()
+            result = fn(instance)
+            return result, time.monotonic() - t0
+
+        futures = [(instance, self.pool.submit(timed, instance)) for instance in instances]
+        results, status = {}, {}
+        for instance, future in futures:
+            name = instance['name']
+            deadline = timeout or instance.get('timeout') or self.timeout
+            try:
+                results[name], elapsed = future.result(timeout=max(0, deadline - (time.monotonic() - started)))
+                status[name] = {"status": "ok", "elapsed_ms": round(elapsed * 1000)}
+                self._count(name, "ok", elapsed)
+            except FutureTimeout:
+                status[name] = {"status": "timeout", "timeout_sec": deadline}
+                self._count(name, "timeout", None)
+            except Exception as e:
+                status[name] = {"status": "error", "error": str(e)}
+                self._count(name, "error", time.monotonic() - started)
+        return results, status
+
+    def get_stats(self):
+        with self.lock:
+            return {name: dict(counters) for name, counters in self.stats.items()}
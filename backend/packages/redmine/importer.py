@@ -0,0 +1,257 @@
+import asyncio
+import csv
+import json
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+# Accepted column names -> field
+COLUMNS = {
+    'spent_on': 'spent_on', 'date': 'spent_on',
+    'hours': 'hours',
+    'activity': 'activity', 'activity_id': 'activity',
+    'project': 'project', 'project_id': 'project',
+    'issue': 'issue', 'issue_id': 'issue',
+    'comments': 'comments', 'comment': 'comments',
+    'rd_function_team': 'rd_function_team',
+    'start_time': 'start_time',
+}
+
+class RowParser:
+    """
+    Incremental CSV (header row required) / NDJSON parser: `feed()` takes
+    decoded text as it arrives and returns the complete rows so far, as
+    (line_no, dict) pairs, so uploads are never buffered whole.
+    """
+
+    def __init__(self, fmt):
+        if fmt not in ('csv', 'ndjson'):
+            raise ValueError(f"Unsupported import format '{fmt}' (csv or ndjson)")
+        self.fmt = fmt
+        self.buffer = ""
+        self.record = ""
+        self.header = None
+        self.line_no = 0
+
+    def feed(self, text):
+        self.buffer += text
+        *lines, self.buffer = self.buffer.split("\n")
+        return [row for row in map(self._line, lines) if row]
+
+    def finish(self):
+        rows = [row for row in [self._line(self.buffer)] if row] if self.buffer else []
+        self.buffer = ""
+        if self.record:
+            raise ValueError(f"Unterminated quoted field starting before line {self.line_no}")
+        return rows
+
+    def _line(self, line):
+        self.line_no += 1
+        line = line.rstrip("\r")
+        if self.fmt == 'ndjson':
+            if not line.strip():
+                return None
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                return (self.line_no, {"__error__": f"Invalid JSON: {e}"})
+            if not isinstance(data, dict):
+                return (self.line_no, {"__error__": "Each line must be a JSON object"})
+            return (self.line_no, data)
+
+        # CSV: a quoted field may span lines; wait until the quotes balance
+        self.record = f"{self.record}\n{line}" if self.record else line
+        if self.record.count('"') % 2:
+            return None
+        record, self.record = self.record, ""
+        if not record.strip():
+            return None
+        values = next(csv.reader([record]))
+        if self.header is None:
+            self.header = [v.strip().lower() for v in values]
+            unknown = [h for h in self.header if h not in COLUMNS]
+            if unknown:
+                raise ValueError(f"Unknown CSV columns: {', '.join(unknown)}")
+            return None
+        return (self.line_no, dict(zip(self.header, values)))
+
+class RowValidator:
+    """
+    Checks import rows against locally cached data (projects, issues,
+    activities) and turns them into time entry payloads, so invalid rows
+    are rejected without a Redmine round trip.
+    """
+
+    def __init__(self, projects, issues, activities, rd_function_team_field):
+        self.projects_by_id = {p['id']: p for p in projects}
+        self.projects_by_name = {p['name'].strip().lower(): p for p in projects}
+        self.issues = issues                      # {issue_id: project_id or None}
+        self.activities_by_id = dict(activities)  # {id: name}
+        self.activities_by_name = {name.strip().lower(): i for i, name in activities.items()}
+        self.rd_function_team_field = rd_function_team_field
+
+    def validate(self, raw):
+        if '__error__' in raw:
+            return None, [raw['__error__']], []
+        row = {}
+        for key, value in raw.items():
+            field = COLUMNS.get(str(key).strip().lower())
+            if field and value not in (None, ""):
+                row[field] = value.strip() if isinstance(value, str) else value
+
+        errors, warnings = [], []
+        payload = {}
+
+        try:
+            payload['spent_on'] = str(date.fromisoformat(str(row.get('spent_on', ''))))
+        except ValueError:
+            errors.append("spent_on must be a YYYY-MM-DD date")
+
+        try:
+            hours = float(row.get('hours'))
+            if not 0 < hours <= 24:
+                raise ValueError
+            payload['hours'] = hours
+        except (TypeError, ValueError):
+            errors.append("hours must be a number between 0 and 24")
+
+        activity = row.get('activity')
+        activity_id = self._lookup(activity, self.activities_by_id, self.activities_by_name)
+        if activity_id is None:
+            errors.append(f"Unknown activity '{activity}'" if activity else "activity is required")
+        payload['activity_id'] = activity_id
+
+        project = row.get('project')
+        project_id = None
+        if project is not None:
+            found = self._lookup(project, self.projects_by_id, self.projects_by_name)
+            if found is None:
+                errors.append(f"Unknown project '{project}'")
+            else:
+                project_id = found if isinstance(found, int) else found['id']
+
+        issue = row.get('issue')
+        if issue is not None:
+            try:
+                issue_id = int(str(issue).lstrip('#'))
+            except ValueError:
+                errors.append(f"Invalid issue '{issue}'")
+            else:
+                payload['issue_id'] = issue_id
+                if issue_id not in self.issues:
+                    warnings.append(f"Issue #{issue_id} is not cached locally; Redmine will validate it")
+                elif project_id and self.issues[issue_id] and self.issues[issue_id] != project_id:
+                    errors.append(f"Issue #{issue_id} does not belong to project '{project}'")
+        elif project_id:
+            payload['project_id'] = project_id
+        elif project is None:
+            errors.append("issue or project is required")
+
+        payload['comments'] = str(row.get('comments', ''))
+        payload['custom_fields'] = [{'id': self.rd_function_team_field, 'value': row.get('rd_function_team') or 'N/A'}]
+        if row.get('start_time'):
+            if re.fullmatch(r"\d{2}:\d{2}(:\d{2})?", str(row['start_time'])):
+                payload['start_time'] = str(row['start_time'])
+            else:
+                errors.append("start_time must be HH:MM")
+        return (None if errors else payload), errors, warnings
+
+    @staticmethod
+    def _lookup(value, by_id, by_name):
+        if value is None:
+            return None
+        try:
+            key = int(value)
+            return key if key in by_id else None
+        except (TypeError, ValueError):
+            pass
+        return by_name.get(str(value).strip().lower())
+
+class TimeEntryImporter:
+    """
+    Validates rows as they are parsed and submits valid ones through a
+    bounded pipeline: at most `concurrency` creates are in flight, and the
+    reader waits for the oldest one when the pipeline is full. Results come
+    out in input order via `results()`. With `dry_run`, rows are only
+    validated.
+
+    Every entry Redmine created is kept in `created` as soon as its create
+    returns, whether or not its result was streamed out; `finish()` waits
+    for the creates still in flight, so a client that disconnects midway
+    still gets all of them committed to the cache.
+    """
+
+    def __init__(self, validator, submit, concurrency=4, dry_run=False):
+        self.validator = validator
+        self.submit = submit              # payload -> created entry dict (blocking)
+        self.concurrency = concurrency
+        self.dry_run = dry_run
+        self.pool = None if dry_run else ThreadPoolExecutor(max_workers=concurrency)
+        self.pending = deque()            # (line_no, warnings, future or finished result)
+        self.ready = deque()
+        self.created = []
+        self.created_lock = threading.Lock()
+        self.counts = {"rows": 0, "created": 0, "valid": 0, "invalid": 0, "failed": 0}
+
+    async def add(self, line_no, raw):
+        self.counts["rows"] += 1
+        payload, errors, warnings = self.validator.validate(raw)
+        if errors:
+            self._done({"line": line_no, "status": "invalid", "errors": errors, "warnings": warnings})
+            return
+        if self.dry_run:
+            self._done({"line": line_no, "status": "valid", "warnings": warnings})
+            return
+
+        future = asyncio.wrap_future(self.pool.submit(self._submit, payload))
+        self.pending.append((line_no, warnings, future))
+        while len(self.pending) >= self.concurrency:
+            await self._collect_oldest()
+
+    def _submit(self, payload):
+        entry = self.submit(payload)
+        with self.created_lock:
+            self.created.append(entry)
+        return entry
+
+    def finish(self):
+        """Blocking: wait for in-flight creates, then return every created entry."""
+        if self.pool:
+            self.pool.shutdown(wait=True)
+        with self.created_lock:
+            return list(self.created)
+
+    def _done(self, result):
+        if self.pending:
+            # Keep input order behind rows still in flight
+            self.pending.append((result["line"], None, result))
+        else:
+            self.ready.append(result)
+        self.counts[result["status"]] += 1
+
+    async def _collect_oldest(self):
+        line_no, warnings, item = self.pending.popleft()
+        if isinstance(item, dict):
+            self.ready.append(item)
+            return
+        try:
+            entry = await item
+            result = {"line": line_no, "status": "created", "id": entry['id'], "warnings": warnings}
+        except Exception as e:
+            result = {"line": line_no, "status": "failed", "errors": [str(e)], "warnings": warnings}
+        self.counts[result["status"]] += 1
+        self.ready.append(result)
+
+    async def results(self):
+        """Everything left: finished rows first, then in-flight rows as they complete."""
+        try:
+            while self.ready or self.pending:
+                while self.ready:
+                    yield self.ready.popleft()
+                if self.pending:
+                    await self._collect_oldest()
+        finally:
+            if self.pool:
+                self.pool.shutdown(wait=False)
@@ -0,0 +1,181 @@
+import os
+import re
+import threading
+import time
+
+import yaml
+
+from packages.storage.shared_state import write_atomic
+
+# Hardcoded mapping as per user request; used until the enumeration is fetched
+DEFAULT_ACTIVITIES = {
+    20: "Study Spec",
+    8: "Design",
+    9: "Development",
+    10: "Validation",
+    71: "Maintain",
+    14: "Others",
+    61: "Support",
+    73: "Preparing automation scripts",
+    74: "Regression tests",
+    75: "Setup test bed",
+    76: "Study/Prepare test cases",
+    77: "Debug session",
+    78: "Code Review",
+    72: "RFI/ RFQ",
+    62: "SCM review"
+}
+
+# Custom fields we write, with the IDs used before they could be resolved by name
+DEFAULT_CUSTOM_FIELDS = {
+    'rd_function_team': 93,
+}
+
+def _key(name):
+    return re.sub(r"[^a-z0-9]+", "_", str(name).lower()).strip("_")
+
+class MetadataRegistry:
+    """
+    Redmine enumerations (time-entry activities, issue priorities, issue
+    statuses, custom-field definitions) loaded once, persisted with a schema
+    version and revalidated in the background with ETags on a long TTL.
+
+    Lookups are served from memory only, so no endpoint ever fetches
+    metadata inline; until the first fetch completes the defaults above apply.
+    """
+
+    VERSION = 1
+
+    # name: (API path, response container)
+    SOURCES = {
+        'activities': ('enumerations/time_entry_activities.json', 'time_entry_activities'),
+        'priorities': ('enumerations/issue_priorities.json', 'issue_priorities'),
+        'statuses': ('issue_statuses.json', 'issue_statuses'),
+        'custom_fields': ('custom_fields.json', 'custom_fields'),  # Admin only; may be 403
+    }
+
+    def __init__(self, path, ttl=24 * 3600, on_save=None):
+        self.path = path
+        self.ttl = ttl
+        self.on_save = on_save  # Lets other processes know the file changed
+        self.lock = threading.Lock()
+        self.refreshing = False
+        self.data = {"version": self.VERSION, "revision": 0, "fetched_at": 0, "sources": {}}
+        self.by_id = {}
+        self.by_name = {}
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    data = yaml.safe_load(f) or {}
+                if data.get('version') == self.VERSION:
+                    self.data = data
+                else:
+                    print(f"Metadata cache version {data.get('version')} is outdated, refetching")
+            except Exception as e:
+                print(f"Error loading metadata: {e}")
+        self._build_lookups()
+
+    def save(self):
+        write_atomic(self.path, lambda f: yaml.dump(self.data, f))
+        if self.on_save:
+            self.on_save()
+
+    def _build_lookups(self):
+        by_id, by_name = {}, {}
+        for name in self.SOURCES:
+            items = self.data['sources'].get(name, {}).get('items', [])
+            by_id[name] = {item['id']: item for item in items}
+            by_name[name] = {_key(item['name']): item for item in items}
+        # Swap in one step so readers never see a half-built index
+        self.by_id, self.by_name = by_id, by_name
+
+    def is_stale(self):
+        return time.time() - self.data.get('fetched_at', 0) > self.ttl
+
+    def refresh(self, fetch_json):
+        """
+        fetch_json(path, etag) -> (status, data, etag); status 304 keeps the
+        stored items. Sources that fail or are forbidden keep their last value.
+        """
+        changed = False
+        answered = False
+        updates = {}
+        # Fetch outside the lock; readers keep using the current sources meanwhile
+        for name, (path, container) in self.SOURCES.items():
+            with self.lock:
+                source = self.data['sources'].get(name, {})
+            try:
+                status, payload, etag = fetch_json(path, source.get('etag'))
+            except Exception as e:
+                print(f"Metadata fetch failed for {name}: {e}")
+                continue
+            answered = True
+            if status == 200 and payload is not None:
+                items = payload.get(container, [])
+                if items != source.get('items'):
+                    changed = True
+                updates[name] = {"etag": etag, "items": items}
+            elif status != 304:
+                print(f"Metadata source {name} unavailable (HTTP {status}), keeping cached values")
+
+        with self.lock:
+            self.data['sources'].update(updates)
+            if changed:
+                self.data['revision'] = self.data.get('revision', 0) + 1
+            if answered:
+                # Unreachable Redmine: stay stale so the next request retries
+                self.data['fetched_at'] = time.time()
+            self._build_lookups()
+            self.save()
+        return changed
+
+    def refresh_in_background(self, fetch_json):
+        with self.lock:
+            if self.refreshing:
+                return
+            self.refreshing = True
+
+        def run():
+            try:
+                self.refresh(fetch_json)
+            finally:
+                self.refreshing = False
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def ensure_fresh(self, fetch_json):
+        if self.is_stale():
+            self.refresh_in_background(fetch_json)
+
+    # --- Lookups ---
+
+    def activities(self):
+        items = self.by_id.get('activities')
+        if not items:
+            return dict(DEFAULT_ACTIVITIES)
+        return {i: item['name'] for i, item in items.items() if item.get('active', True)}
+
+    def activity_id(self, name, default=None):
+        item = self.by_name.get('activities', {}).get(_key(name))
+        if item:
+            return item['id']
+        return next((i for i, n in DEFAULT_ACTIVITIES.items() if _key(n) == _key(name)), default)
+
+    def custom_field_id(self, key):
+        item = self.by_name.get('custom_fields', {}).get(_key(key))
+        return item['id'] if item else DEFAULT_CUSTOM_FIELDS.get(key)
+
+    def summary(self):
+        return {
+            "version": self.data.get('version'),
+            "revision": self.data.get('revision', 0),
+            "fetched_at": self.data.get('fetched_at', 0),
+            "stale": self.is_stale(),
+            "activities": self.activities(),
+            "statuses": {i: item['name'] for i, item in self.by_id.get('statuses', {}).items()},
+            "priorities": {i: item['name'] for i, item in self.by_id.get('priorities', {}).items()},
+            "custom_fields": {key: self.custom_field_id(key) for key in DEFAULT_CUSTOM_FIELDS}
+        }
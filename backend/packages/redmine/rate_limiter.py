@@ -0,0 +1,69 @@
+import threading
+import time
+
+class RateLimiter:
+    """
+    Token bucket for writes to Redmine: at most `rate` calls per second on
+    average, with bursts of up to `burst`. `acquire()` blocks until a token
+    is available, so batch submissions (auto-log, bulk logging) are spread
+    out instead of hitting Redmine all at once.
+
+    With `shared` (a SharedState) the bucket is kept in the shared database
+    under `name`, so the limit holds across all backend processes instead
+    of per process.
+    """
+
+    def __init__(self, rate=2.0, burst=4, shared=None, name='upstream_write'):
+        self.rate = rate
+        self.burst = burst
+        self.shared = shared
+        self.name = name
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+        self.acquired = 0
+        self.waited = 0.0
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _take(self):
+        # 0 if a token was taken, else the seconds to wait before trying again
+        if self.shared is not None:
+            return self.shared.take_token(self.name, self.rate, self.burst)
+        with self.lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Take one token, sleeping as long as needed; returns the seconds waited."""
+        waited = 0.0
+        while True:
+            delay = self._take()
+            if not delay:
+                with self.lock:
+                    self.acquired += 1
+                    self.waited += waited
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    def get_stats(self):
+        with self.lock:
+            if self.shared is not None:
+                available = self.shared.tokens(self.name, self.rate, self.burst)
+            else:
+                self._refill(time.monotonic())
+                available = self.tokens
+            return {
+                "rate_per_sec": self.rate,
+                "burst": self.burst,
+                "shared": self.shared is not None,
+                "available": round(available, 2),
+                "acquired": self.acquired,
+                "waited_sec": round(self.waited, 2)
+            }
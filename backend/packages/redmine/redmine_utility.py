@@ -1,32 +1,64 @@
+import requests
 from redminelib import Redmine as RedmineLib
+from redminelib import exceptions as redmine_exceptions
+from redminelib.engines.sync import SyncEngine
+
+from .circuit_breaker import CircuitBreaker
+
+class BreakerEngine(SyncEngine):
+    """Sync engine that routes every HTTP request through a CircuitBreaker."""
+
+    def __init__(self, **options):
+        self.breaker = options.pop('breaker')
+        super().__init__(**options)
+
+    def request(self, method, url, headers=None, params=None, data=None):
+        return self.breaker.call(super().request, method, url, headers=headers, params=params, data=data)
+
+    def probe(self, url):
+        # Bypasses the breaker; used by the breaker itself while half-open
+        return super().request('get', url)
 
 class Redmine:
     def __init__(self, api_key, url='https://redmine.sw.ciot.work'):
         self.url = url
         self.api_key = api_key
+        # Fail fast while Redmine is unreachable instead of waiting on every timeout
+        self.breaker = CircuitBreaker(
+            probe=self._probe,
+            failure_exceptions=(requests.exceptions.RequestException, redmine_exceptions.ServerError)
+        )
         # Add timeout to prevent hanging
-        self.redmine = RedmineLib(url, key=api_key, requests={'timeout': 5})
-        self.activity_map = self._get_activity_map()
-
-    def _get_activity_map(self):
-        # Hardcoded mapping as per user request
-        return {
-            20: "Study Spec",
-            8: "Design",
-            9: "Development",
-            10: "Validation",
-            71: "Maintain",
-            14: "Others",
-            61: "Support",
-            73: "Preparing automation scripts",
-            74: "Regression tests",
-            75: "Setup test bed",
-            76: "Study/Prepare test cases",
-            77: "Debug session",
-            78: "Code Review",
-            72: "RFI/ RFQ",
-            62: "SCM review"
-        }
+        self.redmine = RedmineLib(url, key=api_key, requests={'timeout': 5}, engine=BreakerEngine, breaker=self.breaker)
+
+    def _probe(self):
+        return self.redmine.engine.probe(f"{self.redmine.url}/users/current.json")
+
+    @property
+    def offline(self):
+        return self.breaker.is_open
+
+    def get_json(self, path, etag=None):
+        """
+        Conditional GET of a raw API path, e.g. 'issue_statuses.json'.
+        Returns (status_code, json or None, etag).
+        """
+        engine = self.redmine.engine
+        headers = {'If-None-Match': etag} if etag else {}
+
+        def do_get():
+            res = engine.session.get(f"{self.redmine.url}/{path}", headers=headers,
+                                     timeout=engine.requests.get('timeout', 5))
+            if res.status_code >= 500:
+                raise redmine_exceptions.ServerError
+            return res
+
+        res = self.breaker.call(do_get)
+        if res.status_code == 304:
+            return 304, None, etag
+        if res.status_code != 200:
+            return res.status_code, None, None
+        return 200, res.json(), res.headers.get('ETag')
 
     def get_time_entries(self, user_id='me', from_date=None, to_date=None, limit=100):
         filters = {'user_id': user_id, 'limit': limit}
@@ -0,0 +1,64 @@
+import threading
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent upstream calls.
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait and share its result (or exception) instead of issuing
+    a duplicate Redmine request.
+
+    Keys are tuples whose first element names the upstream call,
+    e.g. ('issue.journals', 123); stats are grouped by that name.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.stats = {}
+
+    def _count(self, name, field):
+        counters = self.stats.setdefault(name, {"calls": 0, "executions": 0, "coalesced": 0})
+        counters["calls"] += 1
+        counters[field] += 1
+
+    def do(self, key, fn):
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self.calls[key] = call
+            self._count(key[0], "executions" if leader else "coalesced")
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+
+    def get_stats(self):
+        with self.lock:
+            per_call = {name: dict(counters) for name, counters in self.stats.items()}
+            in_flight = len(self.calls)
+        return {
+            "in_flight": in_flight,
+            "saved_calls": sum(c["coalesced"] for c in per_call.values()),
+            "calls": per_call
+        }
@@ -0,0 +1,124 @@
+import html
+import re
+
+# Covers the subset of Redmine textile / markdown (CommonMark) that shows up
+# in issue descriptions and notes. Input is HTML-escaped first, so the
+# output is safe to inject into the page.
+
+_CODE_BLOCK_RE = re.compile(r"(?:<pre>(?:<code[^>]*>)?|```[^\n]*\n|~~~[^\n]*\n)(.*?)(?:(?:</code>)?</pre>|\n?```|\n?~~~)", re.S)
+_HEADING_RE = re.compile(r"^(?:h([1-6])\.\s+|(#{1,6})\s+)(.*)$")
+_LIST_RE = re.compile(r"^\s*(?:([*\-+]|#)\s+|(\d+)\.\s+)(.*)$")
+_QUOTE_RE = re.compile(r"^(?:&gt;\s?|bq\.\s+)(.*)$")
+_TEXTILE_ITEM_RE = re.compile(r"^#\s+\S")
+
+# Links and code spans are rendered first and set aside, so the emphasis
+# rules below never reach into a URL, an e-mail address or code
+_PROTECTED_RULES = [
+    (re.compile(r"`([^`]+)`"), r"<code>\1</code>"),
+    (re.compile(r"\[([^\]]+)\]\((https?://[^)\s]+)\)"), r'<a href="\2" target="_blank">\1</a>'),
+    (re.compile(r"&quot;([^&]+?)&quot;:(https?://[^\s<\x00\x01]+)"), r'<a href="\2" target="_blank">\1</a>'),
+    (re.compile(r"\b(https?://[^\s<\x00\x01]+)"), r'<a href="\1" target="_blank">\1</a>'),
+    (re.compile(r"\b([\w.+-]+@[\w-]+(?:\.[\w-]+)+)\b"), r'<a href="mailto:\1">\1</a>'),
+    (re.compile(r"(?<![\w@])@([^@\s][^@]*?)@(?![\w@])"), r"<code>\1</code>"),
+]
+
+_INLINE_RULES = [
+    (re.compile(r"\*\*([^*]+)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"(?<![\w*])\*([^*\s][^*]*?)\*(?![\w*])"), r"<strong>\1</strong>"),
+    (re.compile(r"(?<![\w_])_([^_\s][^_]*?)_(?![\w_])"), r"<em>\1</em>"),
+    (re.compile(r"(?<![\w-])-([^-\s][^-]*?)-(?![\w-])"), r"<del>\1</del>"),
+]
+
+_SPAN_RE = re.compile(r"\x01(\d+)\x01")
+
+def _inline(text):
+    spans = []
+    def stash(repl):
+        def sub(match):
+            spans.append(match.expand(repl))
+            return f"\x01{len(spans) - 1}\x01"
+        return sub
+    for pattern, repl in _PROTECTED_RULES:
+        text = pattern.sub(stash(repl), text)
+    for pattern, repl in _INLINE_RULES:
+        text = pattern.sub(repl, text)
+    return _SPAN_RE.sub(lambda m: spans[int(m.group(1))], text)
+
+def render_text(text):
+    """Render Redmine textile/markdown to a small, safe HTML fragment."""
+    if not text:
+        return ""
+    text = str(text).replace("\r\n", "\n")
+
+    # Pull code blocks out before escaping/inline rules touch them
+    blocks = []
+    def stash(match):
+        blocks.append("<pre><code>%s</code></pre>" % html.escape(match.group(1)))
+        return f"\x00{len(blocks) - 1}\x00"
+    text = _CODE_BLOCK_RE.sub(stash, text)
+
+    out = []
+    list_tag = None
+    paragraph = []
+
+    def flush_paragraph():
+        if paragraph:
+            out.append("<p>%s</p>" % "<br>".join(_inline(line) for line in paragraph))
+            paragraph.clear()
+
+    def close_list():
+        nonlocal list_tag
+        if list_tag:
+            out.append(f"</{list_tag}>")
+            list_tag = None
+
+    lines = text.split("\n")
+    # "# item" is a markdown h1 but also a textile numbered list item; a run of
+    # two or more such lines is read as a list, a single one as a heading
+    hashed = [bool(_TEXTILE_ITEM_RE.match(raw)) for raw in lines]
+    list_items = {
+        i for i, flag in enumerate(hashed)
+        if flag and ((i > 0 and hashed[i - 1]) or (i + 1 < len(hashed) and hashed[i + 1]))
+    }
+
+    for i, raw in enumerate(lines):
+        line = html.escape(raw.rstrip())
+
+        if re.fullmatch(r"\x00\d+\x00", line):
+            flush_paragraph(); close_list()
+            out.append(blocks[int(line.strip("\x00"))])
+            continue
+        if not line.strip():
+            flush_paragraph(); close_list()
+            continue
+
+        heading = _HEADING_RE.match(line) if i not in list_items else None
+        if heading:
+            flush_paragraph(); close_list()
+            level = heading.group(1) or len(heading.group(2))
+            out.append(f"<h{level}>{_inline(heading.group(3))}</h{level}>")
+            continue
+
+        item = _LIST_RE.match(line)
+        if item:
+            flush_paragraph()
+            tag = "ol" if item.group(1) == "#" or item.group(2) else "ul"
+            if list_tag != tag:
+                close_list()
+                out.append(f"<{tag}>")
+                list_tag = tag
+            out.append(f"<li>{_inline(item.group(3))}</li>")
+            continue
+
+        quote = _QUOTE_RE.match(line)
+        if quote:
+            flush_paragraph(); close_list()
+            out.append(f"<blockquote>{_inline(quote.group(1))}</blockquote>")
+            continue
+
+        close_list()
+        paragraph.append(line)
+
+    flush_paragraph(); close_list()
+    # Inline code blocks that were not on their own line
+    return re.sub(r"\x00(\d+)\x00", lambda m: blocks[int(m.group(1))], "".join(out))
@@ -0,0 +1,146 @@
+import re
+import sqlite3
+import threading
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+class FullTextIndex:
+    """
+    SQLite FTS5 index over cached issue subjects/descriptions, journal notes
+    and time-entry comments. Updated incrementally as records are cached, so
+    searches are answered locally without querying Redmine.
+    """
+
+    # bm25 column weights: title matches rank above body matches
+    TITLE_WEIGHT = 5.0
+    BODY_WEIGHT = 1.0
+
+    # Bumped when the indexed documents change shape; an older index is
+    # emptied on open and reseeded from the cache
+    FORMAT = 2
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        # WAL + busy timeout: several backend processes may index concurrently
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS docs (
+                id INTEGER PRIMARY KEY,
+                kind TEXT NOT NULL,
+                ref TEXT NOT NULL,
+                issue_id INTEGER,
+                project TEXT,
+                UNIQUE (kind, ref)
+            );
+            CREATE INDEX IF NOT EXISTS docs_issue ON docs (issue_id, kind);
+            CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5 (
+                title, body, tokenize = 'unicode61 remove_diacritics 2'
+            );
+        """)
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < self.FORMAT:
+            self.conn.execute("DELETE FROM docs_fts")
+            self.conn.execute("DELETE FROM docs")
+            self.conn.execute(f"PRAGMA user_version = {self.FORMAT}")
+        self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def is_empty(self):
+        with self.lock:
+            return self.conn.execute("SELECT 1 FROM docs LIMIT 1").fetchone() is None
+
+    def _upsert(self, kind, ref, issue_id, project, title, body):
+        row = self.conn.execute("SELECT id FROM docs WHERE kind = ? AND ref = ?", (kind, ref)).fetchone()
+        if row:
+            doc_id = row[0]
+            self.conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (doc_id,))
+            self.conn.execute("UPDATE docs SET issue_id = ?, project = ? WHERE id = ?", (issue_id, project, doc_id))
+        else:
+            doc_id = self.conn.execute(
+                "INSERT INTO docs (kind, ref, issue_id, project) VALUES (?, ?, ?, ?)",
+                (kind, ref, issue_id, project)
+            ).lastrowid
+        self.conn.execute("INSERT INTO docs_fts (rowid, title, body) VALUES (?, ?, ?)",
+                          (doc_id, title or "", body or ""))
+
+    def _delete_where(self, clause, params):
+        ids = [r[0] for r in self.conn.execute(f"SELECT id FROM docs WHERE {clause}", params)]
+        for doc_id in ids:
+            self.conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (doc_id,))
+        self.conn.execute(f"DELETE FROM docs WHERE {clause}", params)
+
+    def index_issue(self, issue_id, subject, description=None, project=None, journals=None):
+        """Index an issue; when journals are given they replace the issue's indexed notes."""
+        with self.lock:
+            self._upsert('issue', str(issue_id), issue_id, project, f"#{issue_id} {subject or ''}", description)
+            if journals is not None:
+                self._delete_where("kind = 'journal' AND issue_id = ?", (issue_id,))
+                for pos, j in enumerate(journals):
+                    if not j.get('notes'):
+                        continue
+                    ref = f"{issue_id}:{j.get('id', pos)}"
+                    # The subject is only indexed on the issue itself, so a subject
+                    # search finds the issue instead of every note on it
+                    self._upsert('journal', ref, issue_id, project, f"#{issue_id} ({j.get('user', '')})", j['notes'])
+            self.conn.commit()
+
+    def index_time_entries(self, entries, replace=False):
+        with self.lock:
+            if replace:
+                self._delete_where("kind = 'time_entry'", ())
+            for e in entries:
+                title = f"{e.get('spent_on', '')} {e.get('project', '')} {e.get('activity', '')}"
+                self._upsert('time_entry', str(e['id']), e.get('issue'), e.get('project'), title, e.get('comments'))
+            self.conn.commit()
+
+    def remove(self, kind, ref):
+        with self.lock:
+            self._delete_where("kind = ? AND ref = ?", (kind, str(ref)))
+            self.conn.commit()
+
+    @staticmethod
+    def build_query(text):
+        # Quote every token (no FTS syntax injection) and prefix-match the last one
+        tokens = _TOKEN_RE.findall(text or "")
+        if not tokens:
+            return None
+        terms = ['"%s"' % t for t in tokens[:-1]]
+        terms.append('"%s"*' % tokens[-1])
+        return " ".join(terms)
+
+    def search(self, text, limit=20, kinds=None):
+        query = self.build_query(text)
+        if not query:
+            return []
+
+        sql = f"""
+            SELECT d.kind, d.ref, d.issue_id, d.project,
+                   highlight(docs_fts, 0, '<mark>', '</mark>'),
+                   snippet(docs_fts, 1, '<mark>', '</mark>', '…', 12),
+                   bm25(docs_fts, {self.TITLE_WEIGHT}, {self.BODY_WEIGHT}) AS rank
+            FROM docs_fts JOIN docs d ON d.id = docs_fts.rowid
+            WHERE docs_fts MATCH ?
+        """
+        params = [query]
+        if kinds:
+            sql += " AND d.kind IN (%s)" % ",".join("?" * len(kinds))
+            params.extend(kinds)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+
+        return [{
+            "kind": kind,
+            "ref": ref,
+            "issue_id": issue_id,
+            "project": project,
+            "title": title,
+            "snippet": snippet,
+            "score": -rank  # bm25 is lower-is-better; higher-is-better here
+        } for kind, ref, issue_id, project, title, snippet, rank in rows]
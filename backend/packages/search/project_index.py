@@ -0,0 +1,111 @@
+import heapq
+import re
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+def _normalize(text):
+    return " ".join(_WORD_RE.findall(str(text or "").lower()))
+
+def _trigrams(text):
+    # Pad so that short names and word starts still produce trigrams
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class ProjectIndex:
+    """
+    Prefix/trigram index over the cached project list.
+    Built once whenever the projects cache is refreshed so that project
+    pickers can query it per keystroke instead of downloading the catalog.
+    """
+
+    MAX_PREFIX = 8
+
+    def __init__(self, projects=None, recent=None):
+        self.projects = []
+        self.names = []
+        self.prefixes = {}
+        self.trigrams = {}
+        self.recent = {}
+        self.build(projects or [], recent)
+
+    def build(self, projects, recent=None):
+        self.projects = [{"id": p['id'], "name": p['name']} for p in projects]
+        self.names = [_normalize(p['name']) for p in self.projects]
+        self.prefixes = {}
+        self.trigrams = {}
+
+        for pos, name in enumerate(self.names):
+            for word in name.split():
+                for size in range(1, min(len(word), self.MAX_PREFIX) + 1):
+                    self.prefixes.setdefault(word[:size], set()).add(pos)
+            for gram in _trigrams(name):
+                self.trigrams.setdefault(gram, set()).add(pos)
+
+        self.set_recent(recent)
+
+    def set_recent(self, recent):
+        # recent: {project_id: weight}, weight in 0..1 (1 = most recently used)
+        self.recent = dict(recent or {})
+
+    def __len__(self):
+        return len(self.projects)
+
+    def _candidates(self, query):
+        words = query.split()
+        candidates = None
+        for word in words:
+            matches = self.prefixes.get(word[:self.MAX_PREFIX], set())
+            candidates = set(matches) if candidates is None else candidates & matches
+
+        if candidates and len(query) < 3:
+            return candidates, {}
+
+        # Fuzzy fallback: any project sharing trigrams with the query
+        gram_hits = {}
+        for gram in _trigrams(query):
+            for pos in self.trigrams.get(gram, ()):
+                gram_hits[pos] = gram_hits.get(pos, 0) + 1
+        return (candidates or set()) | set(gram_hits), gram_hits
+
+    def _score(self, pos, query, query_grams, gram_hits):
+        name = self.names[pos]
+        if name == query:
+            score = 100.0
+        elif name.startswith(query):
+            score = 80.0
+        elif all(any(w.startswith(q) for w in name.split()) for q in query.split()):
+            score = 60.0
+        elif query in name:
+            score = 40.0
+        else:
+            # Fraction of the query's trigrams found in the name (typo tolerant)
+            score = 35.0 * gram_hits.get(pos, 0) / len(query_grams)
+        # Shorter names win ties (closer to what was typed)
+        score -= len(name) / 1000.0
+        return score
+
+    def search(self, q, limit=20, min_score=15.0):
+        query = _normalize(q)
+        if not query:
+            # Empty query: most recently used projects first
+            ranked = sorted(
+                (pos for pos, p in enumerate(self.projects) if p['id'] in self.recent),
+                key=lambda pos: -self.recent[self.projects[pos]['id']]
+            )
+            return [dict(self.projects[pos], score=round(self.recent[self.projects[pos]['id']] * 25, 2), recent=True)
+                    for pos in ranked[:limit]]
+
+        candidates, gram_hits = self._candidates(query)
+        query_grams = _trigrams(query)
+
+        scored = []
+        for pos in candidates:
+            score = self._score(pos, query, query_grams, gram_hits)
+            if score < min_score:
+                continue
+            boost = self.recent.get(self.projects[pos]['id'], 0)
+            scored.append((score + 25.0 * boost, pos))
+
+        top = heapq.nlargest(limit, scored)
+        return [dict(self.projects[pos], score=round(score, 2), recent=self.projects[pos]['id'] in self.recent)
+                for score, pos in top]
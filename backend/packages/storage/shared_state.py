@@ -0,0 +1,182 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+def _try_lock(f):
+    try:
+        if os.name == 'nt':
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+def _unlock(f):
+    if os.name == 'nt':
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+def write_atomic(path, write, retries=10, backoff=0.01):
+    """
+    Write via a per-process temp file and rename, so readers never see a torn file.
+
+    On Windows the rename fails with PermissionError while another process
+    has `path` open; readers only hold it briefly, so the rename is retried
+    with a short exponential backoff (about 10 s in total) before giving up.
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, 'w') as f:
+        write(f)
+    for attempt in range(retries + 1):
+        try:
+            os.replace(tmp, path)
+            return
+        except PermissionError:
+            if attempt == retries:
+                os.remove(tmp)
+                raise
+            time.sleep(backoff * 2 ** attempt)
+
+class SharedState:
+    """
+    Coordination between backend processes (uvicorn workers) that share one
+    data directory.
+
+    Revision counters live in a small SQLite database in WAL mode: a writer
+    bumps the counter of whatever it changed, and every process compares it
+    with the revision its in-memory copy was built from to know when to
+    reload. Named locks are exclusive file locks (one lock file per name),
+    reentrant within a thread, that serialize read-modify-write cycles on
+    the YAML/JSON files across processes. Token buckets for rate limits
+    shared by all processes live in the same database.
+    """
+
+    def __init__(self, path, lock_dir, timeout=30):
+        self.path = path
+        self.lock_dir = lock_dir
+        self.timeout = timeout
+        self.local = threading.local()
+        os.makedirs(lock_dir, exist_ok=True)
+        self._conn().execute(
+            "CREATE TABLE IF NOT EXISTS revisions (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._conn().execute(
+            "CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)")
+
+    def _conn(self):
+        # SQLite connections are per thread
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+
+    # --- Revisions ---
+
+    def revision(self, name):
+        row = self._conn().execute("SELECT value FROM revisions WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else 0
+
+    def bump(self, name):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO revisions (name, value) VALUES (?, 1) "
+                "ON CONFLICT (name) DO UPDATE SET value = value + 1", (name,))
+            value = conn.execute("SELECT value FROM revisions WHERE name = ?", (name,)).fetchone()[0]
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return value
+
+    def revisions(self):
+        return dict(self._conn().execute("SELECT name, value FROM revisions").fetchall())
+
+    # --- Token buckets ---
+
+    def _bucket(self, conn, name, rate, burst, now):
+        row = conn.execute("SELECT tokens, updated FROM buckets WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return float(burst)
+        # Wall clock, since it is compared across processes; never refill backwards
+        return min(burst, row[0] + max(0.0, now - row[1]) * rate)
+
+    def take_token(self, name, rate, burst):
+        """
+        Take one token from the shared bucket `name` (refilled at `rate` per
+        second, up to `burst`). Returns 0 if taken, else the seconds until
+        one is available.
+        """
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            tokens = self._bucket(conn, name, rate, burst, now)
+            delay = 0.0 if tokens >= 1 else (1 - tokens) / rate
+            if not delay:
+                tokens -= 1
+            conn.execute(
+                "INSERT INTO buckets (name, tokens, updated) VALUES (?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                (name, tokens, now))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return delay
+
+    def tokens(self, name, rate, burst):
+        return self._bucket(self._conn(), name, rate, burst, time.time())
+
+    # --- Locks ---
+
+    @contextmanager
+    def lock(self, name, blocking=True):
+        """
+        Exclusive cross-process lock. Yields True once held; with
+        blocking=False yields False immediately if another holder has it.
+        """
+        held = self.local.__dict__.setdefault('held', {})
+        if name in held:
+            held[name] += 1
+            try:
+                yield True
+            finally:
+                held[name] -= 1
+            return
+
+        f = open(os.path.join(self.lock_dir, f"{name}.lock"), 'a+')
+        try:
+            deadline = time.monotonic() + self.timeout
+            acquired = _try_lock(f)
+            while not acquired and blocking:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for lock '{name}'")
+                time.sleep(0.01)
+                acquired = _try_lock(f)
+            if not acquired:
+                yield False
+                return
+
+            held[name] = 1
+            try:
+                yield True
+            finally:
+                del held[name]
+                _unlock(f)
+        finally:
+            f.close()
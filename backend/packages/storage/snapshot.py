@@ -0,0 +1,174 @@
+"""
+Binary snapshot of the cached time entries and projects.
+
+The file is a fixed header, a section directory, then one array per
+column (time entries sorted by spent_on, projects in cache order) and a string
+table holding every name, comment and timestamp once. The reader `mmap`s
+it and casts the sections to typed memoryviews, so opening costs
+microseconds and queries read the mapped pages in place: date ranges are
+binary searches on the spent_on column and only the matching rows become
+dicts, with the same fields as in cache_data.yaml.
+
+Snapshots are immutable; each write goes to a new file named after its
+revision (a mapped file cannot be replaced on Windows).
+"""
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+MAGIC = b"RTSNAP01"
+VERSION = 1
+HEADER = struct.Struct("<8sIIdQQII")  # magic, version, little-endian flag, created_at, revision, seq, entries, projects
+
+NONE = -1  # int and string-index columns: value missing
+
+# (key, kind): kind is 'int', 'float', 'date' (stored as ordinal days) or 'str' (string table index)
+ENTRY_COLUMNS = (
+    ('spent_on', 'date'), ('id', 'int'), ('seq', 'int'), ('hours', 'float'),
+    ('project_id', 'int'), ('project', 'str'), ('issue', 'int'),
+    ('activity_id', 'int'), ('activity', 'str'), ('user', 'str'), ('comments', 'str'),
+    ('start_time', 'str'), ('created_on', 'str'), ('updated_on', 'str'),
+)
+PROJECT_COLUMNS = (('id', 'int'), ('name', 'str'))
+OPTIONAL_KEYS = {'start_time', 'seq'}  # Left out of rows when missing, as in the cache
+TYPECODES = {'int': 'q', 'date': 'q', 'float': 'd', 'str': 'q'}
+
+SECTIONS = (
+    [f"entry.{key}" for key, _ in ENTRY_COLUMNS]
+    + [f"project.{key}" for key, _ in PROJECT_COLUMNS]
+    + ["strings.offsets", "strings.data"]
+)
+DIRECTORY = struct.Struct(f"<{2 * len(SECTIONS)}Q")  # (offset, length) per section
+
+def snapshot_path(directory, revision):
+    return os.path.join(directory, f"time_entries.{revision}.bin")
+
+def _encode_column(rows, key, kind, strings):
+    values = array(TYPECODES[kind])
+    for row in rows:
+        value = row.get(key)
+        if value is None:
+            values.append(NONE if kind != 'float' else float('nan'))
+        elif kind == 'date':
+            values.append(date.fromisoformat(str(value)).toordinal())
+        elif kind == 'float':
+            values.append(float(value))
+        elif kind == 'str':
+            values.append(strings.setdefault(str(value), len(strings)))
+        else:
+            values.append(int(value))
+    return values.tobytes()
+
+def write_snapshot(path, entries, projects, revision, seq):
+    """Write a snapshot of `entries` and `projects` to `path` (atomically)."""
+    entries = sorted(entries, key=lambda e: (date.fromisoformat(str(e['spent_on'])).toordinal() if e.get('spent_on') else NONE, e['id']))
+    strings = {}
+    sections = [_encode_column(entries, key, kind, strings) for key, kind in ENTRY_COLUMNS]
+    sections += [_encode_column(projects, key, kind, strings) for key, kind in PROJECT_COLUMNS]
+
+    offsets, data = array('q', [0]), bytearray()
+    for text in strings:  # Insertion order == index order
+        data += text.encode('utf-8')
+        offsets.append(len(data))
+    sections += [offsets.tobytes(), bytes(data)]
+
+    header = HEADER.pack(MAGIC, VERSION, sys.byteorder == 'little', time.time(), revision, seq, len(entries), len(projects))
+    position = HEADER.size + DIRECTORY.size
+    directory, body = [], bytearray()
+    for section in sections:
+        padding = -position % 8  # Keep every array 8-byte aligned
+        body += b"\0" * padding
+        position += padding
+        directory += [position, len(section)]
+        body += section
+        position += len(section)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header + DIRECTORY.pack(*directory) + body)
+    os.replace(tmp_path, path)
+
+class Snapshot:
+    """Read-only view over a mapped snapshot file."""
+
+    def __init__(self, path):
+        started = time.perf_counter()
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, little, self.created_at, self.revision, self.seq, self.entry_count, self.project_count = \
+            HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION or bool(little) != (sys.byteorder == 'little'):
+            self.mm.close()
+            raise ValueError(f"Unsupported snapshot format: {path}")
+        self.path = path
+        self.size = len(self.mm)
+
+        view = memoryview(self.mm)
+        directory = DIRECTORY.unpack_from(self.mm, HEADER.size)
+        kinds = dict((f"entry.{k}", kind) for k, kind in ENTRY_COLUMNS)
+        kinds.update((f"project.{k}", kind) for k, kind in PROJECT_COLUMNS)
+        kinds["strings.offsets"] = 'int'
+        self.sections = {}
+        for i, name in enumerate(SECTIONS):
+            offset, length = directory[2 * i], directory[2 * i + 1]
+            section = view[offset:offset + length]
+            self.sections[name] = section if name == "strings.data" else section.cast(TYPECODES[kinds[name]])
+        self.open_ms = (time.perf_counter() - started) * 1000
+
+    def _string(self, index):
+        if index == NONE:
+            return None
+        offsets = self.sections["strings.offsets"]
+        return str(self.sections["strings.data"][offsets[index]:offsets[index + 1]], 'utf-8')
+
+    def _row(self, prefix, columns, i):
+        row = {}
+        for key, kind in columns:
+            value = self.sections[f"{prefix}.{key}"][i]
+            if kind == 'str':
+                value = self._string(value)
+            elif kind == 'float':
+                value = None if value != value else value  # NaN marks a missing value
+            elif value == NONE:
+                value = None
+            elif kind == 'date':
+                value = date.fromordinal(value).isoformat()
+            if value is None and key in OPTIONAL_KEYS:
+                continue
+            row[key] = value
+        return row
+
+    def _range(self, from_date=None, to_date=None):
+        days = self.sections["entry.spent_on"]
+        lo = bisect_left(days, date.fromisoformat(from_date).toordinal()) if from_date else 0
+        hi = bisect_right(days, date.fromisoformat(to_date).toordinal()) if to_date else len(days)
+        return lo, hi
+
+    def time_entries(self, from_date=None, to_date=None):
+        lo, hi = self._range(from_date, to_date)
+        return [self._row("entry", ENTRY_COLUMNS, i) for i in range(lo, hi)]
+
+    def hours_between(self, from_date, to_date):
+        lo, hi = self._range(from_date, to_date)
+        return sum(h for h in self.sections["entry.hours"][lo:hi] if h == h)
+
+    def projects(self):
+        return [self._row("project", PROJECT_COLUMNS, i) for i in range(self.project_count)]
+
+    def get_stats(self):
+        return {
+            "revision": self.revision,
+            "seq": self.seq,
+            "entries": self.entry_count,
+            "projects": self.project_count,
+            "bytes": self.size,
+            "created_at": self.created_at,
+            "age_sec": round(time.time() - self.created_at, 1),
+            "open_ms": round(self.open_ms, 3)
+        }
@@ -0,0 +1,183 @@
+"""
+Compressed storage for the large text fields of cached issues.
+
+Descriptions and journal notes (and their rendered HTML) longer than
+MIN_SIZE bytes are kept in the cache as zlib streams (bytes, `!!binary` in
+YAML) compressed against a preset dictionary. The dictionary is trained
+from the cached issue text itself and stored in the cache next to it, so
+a cache file is always readable on its own; retraining repacks every field.
+Short fields stay plain strings, and plain strings are always accepted on
+read, so older caches keep working and are packed as issues are re-saved.
+
+Fields are only unpacked when a response actually returns them.
+"""
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+
+DICTIONARY_KEY = 'text_dictionary'
+
+ISSUE_FIELDS = ('description', 'description_html')
+JOURNAL_FIELDS = ('notes', 'notes_html')
+
+MIN_SIZE = 128              # Bytes; shorter text is not worth a zlib header
+DICTIONARY_SIZE = 32 * 1024  # zlib's window: dictionary bytes beyond this are never used
+MIN_TRAINING_ISSUES = 20
+
+def train_dictionary(samples, size=DICTIONARY_SIZE):
+    """
+    Build a zlib preset dictionary from sample texts: the lines and words
+    that recur across documents, weighted by how many bytes they would
+    save. zlib reaches matches near the end of the dictionary most cheaply,
+    so the most valuable pieces go last.
+    """
+    counts = Counter()
+    for text in samples:
+        pieces = {line.strip() for line in text.splitlines() if 8 <= len(line.strip()) <= 200}
+        pieces.update(re.findall(r"\w{5,}", text))
+        counts.update(pieces)
+
+    ranked = sorted(((n * len(piece), piece) for piece, n in counts.items() if n > 1), reverse=True)
+    chosen, total = [], 0
+    for _, piece in ranked:
+        data = piece.encode('utf-8') + b"\n"
+        if total + len(data) > size:
+            continue
+        chosen.append(data)
+        total += len(data)
+    return b"".join(reversed(chosen))
+
+class TextStore:
+    """Packs/unpacks text fields of cache records and keeps compression counters."""
+
+    def __init__(self, level=6, min_size=MIN_SIZE):
+        self.level = level
+        self.min_size = min_size
+        self.lock = threading.Lock()
+        self.stats = {"packed": 0, "raw_bytes": 0, "stored_bytes": 0, "unpacked": 0, "unpack_sec": 0.0, "trainings": 0}
+
+    # --- Single values ---
+
+    def pack(self, text, zdict=None):
+        if not isinstance(text, str):
+            return text
+        raw = text.encode('utf-8')
+        if len(raw) < self.min_size:
+            return text
+        if zdict:
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, 15, 9, zlib.Z_DEFAULT_STRATEGY, zdict)
+        else:
+            compressor = zlib.compressobj(self.level)
+        data = compressor.compress(raw) + compressor.flush()
+        if len(data) >= len(raw):
+            return text
+        with self.lock:
+            self.stats["packed"] += 1
+            self.stats["raw_bytes"] += len(raw)
+            self.stats["stored_bytes"] += len(data)
+        return data
+
+    def unpack(self, value, zdict=None):
+        if not isinstance(value, bytes):
+            return value
+        started = time.perf_counter()
+        decompressor = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+        text = (decompressor.decompress(value) + decompressor.flush()).decode('utf-8')
+        with self.lock:
+            self.stats["unpacked"] += 1
+            self.stats["unpack_sec"] += time.perf_counter() - started
+        return text
+
+    # --- Cache records ---
+
+    @staticmethod
+    def dictionary(cache):
+        return (cache.get(DICTIONARY_KEY) or {}).get('data')
+
+    def pack_fields(self, cache, record, fields):
+        zdict = self.dictionary(cache)
+        return {k: self.pack(v, zdict) if k in fields else v for k, v in record.items()}
+
+    def unpack_fields(self, cache, record, fields):
+        zdict = self.dictionary(cache)
+        return {k: self.unpack(v, zdict) if k in fields else v for k, v in record.items()}
+
+    def _records(self, cache):
+        # Every (record, fields) pair holding issue text
+        # (Legacy entries with journals inside the header stay plain until re-saved)
+        for header in cache.get('issue_details', {}).values():
+            yield header, ISSUE_FIELDS
+        for entry in cache.get('issue_journals', {}).values():
+            for journal in entry.get('journals', []):
+                yield journal, JOURNAL_FIELDS
+
+    def maybe_train(self, cache, min_issues=MIN_TRAINING_ISSUES):
+        """
+        (Re)train the dictionary once enough issues are cached, and again
+        whenever the number of cached issues has doubled since; every
+        field is then repacked with the new dictionary. Runs inside a cache
+        transaction. Returns True when it retrained.
+        """
+        issues = len(cache.get('issue_details', {}))
+        trained_on = (cache.get(DICTIONARY_KEY) or {}).get('trained_on', 0)
+        if issues < max(min_issues, 2 * trained_on):
+            return False
+
+        old = self.dictionary(cache)
+        records = list(self._records(cache))
+        for record, fields in records:
+            for field in fields:
+                if field in record:
+                    record[field] = self.unpack(record[field], old)
+
+        samples = [record[f] for record, fields in records for f in fields if isinstance(record.get(f), str)]
+        zdict = train_dictionary(samples)
+        cache[DICTIONARY_KEY] = {"data": zdict, "trained_on": issues, "trained_at": time.time()}
+        for record, fields in records:
+            for field in fields:
+                if field in record:
+                    record[field] = self.pack(record[field], zdict)
+        with self.lock:
+            self.stats["trainings"] += 1
+        return True
+
+    def footprint(self, cache):
+        """Stored vs. raw size of every text field in the cache (unpacks them all, timed)."""
+        zdict = self.dictionary(cache)
+        result = {"fields": 0, "packed_fields": 0, "raw_bytes": 0, "stored_bytes": 0}
+        started = time.perf_counter()
+        for record, fields in self._records(cache):
+            for field in fields:
+                value = record.get(field)
+                if not value:
+                    continue
+                result["fields"] += 1
+                if isinstance(value, bytes):
+                    result["packed_fields"] += 1
+                    result["stored_bytes"] += len(value)
+                    result["raw_bytes"] += len(self.unpack(value, zdict).encode('utf-8'))
+                else:
+                    size = len(str(value).encode('utf-8'))
+                    result["stored_bytes"] += size
+                    result["raw_bytes"] += size
+        result["unpack_all_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        result["ratio"] = round(result["raw_bytes"] / result["stored_bytes"], 2) if result["stored_bytes"] else None
+        return result
+
+    def get_stats(self, cache=None):
+        with self.lock:
+            stats = dict(self.stats)
+        stats["ratio"] = round(stats["raw_bytes"] / stats["stored_bytes"], 2) if stats["stored_bytes"] else None
+        stats["avg_unpack_us"] = round(stats["unpack_sec"] / stats["unpacked"] * 1e6, 1) if stats["unpacked"] else None
+        stats["unpack_sec"] = round(stats["unpack_sec"], 4)
+        if cache is not None:
+            dictionary = cache.get(DICTIONARY_KEY) or {}
+            stats["dictionary"] = {
+                "bytes": len(dictionary.get('data') or b""),
+                "trained_on": dictionary.get('trained_on'),
+                "trained_at": dictionary.get('trained_at')
+            }
+            stats["cache"] = self.footprint(cache)
+        return stats
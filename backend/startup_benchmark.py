@@ -0,0 +1,94 @@
+"""
+Startup benchmark for the backend.
+
+Spawns the backend the same way the frozen build runs it (uvicorn with the
+app instance, no reload) and reports:
+  * import time        - `import main` in a fresh interpreter
+  * first request      - process spawn until /api/health answers
+  * first useful reply - process spawn until /api/redmine/time_entries answers
+
+Usage: python startup_benchmark.py [--runs 5] [--port 8765]
+Uses the normal data directory, so cache sizes are realistic. The benchmark
+itself only sends read requests and starts the backend with the auto-log
+scheduler off (REDMINE_TRACKER_AUTO_LOG=0), so it never logs time; the
+backend's own background warm-ups may still refresh the caches from Redmine.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SERVER_CODE = (
+    "import uvicorn, main; "
+    "uvicorn.run(main.app, host='127.0.0.1', port={port}, log_level='warning', loop='asyncio', http='h11')"
+)
+
+def measure_import():
+    code = "import time; t = time.perf_counter(); import main; print(time.perf_counter() - t)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+def wait_for(url, start, timeout=30.0):
+    while time.perf_counter() - start < timeout:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as res:
+                body = res.read()
+                return time.perf_counter() - start, body
+        except OSError:
+            time.sleep(0.005)
+    raise TimeoutError(f"{url} did not answer within {timeout}s")
+
+def port_is_free(port):
+    with socket.socket() as s:
+        return s.connect_ex(('127.0.0.1', port)) != 0
+
+def measure_server(port):
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-c", SERVER_CODE.format(port=port)], cwd=BACKEND_DIR,
+                            env=dict(os.environ, REDMINE_TRACKER_AUTO_LOG="0"),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        first_request, body = wait_for(f"http://127.0.0.1:{port}/api/health", start)
+        first_useful, _ = wait_for(f"http://127.0.0.1:{port}/api/redmine/time_entries", start)
+        backend_ready = json.loads(body).get('startup_ms', {}).get('ready')
+        return first_request, first_useful, backend_ready
+    finally:
+        proc.terminate()
+        proc.wait()
+
+def fmt(values):
+    values = [v * 1000 for v in values]
+    return f"median {statistics.median(values):7.1f} ms  min {min(values):7.1f} ms  max {max(values):7.1f} ms"
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if not port_is_free(args.port):
+        sys.exit(f"Port {args.port} is busy, pick another with --port")
+
+    imports, first_requests, first_useful = [], [], []
+    for run in range(args.runs):
+        imports.append(measure_import())
+        req, useful, ready = measure_server(args.port)
+        first_requests.append(req)
+        first_useful.append(useful)
+        print(f"run {run + 1}: import {imports[-1] * 1000:.1f} ms, first request {req * 1000:.1f} ms, "
+              f"first useful response {useful * 1000:.1f} ms (backend reported ready at {ready} ms)")
+
+    print()
+    print(f"import time            {fmt(imports)}")
+    print(f"time to first request  {fmt(first_requests)}")
+    print(f"time to first useful   {fmt(first_useful)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+from packages.search.fulltext import FullTextIndex
+
+
+def make_index(tmp_path):
+    index = FullTextIndex(str(tmp_path / "search_index.db"))
+    journals = [{"id": n, "user": "Ann", "notes": f"Retested the login flow, round {n}"} for n in range(30)]
+    index.index_issue(7, "Login page rejects valid passwords", "Users cannot sign in.",
+                      project="Portal", journals=journals)
+    index.index_issue(8, "Dashboard is slow", "Loading takes a minute.", project="Portal", journals=[])
+    return index
+
+
+def test_subject_search_ranks_the_issue_first(tmp_path):
+    hits = make_index(tmp_path).search("login")
+    assert hits[0]["kind"] == "issue" and hits[0]["issue_id"] == 7
+    assert len(hits) == 20
+
+
+def test_journals_do_not_match_on_the_issue_subject(tmp_path):
+    hits = make_index(tmp_path).search("passwords")
+    assert [(h["kind"], h["issue_id"]) for h in hits] == [("issue", 7)]
+
+
+def test_scores_are_not_rounded_away(tmp_path):
+    hits = make_index(tmp_path).search("login")
+    assert all(h["score"] > 0 for h in hits)
+    assert hits[0]["score"] > hits[1]["score"]
+
+
+def test_older_index_format_is_emptied(tmp_path):
+    index = make_index(tmp_path)
+    index.conn.execute("PRAGMA user_version = 1")
+    index.conn.commit()
+    index.close()
+    assert FullTextIndex(str(tmp_path / "search_index.db")).is_empty()
@@ -0,0 +1,49 @@
+from packages.redmine.text_render import render_text
+
+
+def test_emphasis_inside_url_is_left_alone():
+    assert render_text("https://a.com/_a_") == \
+        '<p><a href="https://a.com/_a_" target="_blank">https://a.com/_a_</a></p>'
+
+
+def test_strike_and_bold_inside_url_are_left_alone():
+    html = render_text("see https://a.com/-x-/*y* now")
+    assert '<a href="https://a.com/-x-/*y*" target="_blank">https://a.com/-x-/*y*</a>' in html
+    assert "<del>" not in html and "<strong>" not in html
+
+
+def test_markdown_and_textile_link_targets_are_left_alone():
+    html = render_text('[doc](https://x.com/a_b_c) and "Wiki":https://w.org/_w_')
+    assert '<a href="https://x.com/a_b_c" target="_blank">doc</a>' in html
+    assert '<a href="https://w.org/_w_" target="_blank">Wiki</a>' in html
+    assert "<em>" not in html
+
+
+def test_email_addresses_are_not_code_spans():
+    assert render_text("a@b.com and c@d.org") == \
+        '<p><a href="mailto:a@b.com">a@b.com</a> and <a href="mailto:c@d.org">c@d.org</a></p>'
+
+
+def test_emphasis_inside_email_is_left_alone():
+    html = render_text("ask first_last_@corp.com")
+    assert '<a href="mailto:first_last_@corp.com">first_last_@corp.com</a>' in html
+    assert "<em>" not in html
+
+
+def test_code_spans_keep_their_content():
+    assert render_text("run `http://x/_y_` or @git log -p -1@") == \
+        "<p>run <code>http://x/_y_</code> or <code>git log -p -1</code></p>"
+
+
+def test_emphasis_around_links_still_applies():
+    assert render_text("**bold** _it_ https://a.com -gone-") == \
+        '<p><strong>bold</strong> <em>it</em> <a href="https://a.com" target="_blank">https://a.com</a> <del>gone</del></p>'
+
+
+def test_consecutive_hash_lines_are_a_textile_numbered_list():
+    assert render_text("# one\n# two") == "<ol><li>one</li><li>two</li></ol>"
+
+
+def test_single_hash_line_is_a_markdown_heading():
+    assert render_text("# Title\ntext\n\n# a\n# b") == \
+        "<h1>Title</h1><p>text</p><ol><li>a</li><li>b</li></ol>"
@@ -4,6 +4,7 @@ import dayGridPlugin from '@fullcalendar/daygrid';
 import timeGridPlugin from '@fullcalendar/timegrid';
 import interactionPlugin from '@fullcalendar/interaction';
 import TimeEntryModal from './TimeEntryModal';
+import { fetchTimeEntriesInRange } from '../timeEntryFeed';
 import './CalendarView.css';
 
 interface CalendarEvent {
@@ -20,6 +21,7 @@ interface CalendarEvent {
     endTime?: string;
     extendedProps?: {
         projectId?: number;
+        projectName?: string;
         issueId?: number;
         activityId?: number;
         comments?: string;
@@ -61,11 +63,14 @@ const CalendarView = () => {
         const fromDate = new Date(today.getFullYear(), today.getMonth() - 1, 1).toISOString().split('T')[0];
         const toDate = new Date(today.getFullYear(), today.getMonth() + 2, 0).toISOString().split('T')[0];
 
-        fetch(`http://127.0.0.1:8000/api/redmine/time_entries?from_date=${fromDate}&to_date=${toDate}`)
-            .then(res => res.json())
+        // Patches the local copy with changes since the last fetch
+        fetchTimeEntriesInRange(fromDate, toDate)
             .then(data => {
                 if (Array.isArray(data)) {
                     const mappedEvents = data.map((entry: any) => {
+                        // Entries from additional Redmine instances are shown read-only
+                        const readOnly = entry.instance && entry.instance !== 'default';
+
                         // Calculate end time based on hours
                         // Use stored start_time if available, otherwise default
                         const startTimeStr = entry.start_time || DEFAULT_START_TIME;
@@ -90,21 +95,23 @@ const CalendarView = () => {
                         };
 
                         return {
-                            id: entry.id.toString(),
-                            title: `${entry.hours}h - ${entry.comments || entry.project}`,
+                            id: readOnly ? `${entry.instance}:${entry.id}` : entry.id.toString(),
+                            title: `${entry.hours}h - ${entry.comments || entry.project}${readOnly ? ` (${entry.instance})` : ''}`,
                             start: `${entry.spent_on}T${startTimeStr}`,
                             end: `${entry.spent_on}T${formatTime(endDate)}`,
-                            backgroundColor: 'rgba(59, 130, 246, 0.6)', // Glassy blue
-                            borderColor: 'rgba(59, 130, 246, 0.8)',
+                            backgroundColor: readOnly ? 'rgba(139, 92, 246, 0.6)' : 'rgba(59, 130, 246, 0.6)', // Glassy blue, violet for other instances
+                            borderColor: readOnly ? 'rgba(139, 92, 246, 0.8)' : 'rgba(59, 130, 246, 0.8)',
                             textColor: '#ffffff',
                             classNames: ['glass-event'],
                             extendedProps: {
                                 projectId: entry.project_id,
+                                projectName: entry.project,
                                 issueId: entry.issue,
                                 activityId: entry.activity_id,
                                 comments: entry.comments,
                                 hours: entry.hours,
-                                startTime: entry.start_time // Pass to extendedProps
+                                startTime: entry.start_time, // Pass to extendedProps
+                                readOnly
                             }
                         };
                     });
@@ -203,6 +210,9 @@ const CalendarView = () => {
 
     const handleEventClick = (clickInfo: any) => {
         const event = clickInfo.event;
+        if (event.extendedProps.readOnly) {
+            return;
+        }
         setSelectedDate(event.startStr.split('T')[0]);
         setSelectedEvent({
             id: event.id,
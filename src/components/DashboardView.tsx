@@ -1,5 +1,6 @@
 import { useEffect, useState } from 'react';
 import Confetti from './Confetti';
+import { fetchTimeEntriesInRange } from '../timeEntryFeed';
 
 interface Task {
     id: string;
@@ -68,8 +69,7 @@ const DashboardView = () => {
 
     const fetchWeeklyStats = () => {
         const { start, end } = getWeekRange();
-        fetch(`http://127.0.0.1:8000/api/redmine/time_entries?from_date=${start}&to_date=${end}`)
-            .then(res => res.json())
+        fetchTimeEntriesInRange(start, end)
             .then(data => {
                 if (Array.isArray(data)) {
                     setWeeklyEntries(data); // Store raw data
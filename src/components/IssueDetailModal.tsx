@@ -4,12 +4,16 @@ interface Journal {
     user: string;
     created_on: string;
     notes: string;
+    notes_html?: string;
 }
 
+const JOURNAL_PAGE_SIZE = 20;
+
 interface IssueDetail {
     id: number;
     subject: string;
     description: string;
+    description_html?: string;
     status: string;
     priority: string;
     author: string;
@@ -20,7 +24,6 @@ interface IssueDetail {
     estimated_hours: any;
     spent_hours: any;
     project: { id: number; name: string };
-    journals: Journal[];
     url: string;
 }
 
@@ -34,15 +37,37 @@ const IssueDetailModal: React.FC<IssueDetailModalProps> = ({ isOpen, onClose, is
     const [issue, setIssue] = useState<IssueDetail | null>(null);
     const [loading, setLoading] = useState(false);
     const [error, setError] = useState('');
+    const [journals, setJournals] = useState<Journal[]>([]);
+    const [journalTotal, setJournalTotal] = useState(0);
+    const [journalsLoading, setJournalsLoading] = useState(false);
 
     useEffect(() => {
+        setJournals([]);
+        setJournalTotal(0);
         if (isOpen && issueId) {
             fetchIssueDetails(issueId);
+            fetchJournals(issueId, 0);
         } else {
             setIssue(null);
         }
     }, [isOpen, issueId]);
 
+    const fetchJournals = async (id: number, offset: number) => {
+        setJournalsLoading(true);
+        try {
+            const res = await fetch(`http://127.0.0.1:8000/api/redmine/issue/${id}/journals?offset=${offset}&limit=${JOURNAL_PAGE_SIZE}`);
+            const data = await res.json();
+            if (!data.error) {
+                setJournals(prev => offset === 0 ? data.journals : [...prev, ...data.journals]);
+                setJournalTotal(data.total);
+            }
+        } catch (err) {
+            console.error(err);
+        } finally {
+            setJournalsLoading(false);
+        }
+    };
+
     const fetchIssueDetails = async (id: number) => {
         setLoading(true);
         setError('');
@@ -190,28 +215,50 @@ const IssueDetailModal: React.FC<IssueDetailModalProps> = ({ isOpen, onClose, is
                                             borderRadius: '8px',
                                             lineHeight: '1.6',
                                             fontSize: '0.95em',
-                                            whiteSpace: 'pre-wrap'
+                                            whiteSpace: issue.description_html ? 'normal' : 'pre-wrap'
                                         }}
+                                        dangerouslySetInnerHTML={issue.description_html ? { __html: issue.description_html } : undefined}
                                     >
-                                        {issue.description}
+                                        {issue.description_html ? undefined : issue.description}
                                     </div>
                                 </div>
                             )}
 
                             {/* Journals / History */}
-                            {issue.journals && issue.journals.length > 0 && (
+                            {journals.length > 0 && (
                                 <div>
                                     <h3 style={{ fontSize: '1.1em', marginBottom: '15px', color: 'var(--text-secondary)' }}>History</h3>
                                     <div style={{ display: 'flex', flexDirection: 'column', gap: '15px' }}>
-                                        {issue.journals.map((journal, idx) => (
+                                        {journals.map((journal, idx) => (
                                             <div key={idx} style={{ borderLeft: '2px solid var(--glass-border)', paddingLeft: '15px' }}>
                                                 <div style={{ fontSize: '0.85em', color: 'var(--text-secondary)', marginBottom: '5px' }}>
                                                     <span style={{ color: 'var(--primary)', fontWeight: 'bold' }}>{journal.user}</span> • {new Date(journal.created_on).toLocaleString()}
                                                 </div>
-                                                <div style={{ fontSize: '0.95em', whiteSpace: 'pre-wrap' }}>{journal.notes}</div>
+                                                {journal.notes_html ? (
+                                                    <div style={{ fontSize: '0.95em' }} dangerouslySetInnerHTML={{ __html: journal.notes_html }} />
+                                                ) : (
+                                                    <div style={{ fontSize: '0.95em', whiteSpace: 'pre-wrap' }}>{journal.notes}</div>
+                                                )}
                                             </div>
                                         ))}
                                     </div>
+                                    {journals.length < journalTotal && (
+                                        <button
+                                            onClick={() => issueId && fetchJournals(issueId, journals.length)}
+                                            disabled={journalsLoading}
+                                            style={{
+                                                marginTop: '15px',
+                                                padding: '6px 14px',
+                                                background: 'rgba(255,255,255,0.05)',
+                                                color: 'var(--text-secondary)',
+                                                border: '1px solid var(--glass-border)',
+                                                borderRadius: '6px',
+                                                cursor: journalsLoading ? 'default' : 'pointer'
+                                            }}
+                                        >
+                                            {journalsLoading ? 'Loading...' : `Load more (${journalTotal - journals.length} remaining)`}
+                                        </button>
+                                    )}
                                 </div>
                             )}
                         </div>
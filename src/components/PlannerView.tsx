@@ -34,7 +34,8 @@ const PlannerView: React.FC<Partial<PlannerViewProps>> = ({ refreshTrigger }) =>
     const [selectedComment, setSelectedComment] = useState('');
 
     const [alertTime, setAlertTime] = useState(localStorage.getItem('planner_alert_time') || '17:00');
-    const [autoLogTime, setAutoLogTime] = useState(localStorage.getItem('planner_auto_log_time') || '18:00');
+    // '' means auto-log is disabled
+    const [autoLogTime, setAutoLogTime] = useState(localStorage.getItem('planner_auto_log_time') ?? '18:00');
 
     const [profiles, setProfiles] = useState<any[]>([]);
     const [selectedProfileName, setSelectedProfileName] = useState('');
@@ -380,9 +381,24 @@ const PlannerView: React.FC<Partial<PlannerViewProps>> = ({ refreshTrigger }) =>
         }
     };
 
-    const handleSaveSettings = () => {
+    const handleSaveSettings = async () => {
         localStorage.setItem('planner_alert_time', alertTime);
         localStorage.setItem('planner_auto_log_time', autoLogTime);
+        try {
+            // Auto-log runs on the backend, which owns the time
+            const response = await fetch('http://127.0.0.1:8000/api/planner/auto_log', {
+                method: 'PUT',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ auto_log_time: autoLogTime })
+            });
+            const data = await response.json();
+            if (data.error) {
+                addToast(data.error, 'error');
+                return;
+            }
+        } catch (error) {
+            console.error("Failed to save auto-log time:", error);
+        }
         addToast("Settings saved!", 'success');
     };
 
@@ -434,12 +450,6 @@ const PlannerView: React.FC<Partial<PlannerViewProps>> = ({ refreshTrigger }) =>
 
 
 
-    // Use ref to access latest tasks in interval
-    const tasksRef = React.useRef(tasks);
-    useEffect(() => {
-        tasksRef.current = tasks;
-    }, [tasks]);
-
     // Check time every minute
     useEffect(() => {
         const interval = setInterval(() => {
@@ -449,14 +459,10 @@ const PlannerView: React.FC<Partial<PlannerViewProps>> = ({ refreshTrigger }) =>
             if (currentTime === alertTime) {
                 checkAlert(true);
             }
-
-            if (currentTime === autoLogTime) {
-                checkAutoLog(true);
-            }
         }, 60000); // Check every minute
 
         return () => clearInterval(interval);
-    }, [alertTime, autoLogTime]);
+    }, [alertTime]);
 
     const checkAlert = (force = false) => {
         if (force) {
@@ -464,46 +470,52 @@ const PlannerView: React.FC<Partial<PlannerViewProps>> = ({ refreshTrigger }) =>
         }
     };
 
-    const checkAutoLog = async (force = false) => {
-        if (force) {
-            console.log("Triggering Auto-Log...");
-            // Use ref to get latest tasks
-            const currentTasks = tasksRef.current;
-            // Filter out logged tasks AND paused tasks
-            const unloggedTasks = currentTasks.filter(t => !t.is_logged && !t.is_paused && t.planned_hours > 0);
-
-            if (unloggedTasks.length === 0) {
-                if (force) addToast("No unlogged tasks to auto-log.", 'info');
-                return;
-            }
-
-            // Append timestamp to comments for auto-log
-            // const nowTime = new Date().toLocaleTimeString('en-GB', { hour: '2-digit', minute: '2-digit' });
-            const tasksToLog = unloggedTasks.map(t => ({
-                ...t,
-                comments: t.comments ? `${t.comments}` : `${t.name}`
-            }));
-
+    // Auto-log is scheduled by the backend (jittered, rate limited); pick up its results
+    useEffect(() => {
+        const checkAutoLogResult = async (initial = false) => {
             try {
-                const response = await fetch('http://127.0.0.1:8000/api/planner/log_batch', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(tasksToLog)
-                });
-                const data = await response.json();
-                if (data.status === 'success' || data.status === 'partial_success') {
-                    fetchTasks(true);
-                    if (force) addToast(`Auto-logged ${data.logged} tasks.`, 'success');
+                const response = await fetch('http://127.0.0.1:8000/api/planner/auto_log');
+                let data = await response.json();
+                if (initial) {
+                    const localTime = localStorage.getItem('planner_auto_log_time');
+                    if (!data.configured && localTime !== null) {
+                        // Time set before auto-log moved to the backend: hand it over once
+                        const migrated = await fetch('http://127.0.0.1:8000/api/planner/auto_log', {
+                            method: 'PUT',
+                            headers: { 'Content-Type': 'application/json' },
+                            body: JSON.stringify({ auto_log_time: localTime })
+                        });
+                        const migratedData = await migrated.json();
+                        if (!migratedData.error) {
+                            data = migratedData;
+                        }
+                    }
+                    const backendTime = data.auto_log_time || '';
+                    setAutoLogTime(backendTime);
+                    localStorage.setItem('planner_auto_log_time', backendTime);
+                }
+                const run = data.last_run;
+                const seen = Number(localStorage.getItem('planner_auto_log_seen') || 0);
+                if (!run || run.finished_at <= seen) return;
+                localStorage.setItem('planner_auto_log_seen', String(run.finished_at));
+                if (initial && run.date !== new Date().toLocaleDateString('en-CA')) return;
+
+                fetchTasks(true);
+                if (run.status === 'success') {
+                    addToast(run.logged ? `Auto-logged ${run.logged} tasks.` : "No unlogged tasks to auto-log.", run.logged ? 'success' : 'info');
                 } else {
-                    console.error("Auto-log failed:", data);
-                    addToast("Auto-log failed", 'error');
+                    console.error("Auto-log failed:", run.errors);
+                    addToast(`Auto-log: ${run.logged} logged, ${run.errors.length} failed`, 'error');
                 }
             } catch (error) {
-                console.error("Auto-log error:", error);
-                addToast("Auto-log error", 'error');
+                console.error("Auto-log status error:", error);
             }
-        }
-    };
+        };
+
+        checkAutoLogResult(true);
+        const interval = setInterval(() => checkAutoLogResult(), 60000);
+        return () => clearInterval(interval);
+    }, []);
 
     return (
         <div style={{
@@ -563,8 +575,10 @@ const PlannerView: React.FC<Partial<PlannerViewProps>> = ({ refreshTrigger }) =>
                                 value={autoLogTime}
                                 onChange={(e) => setAutoLogTime(e.target.value)}
                                 onBlur={handleSaveSettings}
+                                title="Clear to disable auto-log"
                                 style={{ background: 'transparent', border: 'none', color: 'white', fontFamily: 'inherit', fontSize: '0.9em', cursor: 'pointer' }}
                             />
+                            {!autoLogTime && <span style={{ fontSize: '0.8em', color: 'var(--text-secondary)' }}>Disabled</span>}
                         </div>
 
                     </div>
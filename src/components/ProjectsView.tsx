@@ -16,8 +16,11 @@ interface Journal {
     user: string;
     created_on: string;
     notes: string;
+    notes_html?: string;
 }
 
+const JOURNAL_PAGE_SIZE = 20;
+
 interface CustomField {
     id: number;
     name: string;
@@ -28,6 +31,7 @@ interface IssueDetail {
     id: number;
     subject: string;
     description: string;
+    description_html?: string;
     status: string;
     priority: string;
     author: string;
@@ -40,7 +44,6 @@ interface IssueDetail {
     fixed_version: string; // Target version
     category: string; // Component
     project: { id: number; name: string };
-    journals: Journal[];
     url: string;
     custom_fields: CustomField[];
 }
@@ -52,6 +55,9 @@ const ProjectsView = () => {
     const [loading, setLoading] = useState(false);
     const [loadingProfiles, setLoadingProfiles] = useState(true);
     const [error, setError] = useState('');
+    const [journals, setJournals] = useState<Journal[]>([]);
+    const [journalTotal, setJournalTotal] = useState(0);
+    const [journalsLoading, setJournalsLoading] = useState(false);
 
     // My Issues Mode State
     const [viewMode, setViewMode] = useState<'profiles' | 'my-issues'>('profiles');
@@ -90,6 +96,10 @@ const ProjectsView = () => {
         setShowDetailModal(true);
     };
 
+    // Issues from additional Redmine instances are listed but can't be opened or saved
+    const isPrimaryIssue = (i: any) => !i.instance || i.instance === 'default';
+    const issueKey = (i: any) => `${i.instance || 'default'}:${i.id}`;
+
     // Save Profile Modal State
     const [showSaveModal, setShowSaveModal] = useState(false);
     const [issueToSave, setIssueToSave] = useState<any>(null);
@@ -244,6 +254,8 @@ const ProjectsView = () => {
         setSelectedProfileName(profileName);
         setIssue(null);
         setError('');
+        setJournals([]);
+        setJournalTotal(0);
 
         const profile = profiles.find(p => p.name === profileName);
         if (!profile) return;
@@ -252,6 +264,7 @@ const ProjectsView = () => {
 
         if (issueId) {
             setLoading(true);
+            fetchJournals(issueId, 0);
             try {
                 const res = await fetch(`http://127.0.0.1:8000/api/redmine/issue/${issueId}`);
                 const data = await res.json();
@@ -271,6 +284,22 @@ const ProjectsView = () => {
         }
     };
 
+    const fetchJournals = async (issueId: number, offset: number) => {
+        setJournalsLoading(true);
+        try {
+            const res = await fetch(`http://127.0.0.1:8000/api/redmine/issue/${issueId}/journals?offset=${offset}&limit=${JOURNAL_PAGE_SIZE}`);
+            const data = await res.json();
+            if (!data.error) {
+                setJournals(prev => offset === 0 ? data.journals : [...prev, ...data.journals]);
+                setJournalTotal(data.total);
+            }
+        } catch (err) {
+            console.error(err);
+        } finally {
+            setJournalsLoading(false);
+        }
+    };
+
     const getCustomField = (name: string) => {
         if (!issue || !issue.custom_fields) return null;
         const field = issue.custom_fields.find(f => f.name === name);
@@ -387,7 +416,7 @@ const ProjectsView = () => {
                                                 marginBottom: '40px'
                                             }}>
                                                 {filteredIssues.filter(i => i && i.id && !hiddenIssueIds.includes(i.id)).map(i => (
-                                                    <div key={i.id} style={{
+                                                    <div key={issueKey(i)} style={{
                                                         padding: '15px 20px',
                                                         background: 'rgba(255,255,255,0.03)',
                                                         borderRadius: '10px',
@@ -399,12 +428,12 @@ const ProjectsView = () => {
                                                     }}>
                                                         <div style={{ flex: 1, marginRight: '15px', overflow: 'hidden' }}>
                                                             <div style={{ fontSize: '0.8em', color: 'var(--primary)', marginBottom: '4px', opacity: 0.8 }}>
-                                                                #{i.id}
+                                                                #{i.id}{!isPrimaryIssue(i) && ` • ${i.instance}`}
                                                             </div>
                                                             <div
                                                                 style={{ fontWeight: 500, fontSize: '1.05em', whiteSpace: 'nowrap', overflow: 'hidden', textOverflow: 'ellipsis', cursor: 'pointer' }}
                                                                 title={i.subject || ''}
-                                                                onClick={() => handleIssueClick(i.id)}
+                                                                onClick={() => isPrimaryIssue(i) && handleIssueClick(i.id)}
                                                                 onMouseOver={(e) => e.currentTarget.style.textDecoration = 'underline'}
                                                                 onMouseOut={(e) => e.currentTarget.style.textDecoration = 'none'}
                                                             >
@@ -412,7 +441,7 @@ const ProjectsView = () => {
                                                             </div>
                                                         </div>
                                                         <div style={{ display: 'flex', gap: '8px' }}>
-                                                            <button
+                                                            {isPrimaryIssue(i) && <button
                                                                 onClick={() => handleSaveProfileClick(i)}
                                                                 title="Save to Profiles"
                                                                 style={{
@@ -430,7 +459,7 @@ const ProjectsView = () => {
                                                                 }}
                                                             >
                                                                 🔖
-                                                            </button>
+                                                            </button>}
                                                             <button
                                                                 onClick={() => toggleHideIssue(i.id)}
                                                                 title="Hide Issue"
@@ -465,7 +494,7 @@ const ProjectsView = () => {
                                                         gap: '15px'
                                                     }}>
                                                         {filteredIssues.filter(i => i && i.id && hiddenIssueIds.includes(i.id)).map(i => (
-                                                            <div key={i.id} style={{
+                                                            <div key={issueKey(i)} style={{
                                                                 padding: '15px 20px',
                                                                 background: 'rgba(0,0,0,0.2)',
                                                                 borderRadius: '10px',
@@ -477,12 +506,12 @@ const ProjectsView = () => {
                                                             }}>
                                                                 <div style={{ flex: 1, marginRight: '15px', overflow: 'hidden' }}>
                                                                     <div style={{ fontSize: '0.8em', color: 'var(--text-secondary)', marginBottom: '4px' }}>
-                                                                        #{i.id}
+                                                                        #{i.id}{!isPrimaryIssue(i) && ` • ${i.instance}`}
                                                                     </div>
                                                                     <div
                                                                         style={{ fontWeight: 400, fontSize: '1em', color: 'var(--text-secondary)', whiteSpace: 'nowrap', overflow: 'hidden', textOverflow: 'ellipsis', cursor: 'pointer' }}
                                                                         title={i.subject || ''}
-                                                                        onClick={() => handleIssueClick(i.id)}
+                                                                        onClick={() => isPrimaryIssue(i) && handleIssueClick(i.id)}
                                                                         onMouseOver={(e) => e.currentTarget.style.textDecoration = 'underline'}
                                                                         onMouseOut={(e) => e.currentTarget.style.textDecoration = 'none'}
                                                                     >
@@ -697,31 +726,53 @@ const ProjectsView = () => {
                                         borderRadius: '8px',
                                         lineHeight: '1.6',
                                         fontSize: '1em',
-                                        whiteSpace: 'pre-wrap',
+                                        whiteSpace: issue.description_html ? 'normal' : 'pre-wrap',
                                         border: '1px solid rgba(255,255,255,0.05)'
                                     }}
+                                    dangerouslySetInnerHTML={issue.description_html ? { __html: issue.description_html } : undefined}
                                 >
-                                    {issue.description}
+                                    {issue.description_html ? undefined : issue.description}
                                 </div>
                             </div>
                         )}
 
                         {/* Journals / History */}
-                        {issue.journals && issue.journals.length > 0 && (
+                        {journals.length > 0 && (
                             <div style={{ marginBottom: '30px' }}>
                                 <h3 style={{ fontSize: '1.2em', marginBottom: '20px', color: 'var(--text-secondary)' }}>History</h3>
                                 <div style={{ display: 'flex', flexDirection: 'column', gap: '20px' }}>
-                                    {issue.journals.map((journal, idx) => (
+                                    {journals.map((journal, idx) => (
                                         <div key={idx} style={{ paddingLeft: '20px', borderLeft: '2px solid var(--glass-border)', position: 'relative' }}>
                                             <div style={{ position: 'absolute', left: '-6px', top: '0', width: '10px', height: '10px', borderRadius: '50%', background: 'var(--glass-border)' }}></div>
                                             <div style={{ fontSize: '0.9em', color: 'var(--text-secondary)', marginBottom: '8px', display: 'flex', justifyContent: 'space-between' }}>
                                                 <span style={{ color: 'var(--primary)', fontWeight: 'bold' }}>{journal.user}</span>
                                                 <span>{new Date(journal.created_on).toLocaleString()}</span>
                                             </div>
-                                            <div style={{ fontSize: '0.95em', whiteSpace: 'pre-wrap', lineHeight: '1.5', color: '#ddd' }}>{journal.notes}</div>
+                                            {journal.notes_html ? (
+                                                <div style={{ fontSize: '0.95em', lineHeight: '1.5', color: '#ddd' }} dangerouslySetInnerHTML={{ __html: journal.notes_html }} />
+                                            ) : (
+                                                <div style={{ fontSize: '0.95em', whiteSpace: 'pre-wrap', lineHeight: '1.5', color: '#ddd' }}>{journal.notes}</div>
+                                            )}
                                         </div>
                                     ))}
                                 </div>
+                                {journals.length < journalTotal && (
+                                    <button
+                                        onClick={() => fetchJournals(issue.id, journals.length)}
+                                        disabled={journalsLoading}
+                                        style={{
+                                            marginTop: '20px',
+                                            padding: '8px 16px',
+                                            background: 'rgba(255,255,255,0.05)',
+                                            color: 'var(--text-secondary)',
+                                            border: '1px solid var(--glass-border)',
+                                            borderRadius: '6px',
+                                            cursor: journalsLoading ? 'default' : 'pointer'
+                                        }}
+                                    >
+                                        {journalsLoading ? 'Loading...' : `Load more (${journalTotal - journals.length} remaining)`}
+                                    </button>
+                                )}
                             </div>
                         )}
 
@@ -28,6 +28,13 @@ interface Activity {
     name: string;
 }
 
+interface RedmineInstance {
+    name: string;
+    redmine_url: string;
+    api_key: string;
+    timeout?: number;
+}
+
 const RD_FUNCTION_TEAMS = [
     "SW_Platform_management", "SW_OS/BSP", "SW_Networking", "SW_APTC", "SW_PM", "SW_QA",
     "BIOS", "EE1", "EE2", "EE3", "ME", "Thermal", "N/A", "EE4", "SE"
@@ -50,6 +57,7 @@ const SettingsView = () => {
     const [newProfileComment, setNewProfileComment] = useState('');
 
     const [selectedProject, setSelectedProject] = useState<number | ''>('');
+    const [projectQuery, setProjectQuery] = useState('');
     const [selectedIssue, setSelectedIssue] = useState<number | ''>('');
     const [selectedActivity, setSelectedActivity] = useState<number | ''>('');
     const [selectedRdTeam, setSelectedRdTeam] = useState('N/A');
@@ -60,9 +68,12 @@ const SettingsView = () => {
 
     // New Settings State
     const [alertTime, setAlertTime] = useState('17:00');
-    const [autoLogTime, setAutoLogTime] = useState('18:00');
+    const [autoLogTime, setAutoLogTime] = useState('18:00'); // '' = auto-log disabled
+    const [autoLogTimeLoaded, setAutoLogTimeLoaded] = useState<string | null>(null); // null = never saved
     const [calendarStartTime, setCalendarStartTime] = useState('06:00');
     const [calendarEndTime, setCalendarEndTime] = useState('21:00');
+    // Additional Redmine servers queried alongside the primary one
+    const [instances, setInstances] = useState<RedmineInstance[]>([]);
 
     // UI State
     const [toasts, setToasts] = useState<{ id: string; message: string; type: 'success' | 'error' | 'info' }[]>([]);
@@ -107,10 +118,15 @@ const SettingsView = () => {
     useEffect(() => {
         fetchSettings();
         fetchProfiles();
-        fetchProjects();
         fetchActivities();
     }, []);
 
+    // Search projects server-side as the user types (debounced)
+    useEffect(() => {
+        const timer = setTimeout(() => fetchProjects(projectQuery), 150);
+        return () => clearTimeout(timer);
+    }, [projectQuery]);
+
     // Fetch issues when a project is selected
     useEffect(() => {
         if (selectedProject && profileMode === 'project') {
@@ -126,13 +142,19 @@ const SettingsView = () => {
             .then(data => {
                 setApiKey(data.api_key || '');
                 setAlertTime(data.alert_time || '17:00');
-                setAutoLogTime(data.auto_log_time || '18:00');
+                setAutoLogTime(data.auto_log_time ?? '18:00');
+                setAutoLogTimeLoaded(data.auto_log_time ?? null);
                 setCalendarStartTime(data.calendar_start_time || '06:00');
                 setCalendarEndTime(data.calendar_end_time || '21:00');
+                setInstances(Array.isArray(data.instances) ? data.instances : []);
             })
             .catch(console.error);
     };
 
+    const updateInstance = (index: number, changes: Partial<RedmineInstance>) => {
+        setInstances(instances.map((instance, i) => i === index ? { ...instance, ...changes } : instance));
+    };
+
     const fetchProfiles = () => {
         fetch('http://127.0.0.1:8000/api/profiles')
             .then(res => res.json())
@@ -140,10 +162,17 @@ const SettingsView = () => {
             .catch(console.error);
     };
 
-    const fetchProjects = () => {
-        fetch('http://127.0.0.1:8000/api/redmine/projects')
+    const fetchProjects = (query: string = '') => {
+        fetch(`http://127.0.0.1:8000/api/redmine/projects/search?q=${encodeURIComponent(query)}&limit=50`)
             .then(res => res.json())
-            .then(data => Array.isArray(data) ? setProjects(data) : setProjects([]))
+            .then(data => {
+                const results: Project[] = Array.isArray(data) ? data : [];
+                // Keep the current selection available even if it no longer matches the query
+                setProjects(prev => [
+                    ...prev.filter(p => p.id === selectedProject && !results.some(r => r.id === p.id)),
+                    ...results
+                ]);
+            })
             .catch(console.error);
     };
 
@@ -188,14 +217,24 @@ const SettingsView = () => {
                 api_key: apiKey,
                 redmine_url: 'http://advrm.advantech.com:3002/', // Assuming default or fetched
                 alert_time: alertTime,
-                auto_log_time: autoLogTime,
+                // Left out while untouched and never saved, so the 18:00 default isn't persisted
+                auto_log_time: autoLogTimeLoaded === null && autoLogTime === '18:00' ? null : autoLogTime,
                 calendar_start_time: calendarStartTime,
-                calendar_end_time: calendarEndTime
+                calendar_end_time: calendarEndTime,
+                instances: instances
             })
         })
             .then(res => res.json())
             .then(data => {
+                if (data.error) {
+                    setStatus('');
+                    addToast(data.error, 'error');
+                    return;
+                }
                 setStatus(data.message);
+                if (autoLogTimeLoaded !== null || autoLogTime !== '18:00') {
+                    setAutoLogTimeLoaded(autoLogTime);
+                }
                 addToast("Settings saved", 'success');
             })
             .catch(() => {
@@ -487,6 +526,45 @@ const SettingsView = () => {
                                     style={inputStyle}
                                 />
                             </div>
+                            <div style={{ marginBottom: '20px' }}>
+                                <label style={labelStyle}>Additional Redmine Instances</label>
+                                {instances.map((instance, index) => (
+                                    <div key={index} style={{ display: 'grid', gridTemplateColumns: '1fr 2fr 2fr auto', gap: '10px', marginBottom: '10px' }}>
+                                        <input
+                                            value={instance.name}
+                                            onChange={(e) => updateInstance(index, { name: e.target.value })}
+                                            placeholder="Name"
+                                            style={inputStyle}
+                                        />
+                                        <input
+                                            value={instance.redmine_url}
+                                            onChange={(e) => updateInstance(index, { redmine_url: e.target.value })}
+                                            placeholder="https://redmine.example.com"
+                                            style={inputStyle}
+                                        />
+                                        <input
+                                            type="password"
+                                            value={instance.api_key}
+                                            onChange={(e) => updateInstance(index, { api_key: e.target.value })}
+                                            placeholder="API Key"
+                                            style={inputStyle}
+                                        />
+                                        <button
+                                            onClick={() => setInstances(instances.filter((_, i) => i !== index))}
+                                            title="Remove Instance"
+                                            style={{ ...buttonStyle, background: 'rgba(239, 68, 68, 0.2)', color: '#f87171' }}
+                                        >
+                                            ✕
+                                        </button>
+                                    </div>
+                                ))}
+                                <button
+                                    onClick={() => setInstances([...instances, { name: '', redmine_url: '', api_key: '', timeout: 5 }])}
+                                    style={{ ...buttonStyle, background: 'rgba(255,255,255,0.08)', color: '#d1d5db' }}
+                                >
+                                    + Add Instance
+                                </button>
+                            </div>
                             <div style={{ display: 'grid', gridTemplateColumns: '1fr 1fr', gap: '20px', marginBottom: '20px' }}>
                                 <div>
                                     <label style={labelStyle}>Calendar Start Time</label>
@@ -507,6 +585,27 @@ const SettingsView = () => {
                                     />
                                 </div>
                             </div>
+                            <div style={{ marginBottom: '20px' }}>
+                                <label style={labelStyle}>Auto-Log Time</label>
+                                <div style={{ display: 'flex', alignItems: 'center', gap: '15px' }}>
+                                    <input
+                                        type="time"
+                                        value={autoLogTime}
+                                        onChange={(e) => setAutoLogTime(e.target.value)}
+                                        style={inputStyle}
+                                    />
+                                    {autoLogTime ? (
+                                        <button
+                                            onClick={() => setAutoLogTime('')}
+                                            style={{ ...buttonStyle, background: 'rgba(255,255,255,0.08)', color: '#d1d5db', whiteSpace: 'nowrap' }}
+                                        >
+                                            Disable
+                                        </button>
+                                    ) : (
+                                        <span style={{ color: '#aaa', whiteSpace: 'nowrap' }}>Disabled</span>
+                                    )}
+                                </div>
+                            </div>
                             <div style={{ display: 'flex', alignItems: 'center', gap: '15px' }}>
                                 <button
                                     onClick={saveSettings}
@@ -569,6 +668,13 @@ const SettingsView = () => {
                                 <div style={{ display: 'grid', gridTemplateColumns: '1fr 1fr', gap: '20px', marginBottom: '20px' }}>
                                     <div>
                                         <label style={labelStyle}>Project</label>
+                                        <input
+                                            type="text"
+                                            placeholder="Search projects..."
+                                            value={projectQuery}
+                                            onChange={e => setProjectQuery(e.target.value)}
+                                            style={{ ...inputStyle, marginBottom: '8px' }}
+                                        />
                                         <select
                                             value={selectedProject}
                                             onChange={e => setSelectedProject(Number(e.target.value))}
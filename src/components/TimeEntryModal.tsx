@@ -21,7 +21,6 @@ const TimeEntryModal: React.FC<TimeEntryModalProps> = ({ isOpen, onClose, onSave
     const [startTime, setStartTime] = useState('09:00'); // Default start time
     const [selectedProfile, setSelectedProfile] = useState('');
 
-    const [projects, setProjects] = useState<any[]>([]);
     const [, setActivities] = useState<any>({});
     const [profiles, setProfiles] = useState<any[]>([]);
 
@@ -65,13 +64,6 @@ const TimeEntryModal: React.FC<TimeEntryModalProps> = ({ isOpen, onClose, onSave
         setConfirmModal(prev => ({ ...prev, isOpen: false }));
     };
 
-    const fetchProjects = () => {
-        fetch('http://127.0.0.1:8000/api/redmine/projects')
-            .then(res => res.json())
-            .then(data => Array.isArray(data) ? setProjects(data) : setProjects([]))
-            .catch(console.error);
-    };
-
     const fetchActivities = () => {
         fetch('http://127.0.0.1:8000/api/redmine/activities')
             .then(res => res.json())
@@ -113,7 +105,6 @@ const TimeEntryModal: React.FC<TimeEntryModalProps> = ({ isOpen, onClose, onSave
 
     useEffect(() => {
         if (isOpen) {
-            fetchProjects();
             fetchActivities();
             fetchProfiles();
 
@@ -302,7 +293,7 @@ const TimeEntryModal: React.FC<TimeEntryModalProps> = ({ isOpen, onClose, onSave
 
                 {projectId ? (
                     <div style={{ marginBottom: '15px', padding: '10px', background: 'rgba(59, 130, 246, 0.05)', borderRadius: '4px', border: '1px solid rgba(59, 130, 246, 0.2)' }}>
-                        <div style={{ fontSize: '0.85em', color: '#888', marginBottom: '2px' }}>Project: <span style={{ color: '#ccc' }}>{projects.find(p => p.id === projectId)?.name || projectId}</span></div>
+                        <div style={{ fontSize: '0.85em', color: '#888', marginBottom: '2px' }}>Project: <span style={{ color: '#ccc' }}>{profiles.find(p => Number(p.project_id) === projectId)?.project_name || existingEntry?.extendedProps?.projectName || projectId}</span></div>
                         {issueId && (
                             <div style={{ fontSize: '0.85em', color: '#888' }}>Issue ID: <span style={{ color: '#ccc' }}>{issueId}</span></div>
                         )}
@@ -1,6 +1,21 @@
-import React from 'react';
+import React, { useState, useEffect } from 'react';
 
 const TitleBar = () => {
+    const [offline, setOffline] = useState(false);
+
+    useEffect(() => {
+        // Poll backend circuit breaker state so views can show "offline" instead of spinners
+        const checkStatus = () => {
+            fetch('http://127.0.0.1:8000/api/redmine/status')
+                .then(res => res.json())
+                .then(data => setOffline(data.state === 'open' || data.state === 'half_open'))
+                .catch(() => setOffline(false));
+        };
+        checkStatus();
+        const interval = setInterval(checkStatus, 15000);
+        return () => clearInterval(interval);
+    }, []);
+
     const handleMinimize = () => {
         if (window.require) {
             const { ipcRenderer } = window.require('electron');
@@ -30,6 +45,14 @@ const TitleBar = () => {
         } as React.CSSProperties}>
             <div style={{ paddingLeft: '15px', fontSize: '12px', color: 'var(--text-secondary)', fontWeight: 600 }}>
                 Redmine Tracker
+                {offline && (
+                    <span
+                        title="Redmine is unreachable. Showing cached data."
+                        style={{ marginLeft: '10px', padding: '1px 8px', borderRadius: '8px', background: 'rgba(239, 68, 68, 0.2)', color: '#ef4444', fontSize: '11px' }}
+                    >
+                        Offline
+                    </span>
+                )}
             </div>
             <div style={{ display: 'flex', height: '100%', WebkitAppRegion: 'no-drag' } as any}>
                 {/* Minimize Button */}
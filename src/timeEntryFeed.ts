@@ -0,0 +1,36 @@
+// Client-side copy of the backend's cached time entries, kept current with
+// /api/redmine/time_entries/changes so views only download what changed.
+
+const API = 'http://127.0.0.1:8000/api/redmine/time_entries';
+
+let entries = new Map<number, any>();
+let seq: number | null = null;
+
+// Returns every cached entry, or null when the backend has no synced cache or
+// queries several Redmine instances (callers then fall back to a date range
+// fetch, which the backend merges across instances).
+export const syncTimeEntries = async (): Promise<any[] | null> => {
+    const res = await fetch(`${API}/changes${seq !== null ? `?since=${seq}` : ''}`);
+    const data = await res.json();
+    if (data.error || !data.cached || data.federated) {
+        return null;
+    }
+
+    if (data.reset) {
+        entries = new Map();
+    }
+    data.upserted.forEach((entry: any) => entries.set(entry.id, entry));
+    data.deleted.forEach((id: number) => entries.delete(id));
+    seq = data.seq;
+    return Array.from(entries.values());
+};
+
+export const fetchTimeEntriesInRange = async (fromDate: string, toDate: string): Promise<any[] | null> => {
+    const all = await syncTimeEntries();
+    if (all) {
+        return all.filter(e => String(e.spent_on) >= fromDate && String(e.spent_on) <= toDate);
+    }
+    const res = await fetch(`${API}?from_date=${fromDate}&to_date=${toDate}`);
+    const data = await res.json();
+    return Array.isArray(data) ? data : null;
+};